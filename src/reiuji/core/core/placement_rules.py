@@ -3,7 +3,6 @@
 import enum
 import itertools
 import typing
-import uuid
 from abc import ABC, abstractmethod
 
 import pydantic
@@ -203,17 +202,16 @@ class AdjacencyPlacementRule(BasePlacementRule, reg_key="core.adjacent"):
             if name == self.req_name
             and (isinstance(self.req_type, type(None)) or type_ == self.req_type)
         ]
-        matches = [model.new_bool_var(str(uuid.uuid4())) for _ in neighbors]
-        for neighbor, match in zip(neighbors, matches):
-            id_match = model.new_bool_var(str(uuid.uuid4()))
-            model.add_allowed_assignments(
-                (neighbor.id,), [(i,) for i in allowed_ids]
-            ).only_enforce_if(id_match)
-            model.add_forbidden_assignments(
-                (neighbor.id,), [(i,) for i in allowed_ids]
-            ).only_enforce_if(~id_match)
-            model.add_bool_and([id_match, neighbor.active]).only_enforce_if(match)
-            model.add_bool_or([~id_match, ~neighbor.active]).only_enforce_if(~match)
+        matches = [
+            utils.cp_utils.all_of(
+                model,
+                [
+                    utils.cp_utils.in_values(model, neighbor.id, allowed_ids),
+                    neighbor.active,
+                ],
+            )
+            for neighbor in neighbors
+        ]
 
         if self.adjacency_type == AdjacencyType.STANDARD:
             if self.count_type == CountType.AT_LEAST:
@@ -227,7 +225,7 @@ class AdjacencyPlacementRule(BasePlacementRule, reg_key="core.adjacent"):
                 model.add(sum(matches) > self.amount).only_enforce_if(~target)
         elif self.adjacency_type == AdjacencyType.AXIAL:
             axials = [
-                model.new_bool_var(str(uuid.uuid4()))
+                model.new_bool_var(utils.cp_utils.var_name(model))
                 for _ in range(len(neighbors) // 2)
             ]
             for axial, (pos, neg) in zip(axials, itertools.batched(matches, 2)):
@@ -244,7 +242,9 @@ class AdjacencyPlacementRule(BasePlacementRule, reg_key="core.adjacent"):
                 model.add(sum(axials) > self.amount // 2).only_enforce_if(~target)
         elif self.adjacency_type == AdjacencyType.VERTEX:
             if len(neighbors) == 6:
-                vertices = [model.new_bool_var(str(uuid.uuid4())) for _ in range(8)]
+                vertices = [
+                    model.new_bool_var(utils.cp_utils.var_name(model)) for _ in range(8)
+                ]
                 for vertex, (a, b, c) in zip(
                     vertices,
                     [
@@ -267,13 +267,13 @@ class AdjacencyPlacementRule(BasePlacementRule, reg_key="core.adjacent"):
             else:
                 raise ValueError("Vertex placement rules require exactly 3 dimensions.")
 
-            vertex_exists = model.new_bool_var(str(uuid.uuid4()))
+            vertex_exists = model.new_bool_var(utils.cp_utils.var_name(model))
             model.add_bool_and(vertices).only_enforce_if(vertex_exists)
             model.add_bool_or([~vertex for vertex in vertices]).only_enforce_if(
                 ~vertex_exists
             )
 
-            amount_satisfied = model.new_bool_var(str(uuid.uuid4()))
+            amount_satisfied = model.new_bool_var(utils.cp_utils.var_name(model))
             if self.count_type == CountType.AT_LEAST:
                 model.add(sum(matches) >= self.amount).only_enforce_if(amount_satisfied)
                 model.add(sum(matches) < self.amount).only_enforce_if(~amount_satisfied)
@@ -294,12 +294,17 @@ class AdjacencyPlacementRule(BasePlacementRule, reg_key="core.adjacent"):
             )
         elif self.adjacency_type == AdjacencyType.EDGE:
             if len(neighbors) == 4:
-                edges = [model.new_bool_var(str(uuid.uuid4())) for _ in range(4)]
+                edges = [
+                    model.new_bool_var(utils.cp_utils.var_name(model)) for _ in range(4)
+                ]
                 for edge, (a, b) in zip(edges, [(0, 2), (0, 3), (1, 2), (1, 3)]):
                     model.add_bool_and([matches[a], matches[b]]).only_enforce_if(edge)
                     model.add_bool_or([~matches[a], ~matches[b]]).only_enforce_if(~edge)
             elif len(neighbors) == 6:
-                edges = [model.new_bool_var(str(uuid.uuid4())) for _ in range(12)]
+                edges = [
+                    model.new_bool_var(utils.cp_utils.var_name(model))
+                    for _ in range(12)
+                ]
                 for edge, (a, b) in zip(
                     edges,
                     [
@@ -324,11 +329,11 @@ class AdjacencyPlacementRule(BasePlacementRule, reg_key="core.adjacent"):
                     "Edge placement rules require either 2 or 3 dimensions."
                 )
 
-            edge_exists = model.new_bool_var(str(uuid.uuid4()))
+            edge_exists = model.new_bool_var(utils.cp_utils.var_name(model))
             model.add_bool_and(edges).only_enforce_if(edge_exists)
             model.add_bool_or([~edge for edge in edges]).only_enforce_if(~edge_exists)
 
-            amount_satisfied = model.new_bool_var(str(uuid.uuid4()))
+            amount_satisfied = model.new_bool_var(utils.cp_utils.var_name(model))
             if self.count_type == CountType.AT_LEAST:
                 model.add(sum(matches) >= self.amount).only_enforce_if(amount_satisfied)
                 model.add(sum(matches) < self.amount).only_enforce_if(~amount_satisfied)
@@ -368,7 +373,9 @@ class CompoundPlacementRule(BasePlacementRule, reg_key="core.compound"):
         mapping: list[tuple[str, str]],
         target: cp_model.IntVar,
     ) -> None:
-        subtargets = [model.new_bool_var(str(uuid.uuid4())) for _ in self.subrules]
+        subtargets = [
+            model.new_bool_var(utils.cp_utils.var_name(model)) for _ in self.subrules
+        ]
         for subrule, subtarget in zip(self.subrules, subtargets):
             subrule.to_cp_model(model, neighbors, mapping, subtarget)
         if self.logic_type == LogicType.AND:
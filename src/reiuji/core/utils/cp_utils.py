@@ -1,10 +1,12 @@
 """Utilities related to OR-Tools CP-SAT."""
 
+import contextlib
+import functools
+import math
 import typing
-import uuid
 from abc import ABC, abstractmethod
 
-from ortools.sat.python import cp_model
+from ortools.sat.python import cp_model, cp_model_helper
 
 # Domain utilities
 
@@ -29,6 +31,751 @@ def nonzero_domain() -> cp_model.Domain:
     return cp_model.Domain.from_values([0]).complement()
 
 
+# Model building
+
+type Naming = typing.Literal["counter", "hierarchical", "none"]
+
+
+class ModelBuilder(cp_model.CpModel):
+    """A CP-SAT model with cheap deterministic variable names and shared subexpressions.
+
+    Variables created without a name are named after their index in the model, so that
+    building the same model twice yields the same proto. The naming mode can be:
+
+    - "counter": names such as `v_12` or `raw_prod_12`.
+    - "hierarchical": the counter name prefixed with the enclosing scopes, such as
+      `Designer/Constraint/v_12`. Useful when inspecting models.
+    - "none": variables are left unnamed, which keeps the proto small.
+
+    Element lookups built through `element` are memoized, so that the same lookup of
+    the same cell in the same table is only encoded once per model.
+    """
+
+    def __init__(self, naming: Naming = "counter") -> None:
+        """
+        Args:
+            naming (Naming, optional): The naming mode. Defaults to "counter".
+        """
+        super().__init__()
+        if naming not in ("counter", "hierarchical", "none"):
+            raise ValueError(f"Unknown naming mode {naming!r}.")
+        self.naming = naming
+        self._scopes: list[str] = []
+        self._elements: dict[tuple[int, tuple[int, ...]], cp_model.IntVar] = {}
+
+    def var_name(self, hint: str = "") -> str:
+        """Returns the name of the next variable of the model.
+
+        Args:
+            hint (str, optional): A short description of the variable. Defaults to "".
+        """
+        if self.naming == "none":
+            return ""
+        name = f"{hint or 'v'}_{len(self.proto.variables)}"
+        if self.naming == "hierarchical" and len(self._scopes) > 0:
+            return "/".join([*self._scopes, name])
+        return name
+
+    @contextlib.contextmanager
+    def scope(self, name: str) -> typing.Iterator[None]:
+        """Names the variables created inside the context under the given scope.
+
+        Scopes only affect the "hierarchical" naming mode.
+
+        Args:
+            name (str): The name of the scope.
+        """
+        self._scopes.append(name)
+        try:
+            yield
+        finally:
+            self._scopes.pop()
+
+    def _name(self, name: str | None) -> str:
+        if self.naming == "none":
+            return ""
+        return name if name is not None else self.var_name()
+
+    def new_int_var(self, lb: int, ub: int, name: str | None = None) -> cp_model.IntVar:
+        return super().new_int_var(lb, ub, self._name(name))
+
+    def new_int_var_from_domain(
+        self, domain: cp_model.Domain, name: str | None = None
+    ) -> cp_model.IntVar:
+        return super().new_int_var_from_domain(domain, self._name(name))
+
+    def new_bool_var(self, name: str | None = None) -> cp_model.IntVar:
+        return super().new_bool_var(self._name(name))
+
+    NewIntVar = new_int_var
+    NewIntVarFromDomain = new_int_var_from_domain
+    NewBoolVar = new_bool_var
+
+    def element(
+        self, index: cp_model.IntVar | int, values: typing.Sequence[int]
+    ) -> cp_model.IntVar:
+        """Returns a variable equal to `values[index]`, encoding each lookup only once.
+
+        Args:
+            index (cp_model.IntVar | int): The index variable or constant.
+            values (typing.Sequence[int]): The table of values.
+        """
+        if isinstance(index, int):
+            return _element(self, index, values)
+        key = (index.index, tuple(values))
+        if key not in self._elements:
+            self._elements[key] = _element(self, index, values)
+        return self._elements[key]
+
+
+def var_name(model: cp_model.CpModel, hint: str = "") -> str:
+    """Returns a deterministic name for the next variable of a model.
+
+    Args:
+        model (cp_model.CpModel): The constraint programming model.
+        hint (str, optional): A short description of the variable. Defaults to "".
+    """
+    if isinstance(model, ModelBuilder):
+        return model.var_name(hint)
+    return f"{hint or 'v'}_{len(model.proto.variables)}"
+
+
+def scope(
+    model: cp_model.CpModel, name: str
+) -> contextlib.AbstractContextManager[None]:
+    """Names the variables created inside the context under the given scope.
+
+    Does nothing unless the model is a `ModelBuilder` in "hierarchical" naming mode.
+
+    Args:
+        model (cp_model.CpModel): The constraint programming model.
+        name (str): The name of the scope.
+    """
+    if isinstance(model, ModelBuilder) and model.naming == "hierarchical":
+        return model.scope(name)
+    return contextlib.nullcontext()
+
+
+def scoped[F: typing.Callable[..., typing.Any]](method: F) -> F:
+    """Decorates a `(self, model, ...)` method so that the variables it creates are
+    scoped under the name of the class of `self`."""
+
+    @functools.wraps(method)
+    def wrapper(
+        self: typing.Any,
+        model: cp_model.CpModel,
+        *args: typing.Any,
+        **kwargs: typing.Any,
+    ) -> typing.Any:
+        with scope(model, type(self).__name__):
+            return method(self, model, *args, **kwargs)
+
+    return typing.cast(F, wrapper)
+
+
+def element(
+    model: cp_model.CpModel,
+    index: cp_model.IntVar | int,
+    values: typing.Sequence[int],
+) -> cp_model.IntVar:
+    """Returns a variable equal to `values[index]`.
+
+    The variable is restricted to the values reachable from the domain of the index.
+    Lookups are memoized if the model is a `ModelBuilder`.
+
+    Args:
+        model (cp_model.CpModel): The constraint programming model.
+        index (cp_model.IntVar | int): The index variable or constant.
+        values (typing.Sequence[int]): The table of values.
+    """
+    if isinstance(model, ModelBuilder):
+        return model.element(index, values)
+    return _element(model, index, values)
+
+
+def _element(
+    model: cp_model.CpModel,
+    index: cp_model.IntVar | int,
+    values: typing.Sequence[int],
+) -> cp_model.IntVar:
+    if isinstance(index, int):
+        return model.new_constant(values[index])
+    bounds = list(index.proto.domain)
+    reachable = set()
+    for lo, hi in zip(bounds[::2], bounds[1::2]):
+        reachable.update(values[max(lo, 0) : min(hi, len(values) - 1) + 1])
+    if len(reachable) == 0:
+        raise ValueError("The index cannot take any position in the table.")
+    if len(reachable) == 1:
+        if bounds[0] < 0 or bounds[-1] >= len(values):
+            model.add_linear_constraint(index, 0, len(values) - 1)
+        return model.new_constant(next(iter(reachable)))
+    target = model.new_int_var_from_domain(
+        cp_model.Domain.from_values(sorted(reachable)), var_name(model, "element")
+    )
+    model.add_element(index, values, target)
+    return target
+
+
+# Shared literals
+
+
+def _constant_value(literal: cp_model.IntVar) -> int | None:
+    if not isinstance(literal, cp_model.IntVar):
+        return None
+    bounds = list(literal.proto.domain)
+    return bounds[0] if len(bounds) == 2 and bounds[0] == bounds[1] else None
+
+
+class SharedLiterals:
+    """The literals of a model that are shared by every caller.
+
+    Each literal is created once per model and condition. The layer of a model is kept
+    on the model itself, so that `in_values`, `all_of` and any layer extending this
+    class, such as the one-hot layer of the designers, draw from a single cache.
+    """
+
+    _attribute = "_shared_literals"
+
+    def __init__(self, model: cp_model.CpModel) -> None:
+        self.model = model
+        self._in: dict[tuple[int, tuple[int, ...]], cp_model.IntVar] = {}
+        self._all: dict[tuple[int, ...], cp_model.IntVar] = {}
+
+    @classmethod
+    def get(cls, model: cp_model.CpModel) -> "SharedLiterals | None":
+        """Returns the layer of a model, or None if it has none yet.
+
+        Args:
+            model (cp_model.CpModel): The constraint programming model.
+        """
+        return getattr(model, cls._attribute, None)
+
+    @classmethod
+    def of(cls, model: cp_model.CpModel) -> "SharedLiterals":
+        """Returns the layer of a model, creating it if needed.
+
+        Args:
+            model (cp_model.CpModel): The constraint programming model.
+        """
+        layer = cls.get(model)
+        if layer is None:
+            layer = SharedLiterals(model)
+            layer.attach()
+        return layer
+
+    def attach(self, previous: "SharedLiterals | None" = None) -> None:
+        """Makes this the layer of its model, taking over the literals of the previous
+        layer.
+
+        Args:
+            previous (SharedLiterals | None, optional): The previous layer of the model.
+                Defaults to None.
+        """
+        if previous is not None:
+            self._in = previous._in
+            self._all = previous._all
+        setattr(self.model, self._attribute, self)
+
+    def in_values(
+        self, var: cp_model.IntVar, values: typing.Iterable[int]
+    ) -> cp_model.IntVar:
+        """Returns a literal that is true if and only if a variable takes one of the
+        values.
+
+        The literal is a constant if the domain of the variable decides it.
+
+        Args:
+            var (cp_model.IntVar): The variable.
+            values (typing.Iterable[int]): The values.
+        """
+        values = tuple(sorted(set(values)))
+        key = (var.index, values)
+        if key not in self._in:
+            model = self.model
+            domain = cp_model.Domain.from_flat_intervals(list(var.proto.domain))
+            inside = domain.intersection_with(cp_model.Domain.from_values(values))
+            outside = domain.intersection_with(
+                cp_model.Domain.from_values(values).complement()
+            )
+            if inside.is_empty():
+                self._in[key] = model.new_constant(0)
+            elif outside.is_empty():
+                self._in[key] = model.new_constant(1)
+            else:
+                literal = model.new_bool_var(var_name(model, "in"))
+                model.add_linear_expression_in_domain(var, inside).only_enforce_if(
+                    literal
+                )
+                model.add_linear_expression_in_domain(var, outside).only_enforce_if(
+                    ~literal
+                )
+                self._in[key] = literal
+        return self._in[key]
+
+    def all_of(self, literals: typing.Iterable[cp_model.IntVar]) -> cp_model.IntVar:
+        """Returns a literal that is true if and only if all of the literals are true.
+
+        Constant literals are folded.
+
+        Args:
+            literals (typing.Iterable[cp_model.IntVar]): The literals.
+        """
+        model = self.model
+        remaining = {}
+        for literal in literals:
+            value = _constant_value(literal)
+            if value == 0:
+                return model.new_constant(0)
+            if value is None:
+                remaining[literal.index] = literal
+        if len(remaining) == 0:
+            return model.new_constant(1)
+        if len(remaining) == 1:
+            return next(iter(remaining.values()))
+        key = tuple(sorted(remaining))
+        if key not in self._all:
+            conjunction = model.new_bool_var(var_name(model, "all"))
+            model.add_bool_and(list(remaining.values())).only_enforce_if(conjunction)
+            model.add_bool_or(
+                [~literal for literal in remaining.values()]
+            ).only_enforce_if(~conjunction)
+            self._all[key] = conjunction
+        return self._all[key]
+
+
+def in_values(
+    model: cp_model.CpModel, var: cp_model.IntVar, values: typing.Iterable[int]
+) -> cp_model.IntVar:
+    """Returns a literal that is true if and only if a variable takes one of the values.
+
+    The literal is created once per model, variable and set of values, and is shared by
+    every caller. It is a constant if the domain of the variable decides it.
+
+    Args:
+        model (cp_model.CpModel): The constraint programming model.
+        var (cp_model.IntVar): The variable.
+        values (typing.Iterable[int]): The values.
+    """
+    return SharedLiterals.of(model).in_values(var, values)
+
+
+def all_of(
+    model: cp_model.CpModel, literals: typing.Iterable[cp_model.IntVar]
+) -> cp_model.IntVar:
+    """Returns a literal that is true if and only if all of the literals are true.
+
+    The literal is created once per model and set of literals, and is shared by every
+    caller. Constant literals are folded.
+
+    Args:
+        model (cp_model.CpModel): The constraint programming model.
+        literals (typing.Iterable[cp_model.IntVar]): The literals.
+    """
+    return SharedLiterals.of(model).all_of(literals)
+
+
+# Domain inference
+
+INT64_MIN = -(2**63)
+INT64_MAX = 2**63 - 1
+
+
+def expr_bounds(expr: cp_model.LinearExprT) -> tuple[int, int]:
+    """Returns the smallest and largest values an integer expression can take.
+
+    Args:
+        expr (cp_model.LinearExprT): An integer, integer variable or linear expression.
+    """
+    if isinstance(expr, int):
+        return expr, expr
+    if isinstance(expr, cp_model.IntVar):
+        return expr.proto.domain[0], expr.proto.domain[-1]
+    flat = cp_model_helper.FlatIntExpr(expr)
+    lo = hi = flat.offset
+    for var, coeff in zip(flat.vars, flat.coeffs):
+        a, b = coeff * var.proto.domain[0], coeff * var.proto.domain[-1]
+        lo, hi = lo + min(a, b), hi + max(a, b)
+    return lo, hi
+
+
+def product_bounds(a: tuple[int, int], b: tuple[int, int]) -> tuple[int, int]:
+    """Returns the bounds of the product of two bounded integers.
+
+    Args:
+        a (tuple[int, int]): The bounds of the first factor.
+        b (tuple[int, int]): The bounds of the second factor.
+    """
+    corners = [x * y for x in a for y in b]
+    return min(corners), max(corners)
+
+
+def _trunc_div(a: int, b: int) -> int:
+    q = abs(a) // abs(b)
+    return q if (a >= 0) == (b > 0) else -q
+
+
+def quotient_bounds(a: tuple[int, int], b: tuple[int, int]) -> tuple[int, int] | None:
+    """Returns the bounds of the quotient of two bounded integers, rounded towards zero.
+
+    Args:
+        a (tuple[int, int]): The bounds of the numerator.
+        b (tuple[int, int]): The bounds of the divisor. Zero is excluded.
+
+    Returns:
+        tuple[int, int] | None: The bounds of the quotient, or None if the divisor can only be zero.
+    """
+    corners = []
+    for lo, hi in ((b[0], min(b[1], -1)), (max(b[0], 1), b[1])):
+        if lo <= hi:
+            corners.extend(_trunc_div(x, y) for x in a for y in (lo, hi))
+    if len(corners) == 0:
+        return None
+    return min(corners), max(corners)
+
+
+def _check_overflow(lo: int, hi: int, what: str) -> None:
+    if lo < INT64_MIN or hi > INT64_MAX:
+        raise OverflowError(
+            f"{what} can take values in [{lo}, {hi}], outside of 64 bits."
+        )
+
+
+def bounded_domain(lo: int, hi: int) -> cp_model.Domain:
+    """Returns the domain `[lo, hi]`, clipped to 48-bit integers.
+
+    Args:
+        lo (int): The lower bound.
+        hi (int): The upper bound.
+    """
+    return cp_model.Domain(lo, hi).intersection_with(large_domain())
+
+
+def restrict_domain(var: cp_model.IntVar, lo: int, hi: int) -> bool:
+    """Intersects the domain of a variable with `[lo, hi]`.
+
+    The domain is left unchanged if the intersection is empty, so that the solver
+    reports the model as infeasible rather than invalid.
+
+    Args:
+        var (cp_model.IntVar): The variable.
+        lo (int): The lower bound.
+        hi (int): The upper bound.
+
+    Returns:
+        bool: Whether the domain was changed.
+    """
+    domain = cp_model.Domain.from_flat_intervals(list(var.proto.domain))
+    restricted = domain.intersection_with(cp_model.Domain(lo, hi))
+    if restricted.is_empty() or restricted.size() == domain.size():
+        return False
+    var.proto.domain[:] = restricted.flattened_intervals()
+    return True
+
+
+def tighten_domains(model: cp_model.CpModel, *, max_steps: int | None = None) -> int:
+    """Tightens variable domains by propagating bounds through the model.
+
+    Bounds are propagated in both directions through unconditional linear
+    constraints. They are propagated forward through products, divisions, maxima and
+    element constraints, from their operands to their targets. Variables declared
+    with wide default domains, such as `0..INT32_MAX`, end up with the range they can
+    actually reach. Targets of elements over constants are further restricted to the
+    constants their index can reach.
+
+    Args:
+        model (cp_model.CpModel): The constraint programming model.
+        max_steps (int | None, optional): The maximum number of constraint
+            evaluations. Defaults to 20 per constraint.
+
+    Returns:
+        int: The number of variables whose domain was tightened.
+
+    Raises:
+        OverflowError: If a product or a linear constraint can exceed 64 bits.
+    """
+    proto = model.proto
+    lo = [var.domain[0] for var in proto.variables]
+    hi = [var.domain[-1] for var in proto.variables]
+
+    def linear_expr(e: typing.Any) -> tuple[list[int], list[int], int] | None:
+        if any(ref < 0 for ref in e.vars):
+            return None
+        return list(e.vars), list(e.coeffs), e.offset
+
+    constraints: list[tuple] = []
+    for ct in proto.constraints:
+        if len(ct.enforcement_literal) > 0:
+            continue
+        kind = ct.WhichOneof("constraint")
+        if kind == "linear":
+            if any(ref < 0 for ref in ct.linear.vars):
+                continue
+            domain = ct.linear.domain
+            constraints.append(
+                (
+                    "linear",
+                    list(ct.linear.vars),
+                    list(ct.linear.coeffs),
+                    domain[0],
+                    domain[-1],
+                )
+            )
+        elif kind in ("int_prod", "int_div", "lin_max"):
+            arg = getattr(ct, kind)
+            target = linear_expr(arg.target)
+            exprs = [linear_expr(e) for e in arg.exprs]
+            if target is None or any(e is None for e in exprs):
+                continue
+            constraints.append((kind, target, exprs))
+        elif kind == "element":
+            arg = ct.element
+            if len(arg.vars) > 0:
+                # Models written before OR-Tools 9.12 refer to variables directly.
+                refs = [arg.index, arg.target, *arg.vars]
+                if any(ref < 0 for ref in refs):
+                    continue
+                index = ([arg.index], [1], 0)
+                target = ([arg.target], [1], 0)
+                exprs = [([v], [1], 0) for v in arg.vars]
+            else:
+                index = linear_expr(arg.linear_index)
+                target = linear_expr(arg.linear_target)
+                exprs = [linear_expr(e) for e in arg.exprs]
+            if index is None or target is None or any(e is None for e in exprs):
+                continue
+            constraints.append(("element", target, exprs, index))
+
+    watchers: dict[int, list[int]] = {}
+    for i, c in enumerate(constraints):
+        if c[0] == "linear":
+            inputs = c[1]
+        else:
+            inputs = [v for e in c[2] for v in e[0]]
+            if c[0] == "element":
+                inputs.extend(c[3][0])
+        for v in inputs:
+            watchers.setdefault(v, []).append(i)
+
+    def bounds(e: tuple[list[int], list[int], int]) -> tuple[int, int]:
+        vars_, coeffs, offset = e
+        low = high = offset
+        for v, c in zip(vars_, coeffs):
+            a, b = c * lo[v], c * hi[v]
+            low, high = low + min(a, b), high + max(a, b)
+        return low, high
+
+    changed: set[int] = set()
+    queue = list(range(len(constraints)))
+    queued = [True] * len(constraints)
+
+    def update(v: int, low: int, high: int) -> None:
+        low, high = max(lo[v], low), min(hi[v], high)
+        if low > high or (low == lo[v] and high == hi[v]):
+            return
+        lo[v], hi[v] = low, high
+        changed.add(v)
+        for i in watchers.get(v, []):
+            if not queued[i]:
+                queued[i] = True
+                queue.append(i)
+
+    def element_reachable(
+        exprs: list[tuple[list[int], list[int], int]],
+        index: tuple[list[int], list[int], int],
+    ) -> list[tuple[list[int], list[int], int]]:
+        low, high = bounds(index)
+        return exprs[max(low, 0) : max(min(high, len(exprs) - 1) + 1, 0)]
+
+    def update_target(e: tuple[list[int], list[int], int], low: int, high: int) -> None:
+        vars_, coeffs, offset = e
+        if len(vars_) != 1:
+            return
+        c = coeffs[0]
+        low, high = low - offset, high - offset
+        if c < 0:
+            low, high, c = -high, -low, -c
+        update(vars_[0], -(-low // c), high // c)
+
+    steps = 0
+    max_steps = max_steps if max_steps is not None else 20 * len(constraints)
+    while len(queue) > 0 and steps < max_steps:
+        i = queue.pop()
+        queued[i] = False
+        steps += 1
+        c = constraints[i]
+        if c[0] == "linear":
+            _, vars_, coeffs, low, high = c
+            terms = [(c_ * lo[v], c_ * hi[v]) for v, c_ in zip(vars_, coeffs)]
+            min_sum = sum(min(t) for t in terms)
+            max_sum = sum(max(t) for t in terms)
+            for v, c_, t in zip(vars_, coeffs, terms):
+                rest_low = low - (max_sum - max(t))
+                rest_high = high - (min_sum - min(t))
+                if c_ > 0:
+                    update(v, -(-rest_low // c_), rest_high // c_)
+                elif c_ < 0:
+                    update(v, -(rest_high // -c_), -rest_low // -c_)
+        elif c[0] == "int_prod":
+            _, target, exprs = c
+            low_high = (1, 1)
+            for e in exprs:
+                low_high = product_bounds(low_high, bounds(e))
+            update_target(target, *low_high)
+        elif c[0] == "int_div":
+            _, target, exprs = c
+            quotient = quotient_bounds(bounds(exprs[0]), bounds(exprs[1]))
+            if quotient is not None:
+                update_target(target, *quotient)
+        elif c[0] == "lin_max":
+            _, target, exprs = c
+            expr_bounds_ = [bounds(e) for e in exprs]
+            update_target(
+                target, max(b[0] for b in expr_bounds_), max(b[1] for b in expr_bounds_)
+            )
+        elif c[0] == "element":
+            _, target, exprs, index = c
+            reachable = [bounds(e) for e in element_reachable(exprs, index)]
+            if len(reachable) > 0:
+                update_target(
+                    target, min(b[0] for b in reachable), max(b[1] for b in reachable)
+                )
+
+    for c in constraints:
+        if c[0] == "linear":
+            _, vars_, coeffs, _, _ = c
+            total = sum(
+                abs(c_) * max(abs(lo[v]), abs(hi[v])) for v, c_ in zip(vars_, coeffs)
+            )
+            _check_overflow(-total, total, "A linear constraint")
+        elif c[0] == "int_prod":
+            low_high = (1, 1)
+            for e in c[2]:
+                low_high = product_bounds(low_high, bounds(e))
+            _check_overflow(*low_high, "A product")
+
+    for v in changed:
+        restrict_domain(model.get_int_var_from_proto_index(v), lo[v], hi[v])
+
+    # Targets of elements over constants can only take the values of the reachable constants.
+    for c in constraints:
+        if c[0] != "element" or len(c[1][0]) != 1:
+            continue
+        _, ([v], [coeff], offset), exprs, index = c
+        reachable = element_reachable(exprs, index)
+        if len(reachable) == 0 or any(len(e[0]) > 0 for e in reachable):
+            continue
+        values = [
+            (e[2] - offset) // coeff for e in reachable if (e[2] - offset) % coeff == 0
+        ]
+        var = model.get_int_var_from_proto_index(v)
+        domain = cp_model.Domain.from_flat_intervals(list(var.proto.domain))
+        restricted = domain.intersection_with(cp_model.Domain.from_values(values))
+        if restricted.is_empty() or restricted.size() == domain.size():
+            continue
+        var.proto.domain[:] = restricted.flattened_intervals()
+        changed.add(v)
+    return len(changed)
+
+
+# Lookup tables
+
+TABLE_SIZE = 2**14
+
+
+def expr_values(
+    expr: cp_model.LinearExprT, *, max_size: int = TABLE_SIZE
+) -> list[int] | None:
+    """Returns the values an integer, variable or linear expression can take.
+
+    The values of a linear expression over several variables are approximated by the
+    range of its bounds.
+
+    Args:
+        expr (cp_model.LinearExprT): The integer, variable or expression.
+        max_size (int, optional): The maximum number of values. Defaults to TABLE_SIZE.
+
+    Returns:
+        list[int] | None: The values in increasing order, or None if there are more
+            than `max_size`.
+    """
+    if isinstance(expr, cp_model.IntVar):
+        domain = cp_model.Domain.from_flat_intervals(list(expr.proto.domain))
+        if domain.size() > max_size:
+            return None
+        bounds = domain.flattened_intervals()
+        return [
+            v for lo, hi in zip(bounds[::2], bounds[1::2]) for v in range(lo, hi + 1)
+        ]
+    lo, hi = expr_bounds(expr)
+    if hi - lo + 1 > max_size:
+        return None
+    return list(range(lo, hi + 1))
+
+
+def sum_domain(
+    exprs: typing.Iterable[cp_model.LinearExprT], *, max_size: int = TABLE_SIZE
+) -> cp_model.Domain | None:
+    """Returns the exact set of values a sum can take, e.g. a sum of element lookups.
+
+    Args:
+        exprs (typing.Iterable[cp_model.LinearExprT]): The terms of the sum.
+        max_size (int, optional): The maximum number of values. Defaults to TABLE_SIZE.
+
+    Returns:
+        cp_model.Domain | None: The reachable values of the sum, or None if a term or
+            the sum can take more than `max_size` values.
+    """
+    sums = {0}
+    for expr in exprs:
+        values = expr_values(expr, max_size=max_size)
+        if values is None:
+            return None
+        sums = {s + v for s in sums for v in values}
+        if len(sums) > max_size:
+            return None
+    return cp_model.Domain.from_values(sorted(sums))
+
+
+def s_table(
+    model: cp_model.CpModel,
+    target: cp_model.IntVar,
+    a: cp_model.LinearExprT,
+    function: typing.Callable[[int], int],
+    *,
+    max_size: int = TABLE_SIZE,
+) -> bool:
+    """Constrains `target == function(a)` with a table over the values of a.
+
+    The encoding is exact for every value a can take, and is a single table
+    constraint regardless of how costly the function is to express arithmetically.
+
+    Args:
+        model (cp_model.CpModel): The constraint programming model.
+        target (cp_model.IntVar): The variable to store the result.
+        a (cp_model.LinearExprT): The input of the function.
+        function (typing.Callable[[int], int]): The function to tabulate.
+        max_size (int, optional): The maximum number of rows. Defaults to TABLE_SIZE.
+
+    Returns:
+        bool: Whether the table was added. Nothing is added to the model if a can
+            take more than `max_size` values.
+    """
+    values = expr_values(a, max_size=max_size)
+    if values is None:
+        return False
+    outputs = [function(v) for v in values]
+    restrict_domain(target, min(outputs), max(outputs))
+    if not isinstance(a, cp_model.IntVar):
+        index = model.new_int_var_from_domain(
+            cp_model.Domain.from_values(values), var_name(model, "table_index")
+        )
+        model.add(index == a)
+        a = index
+    model.add_allowed_assignments([a, target], list(zip(values, outputs)))
+    return True
+
+
 # Scaled calculations
 
 SCALE_FACTOR = 1000
@@ -51,11 +798,16 @@ def s_multiply(
         a (cp_model.IntVar | int): The first integer or integer variable.
         b (cp_model.IntVar | int): The second integer or integer variable.
         scale_factor (int): The scaling factor. Defaults to SCALE_FACTOR.
-        domain (cp_model.Domain | None): The domain of the raw product. Defaults to std_domain().
+        domain (cp_model.Domain | None): The domain of the raw product. Defaults to the bounds of the product of a and b, clipped to 48 bits.
+
     """
-    op_id = uuid.uuid4()
-    domain = domain if isinstance(domain, cp_model.Domain) else std_domain()
-    raw_prod = model.new_int_var_from_domain(domain, f"{op_id}_raw_prod")
+    if not isinstance(domain, cp_model.Domain):
+        prod_bounds = product_bounds(expr_bounds(a), expr_bounds(b))
+        domain = bounded_domain(*prod_bounds)
+        restrict_domain(
+            target, *quotient_bounds(prod_bounds, (scale_factor, scale_factor))
+        )
+    raw_prod = model.new_int_var_from_domain(domain, var_name(model, "raw_prod"))
     model.add_multiplication_equality(raw_prod, [a, b])
     model.add_division_equality(target, raw_prod, scale_factor)
 
@@ -77,12 +829,17 @@ def s_divide(
         a (cp_model.IntVar | int): The numerator variable or constant.
         b (cp_model.IntVar | int): The divisor variable or constant. Its domain must not contain 0.
         scale_factor (int): The scaling factor. Defaults to SCALE_FACTOR.
-        domain (cp_model.Domain | None): The domain of the scaled numerator. Defaults to std_domain().
+        domain (cp_model.Domain | None): The domain of the scaled numerator. Defaults to the bounds of a times the scaling factor, clipped to 48 bits.
+
     """
-    op_id = uuid.uuid4()
-    domain = domain if isinstance(domain, cp_model.Domain) else std_domain()
+    if not isinstance(domain, cp_model.Domain):
+        numerator_bounds = product_bounds(expr_bounds(a), (scale_factor, scale_factor))
+        domain = bounded_domain(*numerator_bounds)
+        quotient = quotient_bounds(numerator_bounds, expr_bounds(b))
+        if quotient is not None:
+            restrict_domain(target, *quotient)
     scaled_numerator = model.new_int_var_from_domain(
-        domain, f"{op_id}_scaled_numerator"
+        domain, var_name(model, "scaled_numerator")
     )
     model.add_multiplication_equality(scaled_numerator, [a, scale_factor])
     model.add_division_equality(target, scaled_numerator, b)
@@ -96,33 +853,76 @@ def s_sqrt(
     scale_factor: int = SCALE_FACTOR,
     domain: cp_model.Domain | None = None,
     iter: int = 10,
+    table_size: int = TABLE_SIZE,
 ) -> None:
-    """Calculates the square root of a given integer using Heron's method.
+    """Calculates the square root of a given integer.
+
+    If a is nonnegative and can take at most `table_size` values, the exact square
+    root of each value is looked up in a table. Otherwise, Heron's method is unrolled.
 
     Args:
         model (cp_model.CpModel): The constraint programming model.
         target (cp_model.IntVar): The variable to store the square root result.
         a (cp_model.IntVar): The input integer to calculate the square root of.
         scale_factor (int, optional): The scaling factor. Defaults to SCALE_FACTOR.
-        domain (cp_model.Domain | None): The domain of the intermediate guesses. Defaults to std_domain().
+        domain (cp_model.Domain | None): The domain of the intermediate guesses. Defaults to bounds inferred for each iteration if a is nonnegative, std_domain() otherwise.
         iter (int, optional): The number of iterations to perform. Defaults to 10.
+        table_size (int, optional): The maximum size of the lookup table. Defaults to TABLE_SIZE.
     """
-    op_id = uuid.uuid4()
-    domain = domain if isinstance(domain, cp_model.Domain) else std_domain()
-    guess_domain = domain.intersection_with(nonzero_domain())
-    guess = model.new_int_var_from_domain(guess_domain, f"{op_id}_guess_0")
+    a_bounds = expr_bounds(a)
+    is_table = (
+        not isinstance(domain, cp_model.Domain)
+        and a_bounds[0] >= 0
+        and s_table(
+            model,
+            target,
+            a,
+            lambda v: math.isqrt(v * scale_factor),
+            max_size=table_size,
+        )
+    )
+    if is_table:
+        return
+    if isinstance(domain, cp_model.Domain) or a_bounds[0] < 0:
+        domain = domain if isinstance(domain, cp_model.Domain) else std_domain()
+        guess_domain = domain.intersection_with(nonzero_domain())
+        guess = model.new_int_var_from_domain(guess_domain, var_name(model, "guess"))
+        model.add(guess == a)
+        for i in range(iter):
+            q = model.new_int_var_from_domain(domain, var_name(model, "q"))
+            s = model.new_int_var_from_domain(domain, var_name(model, "s"))
+            s_divide(model, q, a, guess, scale_factor=scale_factor, domain=domain)
+            model.add(s == guess + q)
+
+            new_guess = model.new_int_var_from_domain(
+                guess_domain, var_name(model, "guess")
+            )
+            model.add_division_equality(new_guess, s, 2)
+            guess = new_guess
+        model.add_abs_equality(target, guess)
+        return
+
+    # Each guess is at least isqrt(a * scale_factor) after the first iteration, and
+    # (g + n / g) / 2 is largest at the bounds of g.
+    n_lo, n_hi = a_bounds[0] * scale_factor, a_bounds[1] * scale_factor
+    g_lo, g_hi = max(a_bounds[0], 1), max(a_bounds[1], 1)
+    guess = model.new_int_var(g_lo, g_hi, var_name(model, "guess"))
     model.add(guess == a)
     for i in range(iter):
-        q = model.new_int_var_from_domain(domain, f"{op_id}_q_{i}")
-        s = model.new_int_var_from_domain(domain, f"{op_id}_s_{i}")
-        s_divide(model, q, a, guess, scale_factor=scale_factor, domain=domain)
+        q_lo, q_hi = n_lo // g_hi, n_hi // g_lo
+        q = model.new_int_var(q_lo, q_hi, var_name(model, "q"))
+        s = model.new_int_var(g_lo + q_lo, g_hi + q_hi, var_name(model, "s"))
+        s_divide(model, q, a, guess, scale_factor=scale_factor)
         model.add(s == guess + q)
 
-        new_guess = model.new_int_var_from_domain(
-            guess_domain, f"{op_id}_guess_{i + 1}"
+        g_lo, g_hi = (
+            max(math.isqrt(n_lo), 1),
+            max((g_lo + n_hi // g_lo) // 2, (g_hi + n_hi // g_hi) // 2),
         )
+        new_guess = model.new_int_var(g_lo, g_hi, var_name(model, "guess"))
         model.add_division_equality(new_guess, s, 2)
         guess = new_guess
+    restrict_domain(target, g_lo, g_hi)
     model.add_abs_equality(target, guess)
 
 
@@ -111,6 +111,9 @@ class MultiSequence[E](pydantic.BaseModel, abc.Sequence[E]):
         """
         return iter(self.seq)
 
+    def __iter__(self) -> abc.Iterator[E]:
+        return self.iter()
+
     def neighbors(
         self, index: int | tuple[int, ...], axis: int
     ) -> tuple[E | None, E | None]:
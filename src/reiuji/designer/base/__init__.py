@@ -1,7 +1,12 @@
 """Core functionality for Reiuji."""
 
 from . import scaled_calculations
+from . import component_index
+from . import one_hot
 from . import placement_rules
 from . import constraints
 from . import calculations
+from . import solver
+from . import cache
+from . import batch
 from . import designer
@@ -0,0 +1,75 @@
+"""Batch design of many multiblock structures across a process pool."""
+
+from ... import core
+from ...components.types import *
+from .solver import SolverConfig
+from .cache import ModelCache
+
+import os
+import typing
+import multiprocessing
+import concurrent.futures
+
+from ortools.sat import cp_model_pb2
+
+if typing.TYPE_CHECKING:
+    from .designer import Designer
+
+
+def _design(
+        designer: "Designer",
+        timeout: float | None,
+        config: SolverConfig,
+        cache: ModelCache | None
+) -> tuple[cp_model_pb2.CpSolverStatus, core.utils.multi_sequence.MultiSequence[Component] | None]:
+    return designer.design(timeout=timeout, config=config, cache=cache)
+
+
+def design_many(
+        designers: typing.Iterable["Designer"],
+        *,
+        max_workers: int | None = None,
+        timeout: float | None = None,
+        config: SolverConfig | None = None,
+        cache: ModelCache | None = None,
+        ordered: bool = True
+) -> typing.Iterator[tuple[int, tuple[cp_model_pb2.CpSolverStatus, core.utils.multi_sequence.MultiSequence[Component] | None]]]:
+    """Design many multiblock structures in parallel across a process pool.
+
+    Unless the configuration sets the number of search workers explicitly, the available cores are split evenly between
+    the processes of the pool, so that the pool and CP-SAT's own threads do not oversubscribe the machine.
+
+    Args:
+        designers (typing.Iterable[Designer]): The designers to run.
+        max_workers (int | None, optional): The number of processes in the pool. Defaults to one per core, at most one per designer.
+        timeout (float | None, optional): The time limit of each search. Defaults to None.
+        config (SolverConfig | None, optional): The solver configuration of each search. Defaults to None.
+        cache (ModelCache | None, optional): The cache to load built models from, or to store them in. Defaults to None.
+        ordered (bool, optional): Whether to yield results in the order of the designers, or as soon as they complete. Defaults to True.
+
+    Closing the iterator early cancels the designs that have not started yet. Designs already running end at their time limit.
+
+    Yields:
+        tuple[int, tuple[cp_model_pb2.CpSolverStatus, core.utils.multi_sequence.MultiSequence[Component] | None]]: The index of the designer and its result.
+    """
+    designers = list(designers)
+    if len(designers) == 0:
+        return
+    cpu_count = os.cpu_count() or 1
+    max_workers = max_workers if not isinstance(max_workers, type(None)) else min(cpu_count, len(designers))
+    config = config if not isinstance(config, type(None)) else SolverConfig()
+    if config.num_workers == 0:
+        config = config.model_copy(update={"num_workers": max(1, cpu_count // max_workers)})
+
+    executor = concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+    try:
+        futures = {executor.submit(_design, designer, timeout, config, cache): i for i, designer in enumerate(designers)}
+        if ordered:
+            for future, i in futures.items():
+                yield i, future.result()
+        else:
+            for future in concurrent.futures.as_completed(futures):
+                yield futures[future], future.result()
+    finally:
+        # Closing the generator early cancels the designs that have not started, without waiting for those that have.
+        executor.shutdown(wait=False, cancel_futures=True)
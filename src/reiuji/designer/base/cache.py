@@ -0,0 +1,103 @@
+"""On-disk cache of built constraint programming models."""
+
+from ... import core
+
+import os
+import json
+import struct
+import hashlib
+import pathlib
+import tempfile
+import typing
+
+from ortools.sat.python import cp_model
+
+if typing.TYPE_CHECKING:
+    from .designer import Designer
+
+
+FORMAT_VERSION = 1
+"""The version of the model encoding. Bump it whenever a change to the designers changes the models they build."""
+
+
+class ModelCache:
+    """Content-addressed on-disk cache of built models.
+
+    Models are keyed by the designer class, its constructor parameters and a hash of its component list, so that
+    designers with identical parameters can skip `build_model` entirely.
+    """
+    def __init__(self, directory: str | os.PathLike) -> None:
+        """
+        Args:
+            directory (str | os.PathLike): The directory to store cached models in. Created if it does not exist.
+        """
+        self.directory = pathlib.Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(designer: "Designer") -> str:
+        """Compute the cache key of a designer.
+
+        Args:
+            designer (Designer): The designer.
+
+        Returns:
+            str: The cache key.
+        """
+        components = hashlib.sha256(json.dumps([component.model_dump(mode="json") for component in designer.components], sort_keys=True).encode()).hexdigest()
+        params = {name: value for name, value in vars(designer).items() if name != "components" and not name.startswith("_")}
+        spec = json.dumps({
+            "format": FORMAT_VERSION,
+            "designer": f"{type(designer).__module__}.{type(designer).__qualname__}",
+            "naming": designer.model_naming,
+            "params": params,
+            "components": components
+        }, sort_keys=True, default=repr)
+        return hashlib.sha256(spec.encode()).hexdigest()
+
+    def path(self, key: str) -> pathlib.Path:
+        """The path of a cached model.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            pathlib.Path: The path of the cached model.
+        """
+        return self.directory / f"{key}.model"
+
+    def load(self, designer: "Designer") -> tuple[cp_model.CpModel, core.utils.multi_sequence.MultiSequence[cp_model.IntVar]] | None:
+        """Load the model of a designer from the cache.
+
+        Args:
+            designer (Designer): The designer.
+
+        Returns:
+            tuple[cp_model.CpModel, core.utils.multi_sequence.MultiSequence[cp_model.IntVar]] | None: The model and the sequence of components in the model, or None if the model is not cached.
+        """
+        try:
+            data = self.path(self.key(designer)).read_bytes()
+        except FileNotFoundError:
+            return None
+        (header_size,) = struct.unpack_from("<I", data)
+        header = json.loads(data[4:4 + header_size])
+        model = core.utils.cp_utils.ModelBuilder()
+        model.Proto().ParseFromString(data[4 + header_size:])
+        model.rebuild_var_and_constant_map()
+        seq = core.utils.multi_sequence.MultiSequence(seq=[model.GetIntVarFromProtoIndex(i) for i in header["cells"]], shape=tuple(header["shape"]))
+        return model, seq
+
+    def store(self, designer: "Designer", model: cp_model.CpModel, seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar]) -> None:
+        """Store the model of a designer in the cache.
+
+        Args:
+            designer (Designer): The designer.
+            model (cp_model.CpModel): The built model, without hints.
+            seq (core.utils.multi_sequence.MultiSequence[cp_model.IntVar]): The sequence of components in the model.
+        """
+        header = json.dumps({"cells": [var.Index() for var in seq], "shape": list(seq.shape)}).encode()
+        data = struct.pack("<I", len(header)) + header + model.Proto().SerializeToString()
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, self.path(self.key(designer)))
@@ -2,16 +2,23 @@
 
 from ... import core
 from ...components.types import *
+from .component_index import ComponentIndex
+from .one_hot import OneHot
 
 from ortools.sat.python import cp_model
 
 
 class Calculation:
-    def __call__(self, seq: core.multi_sequence.MultiSequence[Component]) -> float:
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if "to_model" in cls.__dict__:
+            cls.to_model = core.utils.cp_utils.scoped(cls.to_model)
+
+    def __call__(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> float:
         """Calculate and return a float value based on the given sequence.
 
         Args:
-            seq (core.multi_sequence.MultiSequence[core.components.Component]): The input sequence.
+            seq (core.utils.multi_sequence.MultiSequence[core.components.Component]): The input sequence.
 
         Returns:
             float: The calculated value.
@@ -21,15 +28,15 @@ class Calculation:
     def to_model(
                 self,
                 model: cp_model.CpModel,
-                seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-                components: list[Component]
+                seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+                components: ComponentIndex
     ) -> cp_model.IntVar:
         """Applies the calculation to the given CP model.
 
         Args:
             model (cp_model.CpModel): The CP model to apply the calculation to.
-            seq (core.multi_sequence.MultiSequence[cp_model.IntVar]): The input sequence
-            components (list[core.components.Component]): The list of multiblock components.
+            seq (core.utils.multi_sequence.MultiSequence[cp_model.IntVar]): The input sequence
+            components (ComponentIndex): The index of the multiblock components.
 
         Returns:
             cp_model.IntVar: The resulting CP variable representing the result of the calculation.
@@ -38,11 +45,16 @@ class Calculation:
 
 
 class SequenceCalculation:
-    def __call__(self, seq: core.multi_sequence.MultiSequence[Component]) -> list[float]:
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if "to_model" in cls.__dict__:
+            cls.to_model = core.utils.cp_utils.scoped(cls.to_model)
+
+    def __call__(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> list[float]:
         """Calculate and return a float value based on the given sequence.
 
         Args:
-            seq (core.multi_sequence.MultiSequence[core.components.Component]): The input sequence.
+            seq (core.utils.multi_sequence.MultiSequence[core.components.Component]): The input sequence.
 
         Returns:
             list[float]: The calculated value.
@@ -52,17 +64,43 @@ class SequenceCalculation:
     def to_model(
                 self,
                 model: cp_model.CpModel,
-                seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-                components: list[Component]
+                seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+                components: ComponentIndex
     ) -> list[cp_model.IntVar]:
         """Applies the calculation to the given CP model.
 
         Args:
             model (cp_model.CpModel): The CP model to apply the calculation to.
-            seq (core.multi_sequence.MultiSequence[cp_model.IntVar]): The input sequence
-            components (list[core.components.Component]): The list of multiblock components.
+            seq (core.utils.multi_sequence.MultiSequence[cp_model.IntVar]): The input sequence
+            components (ComponentIndex): The index of the multiblock components.
 
         Returns:
             list[cp_model.IntVar]: A list of CP variables representing the result of the calculation.
         """
         raise NotImplementedError
+
+
+class ComponentCount(Calculation):
+    """Counts the components of the given types."""
+    def __init__(self, types: list[str]) -> None:
+        """
+        Args:
+            types (list[str]): The types of components to count, e.g. ["cavity", "magnet", "cooler"].
+        """
+        self.types = types
+
+    def __call__(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> float:
+        return sum(1 for component in seq if component.type in self.types)
+
+    def to_model(
+                self,
+                model: cp_model.CpModel,
+                seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+                components: ComponentIndex
+    ) -> cp_model.IntVar:
+        counted_ids = components.ids_of_type(*self.types)
+        count = model.NewIntVar(0, len(seq), core.utils.cp_utils.var_name(model))
+        one_hot = OneHot.of(model, components)
+        is_counted = [one_hot.any_of(component, counted_ids) for component in seq]
+        model.Add(count == sum(is_counted))
+        return count
@@ -0,0 +1,173 @@
+"""Precomputed lookups over the component list of a designer."""
+
+from ...components.types import *
+
+import typing
+
+
+class ComponentIndex(typing.Sequence[Component]):
+    """An immutable component list with precomputed ID lookups and attribute vectors.
+
+    Designers build it once and pass it to every constraint and calculation, so that they do not have to scan the
+    component list to find the IDs of a type or the coefficients of an attribute. It behaves as a read-only list of
+    the components.
+    """
+    def __init__(self, components: typing.Iterable[Component]) -> None:
+        """
+        Args:
+            components (typing.Iterable[Component]): The list of multiblock components.
+        """
+        self._components = tuple(components)
+        self._type_to_ids: dict[str, tuple[int, ...]] = dict()
+        self._name_to_ids: dict[tuple[str, str], tuple[int, ...]] = dict()
+        self._full_name_to_id: dict[str, int] = dict()
+        for i, component in enumerate(self._components):
+            self._type_to_ids[component.type] = self._type_to_ids.get(component.type, ()) + (i,)
+            self._name_to_ids[(component.name, component.type)] = self._name_to_ids.get((component.name, component.type), ()) + (i,)
+            self._full_name_to_id.setdefault(component.full_name, i)
+        self._vectors: dict[tuple, tuple[int | float, ...]] = dict()
+
+    @classmethod
+    def of(cls, components: typing.Iterable[Component]) -> "ComponentIndex":
+        """Get the index of a component list, building it if needed.
+
+        Args:
+            components (typing.Iterable[Component]): The list of multiblock components, or its index.
+
+        Returns:
+            ComponentIndex: The index of the components.
+        """
+        if isinstance(components, cls):
+            return components
+        return cls(components)
+
+    def __len__(self) -> int:
+        return len(self._components)
+
+    @typing.overload
+    def __getitem__(self, i: int) -> Component: ...
+
+    @typing.overload
+    def __getitem__(self, i: slice) -> tuple[Component, ...]: ...
+
+    def __getitem__(self, i: int | slice) -> Component | tuple[Component, ...]:
+        return self._components[i]
+
+    def __iter__(self) -> typing.Iterator[Component]:
+        return iter(self._components)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ComponentIndex):
+            return self._components == other._components
+        if isinstance(other, (list, tuple)):
+            return self._components == tuple(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._components)!r})"
+
+    def index(self, component: Component, start: int = 0, stop: int | None = None) -> int:
+        for i in range(start, len(self._components) if isinstance(stop, type(None)) else stop):
+            if self._components[i] is component:
+                return i
+        return self._components.index(component, start, len(self._components) if isinstance(stop, type(None)) else stop)
+
+    def ids_of_type(self, *types: str) -> tuple[int, ...]:
+        """Get the IDs of the components of the given types.
+
+        Args:
+            *types (str): The types of the components.
+
+        Returns:
+            tuple[int, ...]: The IDs of the components, in increasing order.
+        """
+        if len(types) == 1:
+            return self._type_to_ids.get(types[0], ())
+        return tuple(sorted(i for type in set(types) for i in self._type_to_ids.get(type, ())))
+
+    def ids_of_name(self, name: str, type: str) -> tuple[int, ...]:
+        """Get the IDs of the components with the given name and type.
+
+        Args:
+            name (str): The name of the components.
+            type (str): The type of the components.
+
+        Returns:
+            tuple[int, ...]: The IDs of the components, in increasing order.
+        """
+        return self._name_to_ids.get((name, type), ())
+
+    def id_of_full_name(self, full_name: str) -> int:
+        """Get the ID of the first component with the given full name.
+
+        Args:
+            full_name (str): The full name of the component.
+
+        Returns:
+            int: The ID of the component.
+
+        Raises:
+            KeyError: If no component has the given full name.
+        """
+        return self._full_name_to_id[full_name]
+
+    def has_full_name(self, full_name: str) -> bool:
+        """Check whether a component has the given full name.
+
+        Args:
+            full_name (str): The full name of the component.
+
+        Returns:
+            bool: Whether a component has the given full name.
+        """
+        return full_name in self._full_name_to_id
+
+    def vector(
+            self,
+            attribute: str,
+            types: type | tuple[type, ...],
+            *,
+            scale: int | None = None,
+            exponent: float = 1,
+            default: int | float = 0
+    ) -> tuple[int | float, ...]:
+        """Get the value of an attribute for every component, e.g. the heat or the efficiency.
+
+        Vectors are computed once per index and attribute.
+
+        Args:
+            attribute (str): The name of the attribute.
+            types (type | tuple[type, ...]): The component classes that have the attribute.
+            scale (int | None, optional): If given, the value is raised to `exponent`, multiplied by `scale` and rounded. Defaults to None.
+            exponent (float, optional): The exponent applied to the value before scaling. Defaults to 1.
+            default (int | float, optional): The value of the components that are not instances of `types`. Defaults to 0.
+
+        Returns:
+            tuple[int | float, ...]: The value of the attribute for each component ID.
+        """
+        key = (attribute, types, scale, exponent, default)
+        if key not in self._vectors:
+            values = []
+            for component in self._components:
+                if not isinstance(component, types):
+                    values.append(default)
+                elif isinstance(scale, type(None)):
+                    values.append(getattr(component, attribute))
+                else:
+                    values.append(round(getattr(component, attribute) ** exponent * scale))
+            self._vectors[key] = tuple(values)
+        return self._vectors[key]
+
+    def mask(self, types: type | tuple[type, ...]) -> tuple[int, ...]:
+        """Get a 0/1 vector of whether each component is an instance of the given classes.
+
+        Args:
+            types (type | tuple[type, ...]): The component classes.
+
+        Returns:
+            tuple[int, ...]: 1 for each component ID that is an instance of `types`, 0 otherwise.
+        """
+        key = ("__mask__", types)
+        if key not in self._vectors:
+            self._vectors[key] = tuple(1 if isinstance(component, types) else 0 for component in self._components)
+        return self._vectors[key]
@@ -4,19 +4,27 @@ from ... import core
 from ...components.types import *
 
 from . import placement_rules
+from .component_index import ComponentIndex
+from .one_hot import OneHot, domain_values
 
-import uuid
+import typing
+import itertools
 
 from ortools.sat.python import cp_model
 
 
 class Constraint:
     """Represents a constraint that can be applied to a multiblock sequence."""
-    def is_satisfied(self, seq: core.multi_sequence.MultiSequence[Component]) -> bool:
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if "to_model" in cls.__dict__:
+            cls.to_model = core.utils.cp_utils.scoped(cls.to_model)
+
+    def is_satisfied(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> bool:
         """Checks if the given sequence satisfies the constraint.
 
         Args:
-            seq (core.multi_sequence.MultiSequence[core.components.Component]): The sequence to be checked.
+            seq (core.utils.multi_sequence.MultiSequence[core.components.Component]): The sequence to be checked.
 
         Returns:
             bool: True if the sequence satisfies the constraint, False otherwise.
@@ -26,15 +34,15 @@ class Constraint:
     def to_model(
         self,
         model: cp_model.CpModel,
-        seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-        components: list[Component]
+        seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+        components: ComponentIndex
     ) -> None:
         """Adds the constraint to the given model.
 
         Args:
             model (cp_model.CpModel): The model to which the constraint will be added.
-            seq (core.multi_sequence.MultiSequence[cp_model.IntVar]): The sequence to which the constraint will be applied.
-            components (list[core.components.Component]): The list of multiblock components.
+            seq (core.utils.multi_sequence.MultiSequence[cp_model.IntVar]): The sequence to which the constraint will be applied.
+            components (ComponentIndex): The index of the multiblock components.
 
         Returns:
             None
@@ -42,9 +50,39 @@ class Constraint:
         raise NotImplementedError
 
 
-class CasingConstraint(Constraint):
+class LayoutConstraint(Constraint):
+    """Represents a constraint that only restricts which components each cell can hold, independently of the other cells.
+
+    Designers apply layout constraints as reduced variable domains when creating the model, instead of adding them to it.
+    """
+    def restrict_domains(self, domains: core.utils.multi_sequence.MultiSequence[set[int]], components: ComponentIndex) -> None:
+        """Removes the component IDs that the constraint forbids from the domain of each cell.
+
+        Args:
+            domains (core.utils.multi_sequence.MultiSequence[set[int]]): The IDs of the components each cell can hold. Modified in place.
+            components (ComponentIndex): The index of the multiblock components.
+
+        Returns:
+            None
+        """
+        raise NotImplementedError
+
+    def to_model(
+        self,
+        model: cp_model.CpModel,
+        seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+        components: ComponentIndex
+    ) -> None:
+        domains = core.utils.multi_sequence.MultiSequence(seq=[set(range(len(components))) for _ in seq], shape=seq.shape)
+        self.restrict_domains(domains, components)
+        for component, domain in zip(seq, domains):
+            if len(domain) < len(components):
+                model.AddAllowedAssignments([component], [(component_id,) for component_id in sorted(domain)])
+
+
+class CasingConstraint(LayoutConstraint):
     """Ensures that casing blocks are placed at the exterior of the sequence."""
-    def is_satisfied(self, seq: core.multi_sequence.MultiSequence[Component]) -> bool:
+    def is_satisfied(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> bool:
         for i, component in enumerate(seq):
             idx = seq.index_int_to_tuple(i)
             if any([idx_ == 0 for idx_, dim in zip(idx, seq.shape)]) or any([idx_ == dim - 1 for idx_, dim in zip(idx, seq.shape)]):
@@ -55,29 +93,18 @@ class CasingConstraint(Constraint):
                     return False
         return True
     
-    def to_model(
-        self,
-        model: cp_model.CpModel,
-        seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-        components: list[Component]
-    ) -> None:
-        type_to_id = dict()
-        for i, component in enumerate(components):
-            if component.type not in type_to_id:
-                type_to_id[component.type] = [i]
-            else:
-                type_to_id[component.type].append(i)
-        casing_ids = type_to_id["casing"]
-        for i, component in enumerate(seq):
-            idx = seq.index_int_to_tuple(i)
-            if any([idx_ == 0 or idx_ == dim - 1 for idx_, dim in zip(idx, seq.shape)]):
-                model.AddAllowedAssignments([component], [(casing_id,) for casing_id in casing_ids])
+    def restrict_domains(self, domains: core.utils.multi_sequence.MultiSequence[set[int]], components: ComponentIndex) -> None:
+        casing_ids = components.ids_of_type("casing")
+        for i, domain in enumerate(domains):
+            idx = domains.index_int_to_tuple(i)
+            if any([idx_ == 0 or idx_ == dim - 1 for idx_, dim in zip(idx, domains.shape)]):
+                domain.intersection_update(casing_ids)
             else:
-                model.AddForbiddenAssignments([component], [(casing_id,) for casing_id in casing_ids])
+                domain.difference_update(casing_ids)
 
 class PlacementRuleConstraint(Constraint):
     """Ensures that all placement rules are satisfied."""
-    def is_satisfied(self, seq: core.multi_sequence.MultiSequence[Component]) -> bool:
+    def is_satisfied(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> bool:
         for i, component in enumerate(seq):
             idx = seq.index_int_to_tuple(i)
             neighbors = []
@@ -95,10 +122,16 @@ class PlacementRuleConstraint(Constraint):
     def to_model(
         self,
         model: cp_model.CpModel,
-        seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-        components: list[Component]
+        seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+        components: ComponentIndex
     ) -> None:
-        rules = [placement_rules.parse_rule_string(component.placement_rule) for component in components]
+        rules: dict[str, set[int]] = dict()
+        for i, component in enumerate(components):
+            rules.setdefault(component.placement_rule, set()).add(i)
+        tables = {rule: placement_rules.RuleTable(placement_rules.parse_rule_string(rule), components) for rule in rules}
+        tables = {rule: table for rule, table in tables.items() if not isinstance(table.rule, placement_rules.EmptyPlacementRule)}
+        one_hot = OneHot.of(model, components)
+        encoded: set[tuple[int, tuple[tuple[int, ...], ...]]] = set()
         for i, component in enumerate(seq):
             idx = seq.index_int_to_tuple(i)
             neighbors = []
@@ -106,35 +139,69 @@ class PlacementRuleConstraint(Constraint):
                 a, b = seq.neighbors(idx, dim)
                 neighbors.append(a)
                 neighbors.append(b)
-            if None in neighbors:
+            if any(neighbor is None for neighbor in neighbors):
+                continue
+            # Rules do not depend on the order of the axes or of the two neighbors along an axis, so aliased cells
+            # (e.g. mirrored by a symmetry) only need to be encoded once.
+            key = (component.Index(), tuple(sorted(tuple(sorted((a.Index(), b.Index()))) for a, b in itertools.batched(neighbors, 2))))
+            if key in encoded:
                 continue
-            rule_satisfied = [rule.to_model(model, neighbors, components) for rule in rules]
-            model.AddElement(component, rule_satisfied, 1)
+            encoded.add(key)
+            domain = set(domain_values(component))
+            for rule, table in tables.items():
+                ids = rules[rule] & domain
+                if len(ids) == 0:
+                    continue
+                has_rule = None if ids == domain else one_hot.any_of(component, list(ids))
+                if table.to_model(model, neighbors, has_rule):
+                    continue
+                satisfied = table.rule.to_model(model, neighbors, components)
+                if isinstance(has_rule, type(None)):
+                    model.AddBoolOr([satisfied])
+                else:
+                    model.AddImplication(has_rule, satisfied)
+
+
+class AliasConstraint(Constraint):
+    """Represents a constraint that only requires pairs of cells to hold the same component.
+
+    Designers apply alias constraints by having the cells of each pair share a single variable when creating the model, instead of adding them to it.
+    """
+    def pairs(self, shape: tuple[int, ...]) -> typing.Iterator[tuple[tuple[int, ...], tuple[int, ...]]]:
+        """Gets the pairs of cells that must hold the same component.
 
+        Args:
+            shape (tuple[int, ...]): The shape of the sequence.
 
-class SymmetryConstraint(Constraint):
-    """Ensures that the sequence is symmetric along the given axis."""
-    def __init__(self, axis: int) -> None:
-        self.axis = axis
+        Returns:
+            typing.Iterator[tuple[tuple[int, ...], tuple[int, ...]]]: The indices of the cells of each pair.
+        """
+        raise NotImplementedError
+
+    def is_satisfied(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> bool:
+        return all(seq[a] == seq[b] for a, b in self.pairs(seq.shape))
 
-    def is_satisfied(self, seq: core.multi_sequence.MultiSequence[Component]) -> bool:
-        for i, component in enumerate(seq):
-            idx = seq.index_int_to_tuple(i)
-            mirror_idx = (idx[:self.axis] + (seq.shape[self.axis] - 1 - idx[self.axis],) + idx[self.axis + 1:])
-            if component != seq[mirror_idx]:
-                return False
-        return True
-    
     def to_model(
         self,
         model: cp_model.CpModel,
-        seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-        components: list[Component]
+        seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+        components: ComponentIndex
     ) -> None:
-        for i, component in enumerate(seq):
-            idx = seq.index_int_to_tuple(i)
-            mirror_idx = (idx[:self.axis] + (seq.shape[self.axis] - 1 - idx[self.axis],) + idx[self.axis + 1:])
-            model.Add(component == seq[mirror_idx])
+        for a, b in self.pairs(seq.shape):
+            if seq[a].Index() != seq[b].Index():
+                model.Add(seq[a] == seq[b])
+
+
+class SymmetryConstraint(AliasConstraint):
+    """Ensures that the sequence is symmetric along the given axis."""
+    def __init__(self, axis: int) -> None:
+        self.axis = axis
+
+    def pairs(self, shape: tuple[int, ...]) -> typing.Iterator[tuple[tuple[int, ...], tuple[int, ...]]]:
+        for idx in itertools.product(*[range(dim) for dim in shape]):
+            mirror_idx = (idx[:self.axis] + (shape[self.axis] - 1 - idx[self.axis],) + idx[self.axis + 1:])
+            if idx[self.axis] < mirror_idx[self.axis]:
+                yield idx, mirror_idx
 
 
 class QuantityConstraint(Constraint):
@@ -144,7 +211,7 @@ class QuantityConstraint(Constraint):
         self.max_quantity = max_quantity
         self.min_quantity = min_quantity if isinstance(min_quantity, int) else 0
     
-    def is_satisfied(self, seq: core.multi_sequence.MultiSequence[Component]) -> bool:
+    def is_satisfied(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> bool:
         count = sum([1 for component in seq if component.full_name == self.component_full_name])
         if count < self.min_quantity or (isinstance(self.max_quantity, int) and count > self.max_quantity):
             return False
@@ -153,14 +220,12 @@ class QuantityConstraint(Constraint):
     def to_model(
         self,
         model: cp_model.CpModel,
-        seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-        components: list[Component]
+        seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+        components: ComponentIndex
     ) -> None:
-        component_id = [component.full_name for component in components].index(self.component_full_name)
-        is_equal = [model.NewBoolVar(str(uuid.uuid4())) for _ in seq]
-        for i, component in enumerate(seq):
-            model.Add(component == component_id).OnlyEnforceIf(is_equal[i])
-            model.Add(component != component_id).OnlyEnforceIf(is_equal[i].Not())
+        component_id = components.id_of_full_name(self.component_full_name)
+        one_hot = OneHot.of(model, components)
+        is_equal = [one_hot.literal(component, component_id) for component in seq]
         model.Add(sum(is_equal) >= self.min_quantity)
         if isinstance(self.max_quantity, int):
             model.Add(sum(is_equal) <= self.max_quantity)
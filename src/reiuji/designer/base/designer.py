@@ -2,10 +2,18 @@
 
 from ... import core
 from ...components.types import *
+from .solver import SolverConfig, DesignResult, SolutionCallback, ParetoPoint, objective_expr
+from .calculations import Calculation
+from .constraints import LayoutConstraint, AliasConstraint
+from .component_index import ComponentIndex
+from .cache import ModelCache
 
 
-import uuid
 import math
+import queue
+import typing
+import asyncio
+import threading
 
 from ortools.sat.python import cp_model
 from ortools.sat import cp_model_pb2
@@ -13,6 +21,9 @@ from ortools.sat import cp_model_pb2
 
 class Designer:
     """Base class for multiblock designers."""
+    model_naming: core.utils.cp_utils.Naming = "counter"
+    """How the variables of built models are named: "counter", "hierarchical" (scoped by designer, constraint and calculation) or "none"."""
+
     def __init__(self, *, components: list[Component]) -> None:
         self.components = components
     
@@ -25,29 +36,484 @@ class Designer:
         """
         raise NotImplementedError
 
-    def build_model(self, model: cp_model.CpModel, seq: core.multi_sequence.MultiSequence[cp_model.IntVar]) -> None:
+    @property
+    def component_index(self) -> ComponentIndex:
+        """The index of the components, built once per component list.
+
+        Returns:
+            ComponentIndex: The index of the components.
+        """
+        cached = getattr(self, "_component_index", None)
+        if isinstance(cached, type(None)) or cached[0] is not self.components:
+            cached = (self.components, ComponentIndex(self.components))
+            self._component_index = cached
+        return cached[1]
+
+    def build_model(self, model: cp_model.CpModel, seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar]) -> None:
         """Build the constraint programming model.
 
         Args:
             model (cp_model.CpModel): The constraint programming model.
-            seq (core.multi_sequence.MultiSequence[cp_model.IntVar]): The sequence of components.
+            seq (core.utils.multi_sequence.MultiSequence[cp_model.IntVar]): The sequence of components.
         """
         raise NotImplementedError
-    
-    def design(self, *, timeout: float | None = None) -> tuple[cp_model_pb2.CpSolverStatus, core.multi_sequence.MultiSequence[Component] | None]:
-        """Design a multiblock structure.
+
+    def layout(self) -> list[LayoutConstraint]:
+        """The layout constraints of the multiblock, applied as variable domains instead of being added to the model.
+
+        Returns:
+            list[LayoutConstraint]: The layout constraints.
+        """
+        return []
+
+    def aliases(self) -> list[AliasConstraint]:
+        """The alias constraints of the multiblock, such as symmetries, applied by sharing variables between cells instead of being added to the model.
+
+        Returns:
+            list[AliasConstraint]: The alias constraints.
+        """
+        return []
+
+    def cell_groups(self) -> core.utils.multi_sequence.MultiSequence[int]:
+        """Compute which cells share a variable under the alias constraints.
+
+        Returns:
+            core.utils.multi_sequence.MultiSequence[int]: The index of the representative cell of each cell.
+        """
+        parents = list(range(math.prod(self.seq_shape)))
+
+        def find(i: int) -> int:
+            while parents[i] != i:
+                parents[i] = parents[parents[i]]
+                i = parents[i]
+            return i
+
+        cells = core.utils.multi_sequence.MultiSequence(seq=list(range(len(parents))), shape=self.seq_shape)
+        for constraint in self.aliases():
+            for a, b in constraint.pairs(self.seq_shape):
+                a, b = find(cells[a]), find(cells[b])
+                parents[max(a, b)] = min(a, b)
+        return core.utils.multi_sequence.MultiSequence(seq=[find(i) for i in range(len(parents))], shape=self.seq_shape)
+
+    def cell_domains(self) -> core.utils.multi_sequence.MultiSequence[set[int]]:
+        """Compute the IDs of the components each cell can hold under the layout constraints.
+
+        Returns:
+            core.utils.multi_sequence.MultiSequence[set[int]]: The domain of each cell.
+        """
+        domains = core.utils.multi_sequence.MultiSequence(seq=[set(range(len(self.components))) for _ in range(math.prod(self.seq_shape))], shape=self.seq_shape)
+        for constraint in self.layout():
+            constraint.restrict_domains(domains, self.component_index)
+        return domains
+
+    def add_hint(self, model: cp_model.CpModel, seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar], hint: core.utils.multi_sequence.MultiSequence[Component | None]) -> None:
+        """Add solution hints to the model from a previous design.
+
+        The hint is aligned at the origin. Cells outside of the hint are left unhinted, and cells of the hint outside of the sequence are ignored.
+        Cells that are None, or that contain components not in the component list, are left unhinted.
+
+        Args:
+            model (cp_model.CpModel): The constraint programming model.
+            seq (core.utils.multi_sequence.MultiSequence[cp_model.IntVar]): The sequence of components.
+            hint (core.utils.multi_sequence.MultiSequence[Component | None]): The (possibly partial) design to start from.
+        """
+        if len(hint.shape) != len(seq.shape):
+            raise ValueError(f"Hint has {len(hint.shape)} dimensions, expected {len(seq.shape)}.")
+        components = self.component_index
+        hinted: set[int] = set()
+        for i, var in enumerate(seq):
+            idx = seq.index_int_to_tuple(i)
+            if var.Index() in hinted or any(idx[d] >= hint.shape[d] for d in range(len(idx))):
+                continue
+            component = hint[idx]
+            if isinstance(component, type(None)):
+                continue
+            if component in components:
+                value = components.index(component)
+            elif components.has_full_name(component.full_name):
+                value = components.id_of_full_name(component.full_name)
+            else:
+                continue
+            model.AddHint(var, value)
+            hinted.add(var.Index())
+
+    def create_model(self, *, hint: core.utils.multi_sequence.MultiSequence[Component | None] | None = None, cache: ModelCache | None = None) -> tuple[cp_model.CpModel, core.utils.multi_sequence.MultiSequence[cp_model.IntVar]]:
+        """Create and build the constraint programming model.
+
+        Args:
+            hint (core.utils.multi_sequence.MultiSequence[Component | None] | None, optional): A (possibly partial) design to start the search from. Defaults to None.
+            cache (ModelCache | None, optional): The cache to load the built model from, or to store it in. Defaults to None.
+
+        Returns:
+            tuple[cp_model.CpModel, core.utils.multi_sequence.MultiSequence[cp_model.IntVar]]: The model and the sequence of components in the model.
+        """
+        cached = cache.load(self) if not isinstance(cache, type(None)) else None
+        if not isinstance(cached, type(None)):
+            model, seq = cached
+        else:
+            model = core.utils.cp_utils.ModelBuilder(self.model_naming)
+            domains = self.cell_domains()
+            groups = self.cell_groups()
+            for i, group in enumerate(groups):
+                if group != i:
+                    domains[group].intersection_update(domains[i])
+            cells = []
+            for i, group in enumerate(groups):
+                domain = domains[group]
+                if group != i:
+                    cells.append(cells[group])
+                elif len(domain) == 0:
+                    raise ValueError(f"No component can be placed at {domains.index_int_to_tuple(i)}.")
+                elif len(domain) == 1:
+                    cells.append(model.NewConstant(next(iter(domain))))
+                else:
+                    cells.append(model.NewIntVarFromDomain(cp_model.Domain.FromValues(sorted(domain)), core.utils.cp_utils.var_name(model, "cell")))
+            seq = core.utils.multi_sequence.MultiSequence(seq=cells, shape=self.seq_shape)
+            with model.scope(type(self).__name__):
+                self.build_model(model, seq)
+            core.utils.cp_utils.tighten_domains(model)
+            if not isinstance(cache, type(None)):
+                cache.store(self, model, seq)
+        if not isinstance(hint, type(None)):
+            self.add_hint(model, seq, hint)
+        return model, seq
+
+    def decode(self, values: list[int]) -> core.utils.multi_sequence.MultiSequence[Component]:
+        """Convert component IDs into a multiblock structure.
+
+        Args:
+            values (list[int]): The component ID of each cell.
 
         Returns:
-            tuple[cp_model_pb2.CpSolverStatus, core.multi_sequence.MultiSequence[core.components.Component]]: The status of the solver and the designed multiblock structure.
+            core.utils.multi_sequence.MultiSequence[Component]: The multiblock structure.
         """
-        model = cp_model.CpModel()
-        seq = core.multi_sequence.MultiSequence([model.NewIntVar(0, len(self.components) - 1, str(uuid.uuid4())) for _ in range(math.prod(self.seq_shape))], self.seq_shape)
-        self.build_model(model, seq)
+        return core.utils.multi_sequence.MultiSequence(seq=[self.components[value] for value in values], shape=self.seq_shape)
+
+    def solve(self, *, timeout: float | None = None, config: SolverConfig | None = None, hint: core.utils.multi_sequence.MultiSequence[Component | None] | None = None, cache: ModelCache | None = None) -> DesignResult:
+        """Design a multiblock structure, reporting the proven bound along with the design.
+
+        Set `relative_gap` or `absolute_gap` in the solver configuration to stop as soon as the design is proven close enough to optimal.
+
+        Args:
+            timeout (float | None, optional): The time limit of the search. Defaults to None.
+            config (SolverConfig | None, optional): The solver configuration. Defaults to None.
+            hint (core.utils.multi_sequence.MultiSequence[Component | None] | None, optional): A (possibly partial) design to start the search from. Defaults to None.
+            cache (ModelCache | None, optional): The cache to load the built model from, or to store it in. Defaults to None.
+
+        Returns:
+            DesignResult: The status of the solver, the designed multiblock structure, its objective value, bound and gap.
+        """
+        model, seq = self.create_model(hint=hint, cache=cache)
 
         solver = cp_model.CpSolver()
-        if isinstance(timeout, float):
-            solver.parameters.max_time_in_seconds = timeout
+        config = config if not isinstance(config, type(None)) else SolverConfig()
+        config.apply(solver, timeout=timeout)
         status = solver.Solve(model)
         if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
-            return status, core.multi_sequence.MultiSequence([self.components[solver.Value(comp)] for comp in seq], self.seq_shape)
-        return status, None
+            return DesignResult(
+                status,
+                self.decode([solver.Value(comp) for comp in seq]),
+                objective=solver.ObjectiveValue(),
+                bound=solver.BestObjectiveBound(),
+                wall_time=solver.WallTime()
+            )
+        return DesignResult(status, None, wall_time=solver.WallTime())
+
+    def design(self, *, timeout: float | None = None, config: SolverConfig | None = None, hint: core.utils.multi_sequence.MultiSequence[Component | None] | None = None, cache: ModelCache | None = None) -> tuple[cp_model_pb2.CpSolverStatus, core.utils.multi_sequence.MultiSequence[Component] | None]:
+        """Design a multiblock structure.
+
+        Args:
+            timeout (float | None, optional): The time limit of the search. Defaults to None.
+            config (SolverConfig | None, optional): The solver configuration. Defaults to None.
+            hint (core.utils.multi_sequence.MultiSequence[Component | None] | None, optional): A (possibly partial) design to start the search from. Defaults to None.
+            cache (ModelCache | None, optional): The cache to load the built model from, or to store it in. Defaults to None.
+
+        Returns:
+            tuple[cp_model_pb2.CpSolverStatus, core.utils.multi_sequence.MultiSequence[core.components.Component]]: The status of the solver and the designed multiblock structure.
+        """
+        result = self.solve(timeout=timeout, config=config, hint=hint, cache=cache)
+        return result.status, result.seq
+
+    def design_iter(self, *, timeout: float | None = None, config: SolverConfig | None = None, hint: core.utils.multi_sequence.MultiSequence[Component | None] | None = None, cache: ModelCache | None = None) -> typing.Iterator[DesignResult]:
+        """Design a multiblock structure, yielding each improving design as soon as it is found.
+
+        The solver runs in a background thread. The last result carries the final status of the solver and the best design found.
+        Closing the generator early stops the search.
+
+        Args:
+            timeout (float | None, optional): The time limit of the search. Defaults to None.
+            config (SolverConfig | None, optional): The solver configuration. Defaults to None.
+            hint (core.utils.multi_sequence.MultiSequence[Component | None] | None, optional): A (possibly partial) design to start the search from. Defaults to None.
+            cache (ModelCache | None, optional): The cache to load the built model from, or to store it in. Defaults to None.
+
+        Yields:
+            DesignResult: Each improving design, followed by the final result.
+        """
+        model, seq = self.create_model(hint=hint, cache=cache)
+
+        solver = cp_model.CpSolver()
+        config = config if not isinstance(config, type(None)) else SolverConfig()
+        config.apply(solver, timeout=timeout)
+
+        results: queue.Queue[DesignResult | None] = queue.Queue()
+        callback = SolutionCallback(seq, self.decode, results.put)
+
+        def run() -> None:
+            try:
+                status = solver.Solve(model, callback)
+                if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
+                    results.put(DesignResult(
+                        status,
+                        self.decode([solver.Value(comp) for comp in seq]),
+                        objective=solver.ObjectiveValue(),
+                        bound=solver.BestObjectiveBound(),
+                        wall_time=solver.WallTime()
+                    ))
+                else:
+                    results.put(DesignResult(status, None, wall_time=solver.WallTime()))
+            finally:
+                results.put(None)
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        try:
+            while (result := results.get()) is not None:
+                yield result
+        finally:
+            solver.StopSearch()
+            thread.join()
+
+    def add_distance(self, model: cp_model.CpModel, seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar], values: list[int], min_distance: int) -> None:
+        """Require the design to differ from a previous design in at least a given number of cells.
+
+        Args:
+            model (cp_model.CpModel): The constraint programming model.
+            seq (core.utils.multi_sequence.MultiSequence[cp_model.IntVar]): The sequence of components.
+            values (list[int]): The component ID of each cell of the previous design.
+            min_distance (int): The minimum Hamming distance to the previous design.
+        """
+        weights: dict[int, int] = {}
+        targets: dict[int, tuple[cp_model.IntVar, int]] = {}
+        for var, value in zip(seq, values):
+            weights[var.Index()] = weights.get(var.Index(), 0) + 1
+            targets[var.Index()] = (var, value)
+        differs = []
+        for index, (var, value) in targets.items():
+            differ = model.NewBoolVar(core.utils.cp_utils.var_name(model))
+            model.Add(var != value).OnlyEnforceIf(differ)
+            differs.append(weights[index] * differ)
+        model.Add(sum(differs) >= min_distance)
+
+    def design_pool(
+            self,
+            k: int | None,
+            *,
+            min_distance: int = 1,
+            tolerance: float | None = None,
+            timeout: float | None = None,
+            config: SolverConfig | None = None,
+            hint: core.utils.multi_sequence.MultiSequence[Component | None] | None = None,
+            cache: ModelCache | None = None
+    ) -> list[DesignResult]:
+        """Design a pool of distinct multiblock structures, best first.
+
+        The model is built once. After each design is found, the model requires every later design to differ from it in at
+        least `min_distance` cells, and the search is warm-started from the best design seen so far that still satisfies this.
+        With `min_distance=1` and no time limit, the result is the exact top-k.
+
+        Args:
+            k (int | None): The maximum number of designs. None for no limit, which requires a tolerance.
+            min_distance (int, optional): The minimum Hamming distance between any two designs. Defaults to 1.
+            tolerance (float | None, optional): Only return designs whose objective is within this fraction of the optimum (e.g. 0.05 for 5%). Defaults to None.
+            timeout (float | None, optional): The time limit of each search. Defaults to None.
+            config (SolverConfig | None, optional): The solver configuration. Defaults to None.
+            hint (core.utils.multi_sequence.MultiSequence[Component | None] | None, optional): A (possibly partial) design to start the search from. Defaults to None.
+            cache (ModelCache | None, optional): The cache to load the built model from, or to store it in. Defaults to None.
+
+        Returns:
+            list[DesignResult]: The designs found, in order of discovery.
+        """
+        if isinstance(k, type(None)) and isinstance(tolerance, type(None)):
+            raise ValueError("Either k or tolerance must be given.")
+        model, seq = self.create_model(hint=hint, cache=cache)
+        objective, scaling_factor = objective_expr(model)
+        offset = model.Proto().objective.offset
+        config = config if not isinstance(config, type(None)) else SolverConfig()
+
+        results: list[DesignResult] = []
+        chosen: list[list[int]] = []
+        pool: list[tuple[float, list[int]]] = []
+
+        def collect(values: list[int], objective_value: float) -> None:
+            pool.append((objective_value / scaling_factor, values))
+
+        while isinstance(k, type(None)) or len(results) < k:
+            candidates = [values for internal, values in sorted(pool, key=lambda entry: entry[0]) if all(sum(a != b for a, b in zip(values, other)) >= min_distance for other in chosen)]
+            if len(chosen) > 0 and len(candidates) > 0:
+                model.ClearHints()
+                for var, value in {var.Index(): (var, value) for var, value in zip(seq, candidates[0])}.values():
+                    model.AddHint(var, value)
+
+            solver = cp_model.CpSolver()
+            config.apply(solver, timeout=timeout)
+            callback = SolutionCallback(seq, lambda values: values, lambda result: collect(result.seq, result.objective))
+            status = solver.Solve(model, callback)
+            if status != cp_model.OPTIMAL and status != cp_model.FEASIBLE:
+                break
+            values = [solver.Value(comp) for comp in seq]
+            results.append(DesignResult(
+                status,
+                self.decode(values),
+                objective=solver.ObjectiveValue(),
+                bound=solver.BestObjectiveBound(),
+                wall_time=solver.WallTime()
+            ))
+            if len(chosen) == 0 and not isinstance(tolerance, type(None)):
+                best = solver.ObjectiveValue()
+                model.Add(objective <= math.floor((best / scaling_factor) + abs(best) * tolerance - offset))
+            chosen.append(values)
+            self.add_distance(model, seq, values, min_distance)
+        return results
+
+    def design_pareto(
+            self,
+            secondary: Calculation,
+            *,
+            maximize_secondary: bool = False,
+            method: typing.Literal["epsilon", "extremes"] = "epsilon",
+            max_points: int | None = None,
+            timeout: float | None = None,
+            config: SolverConfig | None = None,
+            hint: core.utils.multi_sequence.MultiSequence[Component | None] | None = None,
+            cache: ModelCache | None = None
+    ) -> list[ParetoPoint]:
+        """Compute the Pareto front of the designer's own objective against a secondary objective.
+
+        The model is built once and reused by every pass, each warm-started from the previous design.
+        In "epsilon" mode, each point minimizes the primary objective under a bound on the secondary one, followed by a
+        pass that fixes the primary objective and optimizes the secondary one; the bound is then tightened past the point.
+        In "extremes" mode, the front is not traced: only its two end points are computed, each optimizing one objective
+        and then the other with the first one fixed.
+
+        Args:
+            secondary (Calculation): The secondary objective, e.g. `ComponentCount(["cavity", "magnet", "cooler"])`.
+            maximize_secondary (bool, optional): Whether the secondary objective is maximized. Defaults to False.
+            method (typing.Literal["epsilon", "extremes"], optional): How the front is computed. Defaults to "epsilon".
+            max_points (int | None, optional): The maximum number of points. Defaults to None.
+            timeout (float | None, optional): The time limit of each pass. Defaults to None.
+            config (SolverConfig | None, optional): The solver configuration. Defaults to None.
+            hint (core.utils.multi_sequence.MultiSequence[Component | None] | None, optional): A (possibly partial) design to start the search from. Defaults to None.
+            cache (ModelCache | None, optional): The cache to load the built model from, or to store it in. Defaults to None.
+
+        Returns:
+            list[ParetoPoint]: The points of the front, from best to worst primary objective. At most two in "extremes" mode.
+        """
+        model, seq = self.create_model(hint=hint, cache=cache)
+        primary, scaling_factor = objective_expr(model)
+        offset = model.Proto().objective.offset
+        sign = -1 if maximize_secondary else 1
+        second = sign * secondary.to_model(model, seq, self.component_index)
+        config = config if not isinstance(config, type(None)) else SolverConfig()
+
+        def run(objective: cp_model.LinearExprT) -> tuple[cp_model_pb2.CpSolverStatus, cp_model.CpSolver]:
+            model.Minimize(objective)
+            solver = cp_model.CpSolver()
+            config.apply(solver, timeout=timeout)
+            status = solver.Solve(model)
+            if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
+                model.ClearHints()
+                for var in {var.Index(): var for var in seq}.values():
+                    model.AddHint(var, solver.Value(var))
+            return status, solver
+
+        def point(first: cp_model.LinearExprT, then: cp_model.LinearExprT) -> tuple[cp_model_pb2.CpSolverStatus, cp_model.CpSolver | None]:
+            status, solver = run(first)
+            if status != cp_model.OPTIMAL and status != cp_model.FEASIBLE:
+                return status, None
+            # The cap only holds for the next pass, as an assumption of the solve.
+            enabled = model.NewBoolVar(core.utils.cp_utils.var_name(model))
+            model.Add(first <= solver.Value(first)).OnlyEnforceIf(enabled)
+            model.AddAssumption(enabled)
+            status, solver = run(then)
+            model.ClearAssumptions()
+            return status, solver
+
+        def to_point(status: cp_model_pb2.CpSolverStatus, solver: cp_model.CpSolver) -> ParetoPoint:
+            return ParetoPoint(
+                status,
+                self.decode([solver.Value(comp) for comp in seq]),
+                (scaling_factor * (solver.Value(primary) + offset), float(sign * solver.Value(second)))
+            )
+
+        points: list[ParetoPoint] = []
+        if method == "extremes":
+            for first, then in ((primary, second), (second, primary)):
+                status, solver = point(first, then)
+                if isinstance(solver, type(None)) or (status != cp_model.OPTIMAL and status != cp_model.FEASIBLE):
+                    continue
+                new_point = to_point(status, solver)
+                if all(new_point.objectives != other.objectives for other in points):
+                    points.append(new_point)
+            return points[:max_points] if not isinstance(max_points, type(None)) else points
+        if method != "epsilon":
+            raise ValueError(f"Unknown method {method!r}.")
+        while isinstance(max_points, type(None)) or len(points) < max_points:
+            status, solver = point(primary, second)
+            if isinstance(solver, type(None)) or (status != cp_model.OPTIMAL and status != cp_model.FEASIBLE):
+                break
+            points.append(to_point(status, solver))
+            model.Add(second <= solver.Value(second) - 1)
+        return points
+
+    async def design_async(
+            self,
+            *,
+            timeout: float | None = None,
+            config: SolverConfig | None = None,
+            hint: core.utils.multi_sequence.MultiSequence[Component | None] | None = None,
+            cache: ModelCache | None = None,
+            on_progress: typing.Callable[[DesignResult], None] | None = None
+    ) -> tuple[cp_model_pb2.CpSolverStatus, core.utils.multi_sequence.MultiSequence[Component] | None]:
+        """Design a multiblock structure without blocking the event loop.
+
+        The model is built and solved in the event loop's default executor. Cancelling the awaiting task stops the search.
+
+        Args:
+            timeout (float | None, optional): The time limit of the search. Defaults to None.
+            config (SolverConfig | None, optional): The solver configuration. Defaults to None.
+            hint (core.utils.multi_sequence.MultiSequence[Component | None] | None, optional): A (possibly partial) design to start the search from. Defaults to None.
+            cache (ModelCache | None, optional): The cache to load the built model from, or to store it in. Defaults to None.
+            on_progress (typing.Callable[[DesignResult], None] | None, optional): Called on the event loop with each improving design. Defaults to None.
+
+        Returns:
+            tuple[cp_model_pb2.CpSolverStatus, core.utils.multi_sequence.MultiSequence[core.components.Component]]: The status of the solver and the designed multiblock structure.
+        """
+        loop = asyncio.get_running_loop()
+        solver = cp_model.CpSolver()
+        config = config if not isinstance(config, type(None)) else SolverConfig()
+        config.apply(solver, timeout=timeout)
+        cancelled = threading.Event()
+
+        def report(result: DesignResult) -> None:
+            if not isinstance(on_progress, type(None)):
+                loop.call_soon_threadsafe(on_progress, result)
+
+        def run() -> tuple[cp_model_pb2.CpSolverStatus, core.utils.multi_sequence.MultiSequence[Component] | None]:
+            model, seq = self.create_model(hint=hint, cache=cache)
+            if cancelled.is_set():
+                return cp_model.UNKNOWN, None
+            status = solver.Solve(model, SolutionCallback(seq, self.decode, report))
+            if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
+                return status, self.decode([solver.Value(comp) for comp in seq])
+            return status, None
+
+        future = loop.run_in_executor(None, run)
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            cancelled.set()
+            # StopSearch has no effect until the search has started, so it is repeated until the search ends.
+            while not future.done():
+                solver.StopSearch()
+                await asyncio.wait([future], timeout=0.05)
+            raise
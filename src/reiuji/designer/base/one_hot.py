@@ -0,0 +1,126 @@
+"""Shared one-hot encoding of the component in each cell of a model."""
+
+from ... import core
+from ...components.types import *
+from .component_index import ComponentIndex
+
+from ortools.sat.python import cp_model
+
+
+def domain_values(var: cp_model.IntVar) -> list[int]:
+    """Get the values in the domain of a variable.
+
+    Args:
+        var (cp_model.IntVar): The variable.
+
+    Returns:
+        list[int]: The values in the domain of the variable, in increasing order.
+    """
+    bounds = list(var.Proto().domain)
+    values = []
+    for lo, hi in zip(bounds[::2], bounds[1::2]):
+        values.extend(range(lo, hi + 1))
+    return values
+
+
+class OneHot(core.utils.cp_utils.SharedLiterals):
+    """A cell-by-component matrix of literals linked to the cell variables of a model.
+
+    Literals are created lazily, at most once per cell and set of components, and are shared by every constraint and
+    calculation built on the same model. The layer extends the shared literals of the model, so that literals created
+    through `core.utils.cp_utils.in_values` are reused as well. Use `OneHot.of` to get the layer of a model.
+    """
+    def __init__(self, model: cp_model.CpModel, components: ComponentIndex) -> None:
+        super().__init__(model)
+        self.components = components
+        self._differ: dict[tuple[int, int], cp_model.IntVar] = dict()
+
+    @classmethod
+    def of(cls, model: cp_model.CpModel, components: ComponentIndex) -> "OneHot":
+        """Get the one-hot layer of a model, creating it if needed.
+
+        Args:
+            model (cp_model.CpModel): The constraint programming model.
+            components (ComponentIndex): The index of the multiblock components.
+
+        Returns:
+            OneHot: The one-hot layer of the model.
+        """
+        layer = cls.get(model)
+        if not isinstance(layer, OneHot):
+            one_hot = cls(model, components)
+            one_hot.attach(layer)
+            return one_hot
+        if layer.components is not components and layer.components != components:
+            raise ValueError("The one-hot layer of a model must be built from a single component list.")
+        return layer
+
+    def literal(self, cell: cp_model.IntVar, component_id: int) -> cp_model.IntVar:
+        """Get the literal that is true if and only if a cell holds a component.
+
+        Args:
+            cell (cp_model.IntVar): The cell variable.
+            component_id (int): The ID of the component.
+
+        Returns:
+            cp_model.IntVar: The literal.
+        """
+        return self.in_values(cell, [component_id])
+
+    def any_of(self, cell: cp_model.IntVar, component_ids: list[int]) -> cp_model.IntVar:
+        """Get the literal that is true if and only if a cell holds any of the given components.
+
+        Args:
+            cell (cp_model.IntVar): The cell variable.
+            component_ids (list[int]): The IDs of the components.
+
+        Returns:
+            cp_model.IntVar: The literal.
+        """
+        return self.in_values(cell, component_ids)
+
+    def of_type(self, cell: cp_model.IntVar, type: str) -> cp_model.IntVar:
+        """Get the literal that is true if and only if a cell holds a component of the given type.
+
+        Args:
+            cell (cp_model.IntVar): The cell variable.
+            type (str): The type of the components.
+
+        Returns:
+            cp_model.IntVar: The literal.
+        """
+        return self.any_of(cell, self.components.ids_of_type(type))
+
+    def of_name(self, cell: cp_model.IntVar, name: str, type: str) -> cp_model.IntVar:
+        """Get the literal that is true if and only if a cell holds the component with the given name and type.
+
+        Args:
+            cell (cp_model.IntVar): The cell variable.
+            name (str): The name of the component.
+            type (str): The type of the component.
+
+        Returns:
+            cp_model.IntVar: The literal.
+        """
+        return self.any_of(cell, self.components.ids_of_name(name, type))
+
+    def differ(self, a: cp_model.IntVar, b: cp_model.IntVar) -> cp_model.IntVar:
+        """Get the literal that is true if and only if two cells hold different components.
+
+        Args:
+            a (cp_model.IntVar): The first cell variable.
+            b (cp_model.IntVar): The second cell variable.
+
+        Returns:
+            cp_model.IntVar: The literal.
+        """
+        key = (min(a.Index(), b.Index()), max(a.Index(), b.Index()))
+        if key not in self._differ:
+            if a.Index() == b.Index():
+                self._differ[key] = self.model.NewConstant(0)
+            else:
+                literal = self.model.NewBoolVar(core.utils.cp_utils.var_name(self.model))
+                self.model.Add(a != b).OnlyEnforceIf(literal)
+                self.model.Add(a == b).OnlyEnforceIf(literal.Not())
+                self._differ[key] = literal
+        return self._differ[key]
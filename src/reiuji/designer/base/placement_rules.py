@@ -2,8 +2,10 @@
 
 from ... import core
 from ...components.types import *
+from .component_index import ComponentIndex
+from . import one_hot
+from .one_hot import OneHot
 
-import uuid
 import typing
 import itertools
 import math
@@ -32,19 +34,32 @@ class PlacementRule:
             bool: True if the placement rule is satisfied, False otherwise.
         """
         raise NotImplementedError
+
+    def classify(self, component: Component) -> typing.Hashable:
+        """Gets what the placement rule can observe of a neighboring component.
+
+        Neighbors with the same class are interchangeable as far as the rule is concerned.
+
+        Args:
+            component (Component): The neighboring component.
+
+        Returns:
+            typing.Hashable: The class of the component.
+        """
+        raise NotImplementedError
     
     def to_model(
         self,
         model: cp_model.CpModel,
         neighbors: list[cp_model.IntVar],
-        components: list[Component]
+        components: ComponentIndex
     ) -> cp_model.IntVar:
         """Adds the placement rule to the CP model and returns whether it is satisfied as a variable.
 
         Args:
             model (cp_model.CpModel): The CP model to which the placement rule will be added.
             neighbors (list[cp_model.IntVar]): The list of neighbor variables.
-            components (list[Component]): The list of multiblock components.
+            components (ComponentIndex): The index of the multiblock components.
 
         Returns:
             cp_model.IntVar: A variable representing whether the placement rule is satisfied.
@@ -59,14 +74,17 @@ class EmptyPlacementRule(PlacementRule):
     
     def is_satisfied(self, neighbors: list[Component]) -> bool:
         return True
+
+    def classify(self, component: Component) -> typing.Hashable:
+        return None
     
     def to_model(
         self,
         model: cp_model.CpModel,
         neighbors: list[cp_model.IntVar],
-        components: list[Component]
+        components: ComponentIndex
     ) -> cp_model.IntVar:
-        return model.NewBoolVar(str(uuid.uuid4()))
+        return model.NewConstant(1)
 
 
 class NamePlacementRule(PlacementRule):
@@ -108,39 +126,19 @@ class NamePlacementRule(PlacementRule):
         if self.exact:
             return count == self.quantity and (not self.axial or axial)
         return count >= self.quantity and (not self.axial or axial)
+
+    def classify(self, component: Component) -> typing.Hashable:
+        return component.name == self.name and component.type == self.type
     
     def to_model(
         self,
         model: cp_model.CpModel,
         neighbors: list[cp_model.IntVar],
-        components: list[Component]
+        components: ComponentIndex
     ) -> cp_model.IntVar:
-        name_to_id = dict()
-        for i, component in enumerate(components):
-            if component.name not in name_to_id:
-                name_to_id[component.name] = [i]
-            else:
-                name_to_id[component.name].append(i)
-        type_to_id = dict()
-        for i, component in enumerate(components):
-            if component.type not in type_to_id:
-                type_to_id[component.type] = [i]
-            else:
-                type_to_id[component.type].append(i)
-
-        matches = [model.NewBoolVar(str(uuid.uuid4())) for _ in neighbors]
-        for i, neighbor in enumerate(neighbors):
-            name_matches = model.NewBoolVar(str(uuid.uuid4()))
-            model.AddAllowedAssignments([neighbor], [(n,) for n in name_to_id[self.name]]).OnlyEnforceIf(name_matches)
-            model.AddForbiddenAssignments([neighbor], [(n,) for n in name_to_id[self.name]]).OnlyEnforceIf(name_matches.Not())
-            
-            type_matches = model.NewBoolVar(str(uuid.uuid4()))
-            model.AddAllowedAssignments([neighbor], [(n,) for n in type_to_id[self.type]]).OnlyEnforceIf(type_matches)
-            model.AddForbiddenAssignments([neighbor], [(n,) for n in type_to_id[self.type]]).OnlyEnforceIf(type_matches.Not())
-
-            model.AddBoolAnd([name_matches, type_matches]).OnlyEnforceIf(matches[i])
-            model.AddBoolOr([name_matches.Not(), type_matches.Not()]).OnlyEnforceIf(matches[i].Not())
-        over_threshold = model.NewBoolVar(str(uuid.uuid4()))
+        one_hot = OneHot.of(model, components)
+        matches = [one_hot.of_name(neighbor, self.name, self.type) for neighbor in neighbors]
+        over_threshold = model.NewBoolVar(core.utils.cp_utils.var_name(model))
         if self.exact:
             model.Add(sum(matches) == self.quantity).OnlyEnforceIf(over_threshold)
             model.Add(sum(matches) != self.quantity).OnlyEnforceIf(over_threshold.Not())
@@ -148,15 +146,15 @@ class NamePlacementRule(PlacementRule):
             model.Add(sum(matches) >= self.quantity).OnlyEnforceIf(over_threshold)
             model.Add(sum(matches) < self.quantity).OnlyEnforceIf(over_threshold.Not())
         
-        axials = [model.NewBoolVar(str(uuid.uuid4())) for _ in range(len(neighbors) // 2)]
+        axials = [model.NewBoolVar(core.utils.cp_utils.var_name(model)) for _ in range(len(neighbors) // 2)]
         for i in range(len(neighbors) // 2):
             model.AddBoolAnd([matches[i * 2], matches[i * 2 + 1]]).OnlyEnforceIf(axials[i])
             model.AddBoolOr([matches[i * 2].Not(), matches[i * 2 + 1].Not()]).OnlyEnforceIf(axials[i].Not())
-        axial = model.NewBoolVar(str(uuid.uuid4()))
+        axial = model.NewBoolVar(core.utils.cp_utils.var_name(model))
         model.AddBoolOr(axials).OnlyEnforceIf(axial)
         model.AddBoolAnd([axial_.Not() for axial_ in axials]).OnlyEnforceIf(axial.Not())
 
-        satisfied = model.NewBoolVar(str(uuid.uuid4()))
+        satisfied = model.NewBoolVar(core.utils.cp_utils.var_name(model))
         if self.axial:
             model.AddBoolAnd([axial, over_threshold]).OnlyEnforceIf(satisfied)
             model.AddBoolOr([axial.Not(), over_threshold.Not()]).OnlyEnforceIf(satisfied.Not())
@@ -208,25 +206,21 @@ class TypePlacementRule(PlacementRule):
         if self.exact:
             return count == self.quantity and (not self.axial or axial) and (not self.different or different_c >= math.comb(self.quantity, 2))
         return count >= self.quantity and (not self.axial or axial) and (not self.different or different_c >= math.comb(self.quantity, 2))
+
+    def classify(self, component: Component) -> typing.Hashable:
+        if self.different and component.type == self.type:
+            return component.name
+        return component.type == self.type
     
     def to_model(
         self,
         model: cp_model.CpModel,
         neighbors: list[cp_model.IntVar],
-        components: list[Component]
+        components: ComponentIndex
     ) -> cp_model.IntVar:
-        type_to_id = dict()
-        for i, component in enumerate(components):
-            if component.type not in type_to_id:
-                type_to_id[component.type] = [i]
-            else:
-                type_to_id[component.type].append(i)
-
-        matches = [model.NewBoolVar(str(uuid.uuid4())) for _ in neighbors]
-        for i, neighbor in enumerate(neighbors):
-            model.AddAllowedAssignments([neighbor], [(n,) for n in type_to_id[self.type]]).OnlyEnforceIf(matches[i])
-            model.AddForbiddenAssignments([neighbor], [(n,) for n in type_to_id[self.type]]).OnlyEnforceIf(matches[i].Not())
-        over_threshold = model.NewBoolVar(str(uuid.uuid4()))
+        one_hot = OneHot.of(model, components)
+        matches = [one_hot.of_type(neighbor, self.type) for neighbor in neighbors]
+        over_threshold = model.NewBoolVar(core.utils.cp_utils.var_name(model))
         if self.exact:
             model.Add(sum(matches) == self.quantity).OnlyEnforceIf(over_threshold)
             model.Add(sum(matches) != self.quantity).OnlyEnforceIf(over_threshold.Not())
@@ -234,30 +228,28 @@ class TypePlacementRule(PlacementRule):
             model.Add(sum(matches) >= self.quantity).OnlyEnforceIf(over_threshold)
             model.Add(sum(matches) < self.quantity).OnlyEnforceIf(over_threshold.Not())
         
-        axials = [model.NewBoolVar(str(uuid.uuid4())) for _ in range(len(neighbors) // 2)]
+        axials = [model.NewBoolVar(core.utils.cp_utils.var_name(model)) for _ in range(len(neighbors) // 2)]
         for i in range(len(neighbors) // 2):
             model.AddBoolAnd([matches[i * 2], matches[i * 2 + 1]]).OnlyEnforceIf(axials[i])
             model.AddBoolOr([matches[i * 2].Not(), matches[i * 2 + 1].Not()]).OnlyEnforceIf(axials[i].Not())
-        axial = model.NewBoolVar(str(uuid.uuid4()))
+        axial = model.NewBoolVar(core.utils.cp_utils.var_name(model))
         model.AddBoolOr(axials).OnlyEnforceIf(axial)
         model.AddBoolAnd([axial_.Not() for axial_ in axials]).OnlyEnforceIf(axial.Not())
 
-        differents = core.multi_sequence.MultiSequence([model.NewBoolVar(str(uuid.uuid4())) for _ in range(len(neighbors) ** 2)], shape=(len(neighbors), len(neighbors)))
-        for i, j in itertools.product(range(len(neighbors)), repeat=2):
-            if i == j:
-                model.Add(differents[i, j] == 0)
-            else:
-                neighbors_different = model.NewBoolVar(str(uuid.uuid4()))
-                model.Add(neighbors[i] != neighbors[j]).OnlyEnforceIf(neighbors_different)
-                model.Add(neighbors[i] == neighbors[j]).OnlyEnforceIf(neighbors_different.Not())
+        # Pairs are unordered, as in `is_satisfied`.
+        differents = []
+        for i, j in itertools.combinations(range(len(neighbors)), 2):
+            different = model.NewBoolVar(core.utils.cp_utils.var_name(model))
+            neighbors_different = one_hot.differ(neighbors[i], neighbors[j])
 
-                model.AddBoolAnd([neighbors_different, matches[i], matches[j]]).OnlyEnforceIf(differents[i, j])
-                model.AddBoolOr([neighbors_different.Not(), matches[i].Not(), matches[j].Not()]).OnlyEnforceIf(differents[i, j].Not())
-        diverse = model.NewBoolVar(str(uuid.uuid4()))
+            model.AddBoolAnd([neighbors_different, matches[i], matches[j]]).OnlyEnforceIf(different)
+            model.AddBoolOr([neighbors_different.Not(), matches[i].Not(), matches[j].Not()]).OnlyEnforceIf(different.Not())
+            differents.append(different)
+        diverse = model.NewBoolVar(core.utils.cp_utils.var_name(model))
         model.Add(sum(differents) >= math.comb(self.quantity, 2)).OnlyEnforceIf(diverse)
         model.Add(sum(differents) < math.comb(self.quantity, 2)).OnlyEnforceIf(diverse.Not())
 
-        satisfied = model.NewBoolVar(str(uuid.uuid4()))
+        satisfied = model.NewBoolVar(core.utils.cp_utils.var_name(model))
         if self.different:
             if self.axial:
                 model.AddBoolAnd([axial, over_threshold, diverse]).OnlyEnforceIf(satisfied)
@@ -296,14 +288,17 @@ class CompoundPlacementRule(PlacementRule):
         if self.mode == "AND":
             return all(satisfied)
         return any(satisfied)
+
+    def classify(self, component: Component) -> typing.Hashable:
+        return tuple(rule.classify(component) for rule in self.rules)
     
     def to_model(
         self,
         model: cp_model.CpModel,
         neighbors: list[cp_model.IntVar],
-        components: list[Component]
+        components: ComponentIndex
     ) -> cp_model.IntVar:
-        satisfied = model.NewBoolVar(str(uuid.uuid4()))
+        satisfied = model.NewBoolVar(core.utils.cp_utils.var_name(model))
         rule_satisfied = [rule.to_model(model, neighbors, components) for rule in self.rules]
         if self.mode == "AND":
             model.AddBoolAnd(rule_satisfied).OnlyEnforceIf(satisfied)
@@ -314,6 +309,85 @@ class CompoundPlacementRule(PlacementRule):
         return satisfied
 
 
+class RuleTable:
+    """A placement rule compiled into a table over the classes of the neighboring components.
+
+    The neighbors of a cell are abstracted into the classes the rule can tell apart (see `PlacementRule.classify`), and the
+    rule is evaluated once for every combination of classes the neighbors can take. Combinations are computed once per
+    set of neighbor domains and shared by every cell with the same domains.
+    """
+    def __init__(self, rule: PlacementRule, components: ComponentIndex) -> None:
+        """
+        Args:
+            rule (PlacementRule): The placement rule.
+            components (ComponentIndex): The index of the multiblock components.
+        """
+        self.rule = rule
+        classes: dict[typing.Hashable, int] = dict()
+        self.representatives: list[Component] = []
+        for component in components:
+            key = rule.classify(component)
+            if key not in classes:
+                classes[key] = len(classes)
+                self.representatives.append(component)
+        self.classes = tuple(classes[rule.classify(component)] for component in components)
+        self._rows: dict[tuple[tuple[int, ...], ...], list[tuple[int, ...]]] = dict()
+
+    def rows(self, neighbor_classes: tuple[tuple[int, ...], ...]) -> list[tuple[int, ...]]:
+        """Gets the combinations of neighbor classes that satisfy the rule.
+
+        Args:
+            neighbor_classes (tuple[tuple[int, ...], ...]): The classes each neighbor can take.
+
+        Returns:
+            list[tuple[int, ...]]: The satisfying combinations, one class per neighbor.
+        """
+        if neighbor_classes not in self._rows:
+            self._rows[neighbor_classes] = [
+                row for row in itertools.product(*neighbor_classes)
+                if self.rule.is_satisfied([self.representatives[class_] for class_ in row])
+            ]
+        return self._rows[neighbor_classes]
+
+    def to_model(
+        self,
+        model: cp_model.CpModel,
+        neighbors: list[cp_model.IntVar],
+        enforcement: cp_model.IntVar | None = None,
+        *,
+        max_size: int = core.utils.cp_utils.TABLE_SIZE
+    ) -> bool:
+        """Adds a table constraint that enforces the rule on the given neighbors.
+
+        Args:
+            model (cp_model.CpModel): The constraint programming model.
+            neighbors (list[cp_model.IntVar]): The list of neighbor variables.
+            enforcement (cp_model.IntVar | None, optional): The literal under which the rule must be satisfied. Defaults to None, which enforces the rule unconditionally.
+            max_size (int, optional): The maximum number of combinations to evaluate. Defaults to TABLE_SIZE.
+
+        Returns:
+            bool: Whether the rule was added. Nothing is added to the model if the neighbors can take more than `max_size` combinations of classes.
+        """
+        class_vars = [core.utils.cp_utils.element(model, neighbor, self.classes) for neighbor in neighbors]
+        neighbor_classes = tuple(tuple(one_hot.domain_values(class_var)) for class_var in class_vars)
+        if math.prod(len(classes) for classes in neighbor_classes) > max_size:
+            return False
+        rows = self.rows(neighbor_classes)
+        if len(rows) == math.prod(len(classes) for classes in neighbor_classes):
+            return True
+        if len(rows) == 0:
+            model.AddBoolOr([] if isinstance(enforcement, type(None)) else [enforcement.Not()])
+            return True
+        columns = [i for i, classes in enumerate(neighbor_classes) if len(classes) > 1]
+        constraint = model.AddAllowedAssignments(
+            [class_vars[i] for i in columns],
+            sorted(set(tuple(row[i] for i in columns) for row in rows))
+        )
+        if not isinstance(enforcement, type(None)):
+            constraint.OnlyEnforceIf(enforcement)
+        return True
+
+
 def parse_rule_string(s: str) -> PlacementRule:
     """Parses a rule string and returns a PlacementRule object.
 
@@ -1,6 +1,8 @@
 """Scaled multiplication and division functions for Reiuji."""
 
-import uuid
+from ... import core
+
+import math
 
 from ortools.sat.python import cp_model
 
@@ -15,8 +17,8 @@ def multiply(
         b: cp_model.IntVar | int,
         *,
         scale_factor: int = SCALE_FACTOR,
-        min_value: int = cp_model.INT32_MIN,
-        max_value: int = cp_model.INT32_MAX
+        min_value: int | None = None,
+        max_value: int | None = None
 ) -> None:
     """Multiplies two integers or integer variables and returns the scaled product.
 
@@ -25,9 +27,16 @@ def multiply(
         target (cp_model.IntVar): The variable to store the scaled product.
         a (cp_model.IntVar | int): The first integer or integer variable.
         b (cp_model.IntVar | int): The second integer or integer variable.
+        min_value (int | None, optional): The lower bound of the raw product. Defaults to the bound inferred from a and b.
+        max_value (int | None, optional): The upper bound of the raw product. Defaults to the bound inferred from a and b.
     """
-    op_id = uuid.uuid4()
-    raw_prod = model.NewIntVar(min_value, max_value, f"{op_id}_raw_prod")
+    lo, hi = core.utils.cp_utils.product_bounds(core.utils.cp_utils.expr_bounds(a), core.utils.cp_utils.expr_bounds(b))
+    domain = core.utils.cp_utils.bounded_domain(
+        lo if isinstance(min_value, type(None)) else max(lo, min_value),
+        hi if isinstance(max_value, type(None)) else min(hi, max_value)
+    )
+    core.utils.cp_utils.restrict_domain(target, *core.utils.cp_utils.quotient_bounds((domain.min(), domain.max()), (scale_factor, scale_factor)))
+    raw_prod = model.NewIntVarFromDomain(domain, core.utils.cp_utils.var_name(model, "raw_prod"))
     model.AddMultiplicationEquality(raw_prod, [a, b])
     model.AddDivisionEquality(target, raw_prod, scale_factor)
 
@@ -39,8 +48,8 @@ def divide(
         b: cp_model.IntVar | int,
         *,
         scale_factor: int = SCALE_FACTOR,
-        min_value: int = cp_model.INT32_MIN,
-        max_value: int = cp_model.INT32_MAX
+        min_value: int | None = None,
+        max_value: int | None = None
 ) -> None:
     """Divides the scaled numerator by the given divisor and returns the quotient.
 
@@ -49,19 +58,35 @@ def divide(
         target (cp_model.IntVar): The variable to store the quotient.
         a (cp_model.IntVar | int): The numerator variable or constant.
         b (cp_model.IntVar | int): The divisor variable or constant.
+        min_value (int | None, optional): The lower bound of the intermediate values. Defaults to the bounds inferred from a and b.
+        max_value (int | None, optional): The upper bound of the intermediate values. Defaults to the bounds inferred from a and b.
     """
-    op_id = uuid.uuid4()
-    scaled_numerator = model.NewIntVar(min_value, max_value, f"{op_id}_scaled_numerator")
+    lo, hi = core.utils.cp_utils.product_bounds(core.utils.cp_utils.expr_bounds(a), (scale_factor, scale_factor))
+    numerator = core.utils.cp_utils.bounded_domain(
+        lo if isinstance(min_value, type(None)) else max(lo, min_value),
+        hi if isinstance(max_value, type(None)) else min(hi, max_value)
+    )
+    numerator_bounds = (numerator.min(), numerator.max())
+    b_lo, b_hi = core.utils.cp_utils.expr_bounds(b)
+    b_pos_bounds = (1, max(b_hi, 1) if isinstance(max_value, type(None)) else max_value)
+    b_neg_bounds = (min(b_lo, -1) if isinstance(min_value, type(None)) else min_value, -1)
+    target_pos_bounds = core.utils.cp_utils.quotient_bounds(numerator_bounds, b_pos_bounds)
+    target_neg_bounds = core.utils.cp_utils.quotient_bounds(numerator_bounds, b_neg_bounds)
+    quotient = core.utils.cp_utils.quotient_bounds(numerator_bounds, (b_lo, b_hi))
+    if not isinstance(quotient, type(None)):
+        core.utils.cp_utils.restrict_domain(target, *quotient)
+
+    scaled_numerator = model.NewIntVarFromDomain(numerator, core.utils.cp_utils.var_name(model, "scaled_numerator"))
     model.AddMultiplicationEquality(scaled_numerator, [a, scale_factor])
-    is_positive = model.NewBoolVar(f"{op_id}_is_positive")
+    is_positive = model.NewBoolVar(core.utils.cp_utils.var_name(model, "is_positive"))
     model.Add(b > 0).OnlyEnforceIf(is_positive)
     model.Add(b < 0).OnlyEnforceIf(is_positive.Not())
-    b_pos = model.NewIntVar(1, max_value, f"{op_id}_b_pos")
+    b_pos = model.NewIntVar(*b_pos_bounds, core.utils.cp_utils.var_name(model, "b_pos"))
     model.Add(b_pos == b).OnlyEnforceIf(is_positive)
-    b_neg = model.NewIntVar(min_value, -1, f"{op_id}_b_neg")
+    b_neg = model.NewIntVar(*b_neg_bounds, core.utils.cp_utils.var_name(model, "b_neg"))
     model.Add(b_neg == b).OnlyEnforceIf(is_positive.Not())
-    target_pos = model.NewIntVar(min_value, max_value, f"{op_id}_target_pos")
-    target_neg = model.NewIntVar(min_value, max_value, f"{op_id}_target_neg")
+    target_pos = model.NewIntVar(*target_pos_bounds, core.utils.cp_utils.var_name(model, "target_pos"))
+    target_neg = model.NewIntVar(*target_neg_bounds, core.utils.cp_utils.var_name(model, "target_neg"))
     model.AddDivisionEquality(target_pos, scaled_numerator, b_pos)
     model.AddDivisionEquality(target_neg, scaled_numerator, b_neg)
     model.Add(target == target_pos).OnlyEnforceIf(is_positive)
@@ -74,28 +99,63 @@ def sqrt(
         a: cp_model.IntVar,
         *,
         scale_factor: int = SCALE_FACTOR,
-        min_value: int = cp_model.INT32_MIN,
-        max_value: int = cp_model.INT32_MAX,
-        iter: int = 10
+        min_value: int | None = None,
+        max_value: int | None = None,
+        iter: int = 10,
+        table_size: int = core.utils.cp_utils.TABLE_SIZE
 ) -> None:
-    """Calculates the square root of a given integer using Heron's method.
+    """Calculates the square root of a given integer.
+
+    If no bounds are given, a is nonnegative and it can take at most `table_size` values, the exact square root of each
+    value is looked up in a table. Otherwise, Heron's method is unrolled.
 
     Args:
         model (cp_model.CpModel): The constraint programming model.
         target (cp_model.IntVar): The variable to store the square root result.
         a (cp_model.IntVar): The input integer to calculate the square root of.
-        iter (int, optional): The number of iterations to perform. Defaults to 5.
+        min_value (int | None, optional): The lower bound of the intermediate values. Defaults to bounds inferred for each iteration if a is nonnegative, INT32_MIN otherwise.
+        max_value (int | None, optional): The upper bound of the intermediate values. Defaults to bounds inferred for each iteration if a is nonnegative, INT32_MAX otherwise.
+        iter (int, optional): The number of iterations to perform. Defaults to 10.
+        table_size (int, optional): The maximum size of the lookup table. Defaults to TABLE_SIZE.
     """
-    op_id = uuid.uuid4()
+    a_lo, a_hi = core.utils.cp_utils.expr_bounds(a)
+    if isinstance(min_value, type(None)) and isinstance(max_value, type(None)) and a_lo >= 0:
+        if core.utils.cp_utils.s_table(model, target, a, lambda v: math.isqrt(v * scale_factor), max_size=table_size):
+            return
+    if not isinstance(min_value, type(None)) or not isinstance(max_value, type(None)) or a_lo < 0:
+        min_value = min_value if not isinstance(min_value, type(None)) else cp_model.INT32_MIN
+        max_value = max_value if not isinstance(max_value, type(None)) else cp_model.INT32_MAX
+        guess = a
+        for i in range(iter):
+            q = model.NewIntVar(min_value, max_value, core.utils.cp_utils.var_name(model, "q"))
+            divide(model, q, a, guess, scale_factor=scale_factor, min_value=min_value, max_value=max_value)
+            s = model.NewIntVar(min_value, max_value, core.utils.cp_utils.var_name(model, "s"))
+            model.Add(s == guess + q)
+
+            new_guess = model.NewIntVar(min_value, max_value, core.utils.cp_utils.var_name(model, "guess"))
+            model.AddDivisionEquality(new_guess, s, 2)
+            guess = new_guess
+
+        model.AddAbsEquality(target, guess)
+        return
+
+    # Each guess is at least isqrt(a * scale_factor) after the first iteration, and
+    # (g + n / g) / 2 is largest at the bounds of g. A zero input cannot be divided by,
+    # so the first guess is at least 1.
+    n_lo, n_hi = a_lo * scale_factor, a_hi * scale_factor
+    g_lo, g_hi = max(a_lo, 1), max(a_hi, 1)
     guess = a
     for i in range(iter):
-        q = model.NewIntVar(min_value, max_value, f"{op_id}_q_{i}")
-        divide(model, q, a, guess, scale_factor=scale_factor, min_value=min_value, max_value=max_value)
-        s = model.NewIntVar(min_value, max_value, f"{op_id}_s_{i}")
+        q_lo, q_hi = n_lo // g_hi, n_hi // g_lo
+        q = model.NewIntVar(q_lo, q_hi, core.utils.cp_utils.var_name(model, "q"))
+        divide(model, q, a, guess, scale_factor=scale_factor)
+        s = model.NewIntVar(g_lo + q_lo, g_hi + q_hi, core.utils.cp_utils.var_name(model, "s"))
         model.Add(s == guess + q)
 
-        new_guess = model.NewIntVar(min_value, max_value, f"{op_id}_guess_{i + 1}")
+        g_lo, g_hi = max(math.isqrt(n_lo), 1), max((g_lo + n_hi // g_lo) // 2, (g_hi + n_hi // g_hi) // 2)
+        new_guess = model.NewIntVar(g_lo, g_hi, core.utils.cp_utils.var_name(model, "guess"))
         model.AddDivisionEquality(new_guess, s, 2)
         guess = new_guess
-    
+
+    core.utils.cp_utils.restrict_domain(target, g_lo, g_hi)
     model.AddAbsEquality(target, guess)
@@ -0,0 +1,164 @@
+"""Solver configuration for multiblock designers."""
+
+from ... import core
+from ...components.types import *
+
+import typing
+
+import pydantic
+
+from ortools.sat.python import cp_model
+from ortools.sat import cp_model_pb2
+
+
+class SolverConfig(pydantic.BaseModel):
+    """Configuration of the CP-SAT solver used by a designer.
+
+    Attributes:
+        num_workers (int): The number of search workers. 0 lets CP-SAT pick one per core.
+        portfolio (list[str]): The names of the CP-SAT subsolvers to run in parallel (e.g. "default_lp", "max_lp", "core", "quick_restart"). Empty to use the default portfolio.
+        random_seed (int | None): The random seed of the search.
+        deterministic (bool): Whether the timeout is measured in deterministic time instead of wall time, making runs reproducible across machines. Also switches CP-SAT to interleaved search, which runs the subsolvers in a fixed order instead of concurrently, so that runs with several workers are reproducible too; this changes the search, and is usually slower.
+        log_search_progress (bool): Whether CP-SAT should log its search progress.
+        relative_gap (float | None): Stop once the objective is proven within this fraction of the optimum (e.g. 0.01 for 1%).
+        absolute_gap (float | None): Stop once the objective is proven within this distance of the optimum.
+    """
+    num_workers: int = pydantic.Field(default=0, ge=0)
+    portfolio: list[str] = pydantic.Field(default_factory=list)
+    random_seed: int | None = None
+    deterministic: bool = False
+    log_search_progress: bool = False
+    relative_gap: float | None = pydantic.Field(default=None, ge=0.0)
+    absolute_gap: float | None = pydantic.Field(default=None, ge=0.0)
+
+    def apply(self, solver: cp_model.CpSolver, *, timeout: float | None = None) -> None:
+        """Apply the configuration to a solver.
+
+        Args:
+            solver (cp_model.CpSolver): The solver to configure.
+            timeout (float | None, optional): The time limit of the search. Defaults to None.
+
+        Raises:
+            TypeError: If the timeout is a bool.
+        """
+        if isinstance(timeout, bool):
+            raise TypeError("The timeout must be a number of seconds, not a bool.")
+        solver.parameters.num_workers = self.num_workers
+        if len(self.portfolio) > 0:
+            solver.parameters.subsolvers.extend(self.portfolio)
+        if not isinstance(self.random_seed, type(None)):
+            solver.parameters.random_seed = self.random_seed
+        if self.deterministic:
+            solver.parameters.interleave_search = True
+        solver.parameters.log_search_progress = self.log_search_progress
+        if not isinstance(self.relative_gap, type(None)):
+            solver.parameters.relative_gap_limit = self.relative_gap
+        if not isinstance(self.absolute_gap, type(None)):
+            solver.parameters.absolute_gap_limit = self.absolute_gap
+        if isinstance(timeout, (int, float)):
+            if self.deterministic:
+                solver.parameters.max_deterministic_time = timeout
+            else:
+                solver.parameters.max_time_in_seconds = timeout
+
+
+class DesignResult:
+    """The result of a design run.
+
+    Attributes:
+        status (cp_model_pb2.CpSolverStatus): The status of the solver.
+        seq (core.utils.multi_sequence.MultiSequence[Component] | None): The designed multiblock structure, or None if no design was found.
+        objective (float | None): The objective value of the design.
+        bound (float | None): The best proven bound on the objective.
+        wall_time (float): The wall time in seconds at which the design was found.
+    """
+    def __init__(
+            self,
+            status: cp_model_pb2.CpSolverStatus,
+            seq: core.utils.multi_sequence.MultiSequence[Component] | None,
+            *,
+            objective: float | None = None,
+            bound: float | None = None,
+            wall_time: float = 0.0
+    ) -> None:
+        self.status = status
+        self.seq = seq
+        self.objective = objective
+        self.bound = bound
+        self.wall_time = wall_time
+
+    @property
+    def found(self) -> bool:
+        """Whether a design was found."""
+        return self.status == cp_model.OPTIMAL or self.status == cp_model.FEASIBLE
+
+    @property
+    def absolute_gap(self) -> float | None:
+        """The distance between the objective and the best proven bound, or None if no design was found."""
+        if isinstance(self.objective, type(None)) or isinstance(self.bound, type(None)):
+            return None
+        return abs(self.objective - self.bound)
+
+    @property
+    def gap(self) -> float | None:
+        """The relative optimality gap, as defined by CP-SAT, or None if no design was found."""
+        if isinstance(self.absolute_gap, type(None)):
+            return None
+        return self.absolute_gap / max(1.0, abs(self.objective))
+
+
+class SolutionCallback(cp_model.CpSolverSolutionCallback):
+    """Solution callback that reports every improving design found by the solver."""
+    def __init__(self, seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar], decode: typing.Callable[[list[int]], core.utils.multi_sequence.MultiSequence[Component]], handler: typing.Callable[[DesignResult], None]) -> None:
+        """
+        Args:
+            seq (core.utils.multi_sequence.MultiSequence[cp_model.IntVar]): The sequence of components in the model.
+            decode (typing.Callable[[list[int]], core.utils.multi_sequence.MultiSequence[Component]]): Converts component IDs into a multiblock structure.
+            handler (typing.Callable[[DesignResult], None]): Called with each improving design.
+        """
+        super().__init__()
+        self.seq = seq
+        self.decode = decode
+        self.handler = handler
+
+    def on_solution_callback(self) -> None:
+        self.handler(DesignResult(
+            cp_model.FEASIBLE,
+            self.decode([self.Value(comp) for comp in self.seq]),
+            objective=self.ObjectiveValue(),
+            bound=self.BestObjectiveBound(),
+            wall_time=self.WallTime()
+        ))
+
+
+def objective_expr(model: cp_model.CpModel) -> tuple[cp_model.LinearExpr, float]:
+    """Get the objective of a model as a linear expression to be minimized.
+
+    Args:
+        model (cp_model.CpModel): The constraint programming model.
+
+    Returns:
+        tuple[cp_model.LinearExpr, float]: The objective as minimized internally by the solver, without its offset, and the scaling factor from this expression to the reported objective value (-1 for maximization).
+    """
+    objective = model.Proto().objective
+    terms = []
+    for ref, coeff in zip(objective.vars, objective.coeffs):
+        if ref >= 0:
+            terms.append(coeff * model.GetIntVarFromProtoIndex(ref))
+        else:
+            terms.append(-coeff * model.GetIntVarFromProtoIndex(-ref - 1))
+    return cp_model.LinearExpr.Sum(terms), objective.scaling_factor if objective.scaling_factor != 0 else 1.0
+
+
+class ParetoPoint:
+    """A non-dominated design of a two-objective search.
+
+    Attributes:
+        status (cp_model_pb2.CpSolverStatus): The status of the solver for the last pass of this point.
+        seq (core.utils.multi_sequence.MultiSequence[Component]): The designed multiblock structure.
+        objectives (tuple[float, float]): The value of the designer's own objective and of the secondary objective.
+    """
+    def __init__(self, status: cp_model_pb2.CpSolverStatus, seq: core.utils.multi_sequence.MultiSequence[Component], objectives: tuple[float, float]) -> None:
+        self.status = status
+        self.seq = seq
+        self.objectives = objectives
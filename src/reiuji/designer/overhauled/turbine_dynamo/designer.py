@@ -31,14 +31,22 @@ class TurbineDynamoDesigner(base.designer.Designer):
     def seq_shape(self) -> tuple[int, ...]:
         return self.side_length + 2, self.side_length + 2
     
-    def build_model(self, model: cp_model.CpModel, seq: core.multi_sequence.MultiSequence[cp_model.IntVar]) -> None:
-        base.constraints.CasingConstraint().to_model(model, seq, self.components)
-        base.constraints.PlacementRuleConstraint().to_model(model, seq, self.components)
-        constraints.CenteredBearingConstraint(self.shaft_width).to_model(model, seq, self.components)
+    def layout(self) -> list[base.constraints.LayoutConstraint]:
+        return [
+            base.constraints.CasingConstraint(),
+            constraints.CenteredBearingConstraint(self.shaft_width)
+        ]
+    
+    def aliases(self) -> list[base.constraints.AliasConstraint]:
+        aliases = []
         if self.x_symmetry:
-            base.constraints.SymmetryConstraint(1).to_model(model, seq, self.components)
+            aliases.append(base.constraints.SymmetryConstraint(1))
         if self.y_symmetry:
-            base.constraints.SymmetryConstraint(0).to_model(model, seq, self.components)
+            aliases.append(base.constraints.SymmetryConstraint(0))
+        return aliases
+    
+    def build_model(self, model: cp_model.CpModel, seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar]) -> None:
+        base.constraints.PlacementRuleConstraint().to_model(model, seq, self.component_index)
         for component, (min_, max_) in self.component_limits.items():
-            base.constraints.QuantityConstraint(component, max_, min_).to_model(model, seq, self.components)
-        model.Maximize(calculations.TurbineDynamoConductivity().to_model(model, seq, self.components))
+            base.constraints.QuantityConstraint(component, max_, min_).to_model(model, seq, self.component_index)
+        model.Maximize(calculations.TurbineDynamoConductivity().to_model(model, seq, self.component_index))
@@ -1,4 +1,4 @@
 """Functionality pertaining to NuclearCraft: Overhauled turbine rotors."""
 
-from . import calculations
+from . import calculations, dp
 from .designer import TurbineRotorDesigner
@@ -4,14 +4,18 @@ from .... import core
 from ....components.types import *
 from ... import base
 
-import uuid
+import math
 
 from ortools.sat.python import cp_model
 
 
+LOG_SCALE_FACTOR = base.scaled_calculations.SCALE_FACTOR
+"""The scaling factor of natural logarithms in log-space encodings."""
+
+
 class TurbineRotorExpansion(base.calculations.SequenceCalculation):
     """Calculates the expansion of a turbine rotor configuration."""
-    def __call__(self, seq: core.multi_sequence.MultiSequence[Component]) -> list[float]:
+    def __call__(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> list[float]:
         total_expansion_level = 1.0
         expansion_levels = []
         for component in seq:
@@ -23,33 +27,66 @@ class TurbineRotorExpansion(base.calculations.SequenceCalculation):
     def to_model(
             self,
             model: cp_model.CpModel,
-            seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-            components: list[Component]
+            seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+            components: base.component_index.ComponentIndex
     ) -> list[cp_model.IntVar]:
-        expansions = [round(component.expansion * base.scaled_calculations.SCALE_FACTOR) if isinstance(component, (RotorBlade, RotorStator)) else 1 * base.scaled_calculations.SCALE_FACTOR for component in components]
-        expansions_sqrt = [round(component.expansion ** (1 / 2) * base.scaled_calculations.SCALE_FACTOR) if isinstance(component, (RotorBlade, RotorStator)) else 1 * base.scaled_calculations.SCALE_FACTOR for component in components]
+        expansions = components.vector("expansion", (RotorBlade, RotorStator), scale=base.scaled_calculations.SCALE_FACTOR, default=base.scaled_calculations.SCALE_FACTOR)
+        expansions_sqrt = components.vector("expansion", (RotorBlade, RotorStator), scale=base.scaled_calculations.SCALE_FACTOR, exponent=1 / 2, default=base.scaled_calculations.SCALE_FACTOR)
 
-        expansion_levels = [model.NewIntVar(1, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in seq]
+        expansion_levels = [model.NewIntVar(1, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model)) for _ in seq]
         total_expansion_level = 1 * base.scaled_calculations.SCALE_FACTOR
         for i, expansion_level in enumerate(expansion_levels):
-            expansion = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
-            model.AddElement(seq[i], expansions, expansion)
-            expansion_sqrt = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
-            model.AddElement(seq[i], expansions_sqrt, expansion_sqrt)
+            expansion = core.utils.cp_utils.element(model, seq[i], expansions)
+            expansion_sqrt = core.utils.cp_utils.element(model, seq[i], expansions_sqrt)
 
             base.scaled_calculations.multiply(model, expansion_level, total_expansion_level, expansion_sqrt)
-            total_expansion_level_ = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+            total_expansion_level_ = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
             base.scaled_calculations.multiply(model, total_expansion_level_, total_expansion_level, expansion)
             total_expansion_level = total_expansion_level_
         return expansion_levels
 
 
+class TurbineRotorLogExpansion(base.calculations.SequenceCalculation):
+    """Calculates the natural logarithm of the expansion of a turbine rotor configuration.
+
+    In log space the cumulative expansion is a prefix sum, so the model is linear apart from the element lookups.
+    """
+    def __call__(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> list[float]:
+        return [math.log(expansion_level) for expansion_level in TurbineRotorExpansion()(seq)]
+
+    def to_model(
+            self,
+            model: cp_model.CpModel,
+            seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+            components: base.component_index.ComponentIndex
+    ) -> list[cp_model.IntVar]:
+        expansions = components.vector("expansion", (RotorBlade, RotorStator), default=1.0)
+        log_expansions = tuple(round(math.log(expansion) * LOG_SCALE_FACTOR) for expansion in expansions)
+        log_expansions_sqrt = tuple(round(math.log(expansion) / 2 * LOG_SCALE_FACTOR) for expansion in expansions)
+
+        expansion_levels = []
+        total_expansion_level = 0
+        for component in seq:
+            expansion_level = total_expansion_level + core.utils.cp_utils.element(model, component, log_expansions_sqrt)
+            expansion_level_ = model.NewIntVar(*core.utils.cp_utils.expr_bounds(expansion_level), core.utils.cp_utils.var_name(model, "log_level"))
+            model.Add(expansion_level_ == expansion_level)
+            expansion_levels.append(expansion_level_)
+            total_expansion_level = total_expansion_level + core.utils.cp_utils.element(model, component, log_expansions)
+        return expansion_levels
+
+
 class TurbineRotorEfficiency(base.calculations.Calculation):
     """Calculates the efficiency of a turbine rotor configuration."""
-    def __init__(self, optimal_expansion: float) -> None:
+    def __init__(self, optimal_expansion: float, *, log_space: bool = False) -> None:
+        """
+        Args:
+            optimal_expansion (float): The optimal expansion of the rotor.
+            log_space (bool, optional): Whether to encode the expansion levels in log space, where the ratio between the ideal and actual expansion levels becomes a lookup on their difference. Defaults to False.
+        """
         self.optimal_expansion = optimal_expansion
+        self.log_space = log_space
     
-    def __call__(self, seq: core.multi_sequence.MultiSequence[Component]) -> float:
+    def __call__(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> float:
         efficiency = 0.0
         n_blades = 0
         expansions = TurbineRotorExpansion()(seq)
@@ -63,48 +100,84 @@ class TurbineRotorEfficiency(base.calculations.Calculation):
     def to_model(
             self,
             model: cp_model.CpModel,
-            seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-            components: list[Component]
+            seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+            components: base.component_index.ComponentIndex
     ) -> cp_model.IntVar:
-        type_to_id = dict()
-        for i, component in enumerate(components):
-            if component.type not in type_to_id:
-                type_to_id[component.type] =  [i]
-            else:
-                type_to_id[component.type].append(i)
-        efficiencies = [round(component.efficiency * base.scaled_calculations.SCALE_FACTOR) if isinstance(component, RotorBlade) else 0 for component in components]
+        if self.log_space:
+            return self._to_log_model(model, seq, components)
+        one_hot = base.one_hot.OneHot.of(model, components)
+        efficiencies = components.vector("efficiency", RotorBlade, scale=base.scaled_calculations.SCALE_FACTOR)
         expansions = TurbineRotorExpansion().to_model(model, seq, components)
         
-        is_blade = [model.NewBoolVar(str(uuid.uuid4())) for _ in seq]
-        for i, component in enumerate(seq):
-            model.AddAllowedAssignments([seq[i]], [(blade_id,) for blade_id in type_to_id["blade"]]).OnlyEnforceIf(is_blade[i])
-            model.AddForbiddenAssignments([seq[i]], [(blade_id,) for blade_id in type_to_id["blade"]]).OnlyEnforceIf(is_blade[i].Not())
+        is_blade = [one_hot.of_type(component, "blade") for component in seq]
         
         efficiency = 0
         for i, component in enumerate(seq):
             ideal_expansion = round(self.optimal_expansion ** ((i + 0.5) / len(seq)) * base.scaled_calculations.SCALE_FACTOR)
-            raw_efficiency = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
-            model.AddElement(seq[i], efficiencies, raw_efficiency)
+            raw_efficiency = core.utils.cp_utils.element(model, seq[i], efficiencies)
 
-            multiplier_a = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+            multiplier_a = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
             base.scaled_calculations.divide(model, multiplier_a, ideal_expansion, expansions[i])
-            multiplier_b = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+            multiplier_b = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
             base.scaled_calculations.divide(model, multiplier_b, expansions[i], ideal_expansion)
-            multiplier = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+            multiplier = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
             model.AddMinEquality(multiplier, [multiplier_a, multiplier_b])
 
-            effective_efficiency = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+            effective_efficiency = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
             base.scaled_calculations.multiply(model, effective_efficiency, raw_efficiency, multiplier)
 
-            efficiency_ = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+            efficiency_ = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
             model.Add(efficiency_ == efficiency + effective_efficiency).OnlyEnforceIf(is_blade[i])
             model.Add(efficiency_ == efficiency).OnlyEnforceIf(is_blade[i].Not())
             efficiency = efficiency_
         
-        n_blades = model.NewIntVar(1, len(seq), str(uuid.uuid4()))
+        n_blades = model.NewIntVar(1, len(seq), core.utils.cp_utils.var_name(model))
         model.Add(n_blades == sum(is_blade))
 
-        final_efficiency = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        final_efficiency = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.AddDivisionEquality(final_efficiency, efficiency, n_blades)
         return final_efficiency
 
+    def _to_log_model(
+            self,
+            model: cp_model.CpModel,
+            seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+            components: base.component_index.ComponentIndex
+    ) -> cp_model.IntVar:
+        one_hot = base.one_hot.OneHot.of(model, components)
+        efficiencies = components.vector("efficiency", RotorBlade, scale=base.scaled_calculations.SCALE_FACTOR)
+        expansions = TurbineRotorLogExpansion().to_model(model, seq, components)
+
+        # min(ideal / actual, actual / ideal) = exp(-|log(actual) - log(ideal)|), which rounds to 0 past max_distance.
+        max_distance = math.ceil(math.log(2 * base.scaled_calculations.SCALE_FACTOR) * LOG_SCALE_FACTOR)
+        multipliers = tuple(round(math.exp(-distance / LOG_SCALE_FACTOR) * base.scaled_calculations.SCALE_FACTOR) for distance in range(max_distance + 1))
+        blade_ids = components.ids_of_type("blade")
+
+        blade_efficiencies = []
+        for i, component in enumerate(seq):
+            ideal_expansion = round(math.log(self.optimal_expansion) * (i + 0.5) / len(seq) * LOG_SCALE_FACTOR)
+            lo, hi = core.utils.cp_utils.expr_bounds(expansions[i] - ideal_expansion)
+            distance = model.NewIntVar(0, max(abs(lo), abs(hi)), core.utils.cp_utils.var_name(model, "log_distance"))
+            model.AddAbsEquality(distance, expansions[i] - ideal_expansion)
+            capped_distance = model.NewIntVar(0, min(max(abs(lo), abs(hi)), max_distance), core.utils.cp_utils.var_name(model, "log_distance"))
+            model.AddMinEquality(capped_distance, [distance, max_distance])
+            multiplier = model.NewIntVar(0, base.scaled_calculations.SCALE_FACTOR, core.utils.cp_utils.var_name(model, "multiplier"))
+            core.utils.cp_utils.s_table(model, multiplier, capped_distance, lambda distance: multipliers[distance], max_size=max_distance + 1)
+
+            for blade_id in blade_ids:
+                is_blade = one_hot.literal(component, blade_id)
+                blade_multiplier = model.NewIntVar(0, base.scaled_calculations.SCALE_FACTOR, core.utils.cp_utils.var_name(model))
+                model.Add(blade_multiplier == multiplier).OnlyEnforceIf(is_blade)
+                model.Add(blade_multiplier == 0).OnlyEnforceIf(is_blade.Not())
+                blade_efficiencies.append(efficiencies[blade_id] * blade_multiplier)
+
+        n_blades = model.NewIntVar(1, len(seq), core.utils.cp_utils.var_name(model))
+        model.Add(n_blades == sum(one_hot.of_type(component, "blade") for component in seq))
+
+        efficiency = model.NewIntVar(*core.utils.cp_utils.expr_bounds(sum(blade_efficiencies)), core.utils.cp_utils.var_name(model))
+        model.Add(efficiency == sum(blade_efficiencies))
+        scaled_n_blades = model.NewIntVar(base.scaled_calculations.SCALE_FACTOR, len(seq) * base.scaled_calculations.SCALE_FACTOR, core.utils.cp_utils.var_name(model))
+        model.Add(scaled_n_blades == n_blades * base.scaled_calculations.SCALE_FACTOR)
+        final_efficiency = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
+        model.AddDivisionEquality(final_efficiency, efficiency, scaled_n_blades)
+        return final_efficiency
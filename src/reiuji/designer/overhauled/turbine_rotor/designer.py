@@ -5,6 +5,11 @@ from ....components.types import *
 from ....components.defaults import OVERHAULED_TURBINE_ROTOR_COMPONENTS
 from ... import base
 from . import calculations
+from .dp import TurbineRotorDP
+
+import time
+import typing
+import warnings
 
 from ortools.sat.python import cp_model
 
@@ -16,18 +21,50 @@ class TurbineRotorDesigner(base.designer.Designer):
             optimal_expansion: float,
             *,
             components: list[Component] | None = None,
-            component_limits: dict[str, tuple[int | None, int | None]] | None = None
+            component_limits: dict[str, tuple[int | None, int | None]] | None = None,
+            engine: typing.Literal["cp", "dp"] = "cp",
+            log_space: bool = False
     ) -> None:
+        """
+        Args:
+            length (int): The length of the rotor.
+            optimal_expansion (float): The optimal expansion of the rotor.
+            components (list[Component] | None, optional): The rotor components. Defaults to None.
+            component_limits (dict[str, tuple[int | None, int | None]] | None, optional): The minimum and maximum quantity of components, by full name. Defaults to None.
+            engine (typing.Literal["cp", "dp"], optional): How `solve` and `design` search for rotors: CP-SAT ("cp"), or exact dynamic programming over the positions of the rotor ("dp"), which only places blades and stators. The DP engine cuts its search short at the timeout and ignores hints and the solver configuration. Defaults to "cp".
+            log_space (bool, optional): Whether the CP model encodes the expansion levels in log space. Defaults to False.
+        """
         super().__init__(components=components if not isinstance(components, type(None)) else OVERHAULED_TURBINE_ROTOR_COMPONENTS)
         self.length = length
         self.optimal_expansion = optimal_expansion
         self.component_limits = component_limits if not isinstance(component_limits, type(None)) else dict()
+        self.engine = engine
+        self.log_space = log_space
     
     @property
     def seq_shape(self) -> tuple[int, ...]:
         return (self.length,)
     
-    def build_model(self, model: cp_model.CpModel, seq: core.multi_sequence.MultiSequence[cp_model.IntVar]) -> None:
+    def build_model(self, model: cp_model.CpModel, seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar]) -> None:
         for component, (min_, max_) in self.component_limits.items():
-            base.constraints.QuantityConstraint(component, max_, min_).to_model(model, seq, self.components)
-        model.Maximize(calculations.TurbineRotorEfficiency(self.optimal_expansion).to_model(model, seq, self.components))
+            base.constraints.QuantityConstraint(component, max_, min_).to_model(model, seq, self.component_index)
+        model.Maximize(calculations.TurbineRotorEfficiency(self.optimal_expansion, log_space=self.log_space).to_model(model, seq, self.component_index))
+
+    def solve(self, *, timeout: float | None = None, config: base.solver.SolverConfig | None = None, hint: core.utils.multi_sequence.MultiSequence[Component | None] | None = None, cache: base.cache.ModelCache | None = None) -> base.solver.DesignResult:
+        if self.engine == "cp":
+            return super().solve(timeout=timeout, config=config, hint=hint, cache=cache)
+        if not isinstance(hint, type(None)):
+            warnings.warn("The DP engine does not use hints; the hint is ignored.", stacklevel=2)
+        # Batch runs set the number of workers of every designer, which the DP engine can safely ignore.
+        if not isinstance(config, type(None)) and config.model_copy(update={"num_workers": 0}) != base.solver.SolverConfig():
+            warnings.warn("The DP engine does not use the solver configuration; it is ignored.", stacklevel=2)
+        start = time.perf_counter()
+        deadline = None if isinstance(timeout, type(None)) else start + timeout
+        values, exhaustive = TurbineRotorDP(self.length, self.optimal_expansion, self.component_index, component_limits=self.component_limits).solve(deadline=deadline)
+        if isinstance(values, type(None)):
+            return base.solver.DesignResult(cp_model.INFEASIBLE if exhaustive else cp_model.UNKNOWN, None, wall_time=time.perf_counter() - start)
+        seq = self.decode(values)
+        objective = calculations.TurbineRotorEfficiency(self.optimal_expansion)(seq) * base.scaled_calculations.SCALE_FACTOR
+        if not exhaustive:
+            return base.solver.DesignResult(cp_model.FEASIBLE, seq, objective=objective, wall_time=time.perf_counter() - start)
+        return base.solver.DesignResult(cp_model.OPTIMAL, seq, objective=objective, bound=objective, wall_time=time.perf_counter() - start)
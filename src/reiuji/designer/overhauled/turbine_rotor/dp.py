@@ -0,0 +1,116 @@
+"""Dynamic programming solver for NuclearCraft: Overhauled turbine rotors."""
+
+from .... import core
+from ....components.types import *
+from ... import base
+from . import calculations
+
+import math
+import time
+import heapq
+
+
+class TurbineRotorDP:
+    """Designs turbine rotors by dynamic programming over the positions of the rotor.
+
+    The expansion level of a position, and therefore the efficiency of a blade placed there, only depends on the component
+    at that position and on the product of the expansions before it. The search keeps the best partial rotor for each state
+    (cumulative expansion, number of blades, counts of the limited components), which is exact as long as distinct
+    cumulative expansions fall into distinct buckets. The best rotors found are rescored with `TurbineRotorEfficiency`.
+
+    The number of states can grow combinatorially with the length of the rotor. Past a deadline, each remaining position
+    only extends the best `candidates` states of the previous one, so that the search still ends with a rotor, but no
+    longer with the best one.
+    """
+    def __init__(
+            self,
+            length: int,
+            optimal_expansion: float,
+            components: base.component_index.ComponentIndex,
+            *,
+            component_limits: dict[str, tuple[int | None, int | None]] | None = None,
+            resolution: float = 1e-9,
+            candidates: int = 16
+    ) -> None:
+        """
+        Args:
+            length (int): The length of the rotor.
+            optimal_expansion (float): The optimal expansion of the rotor.
+            components (base.component_index.ComponentIndex): The index of the rotor components. Only blades and stators are placed.
+            component_limits (dict[str, tuple[int | None, int | None]] | None, optional): The minimum and maximum quantity of components, by full name. Defaults to None.
+            resolution (float, optional): The width of the cumulative expansion buckets, in log space. Defaults to 1e-9.
+            candidates (int, optional): The number of best rotors rescored exactly. Defaults to 16.
+        """
+        self.length = length
+        self.optimal_expansion = optimal_expansion
+        self.components = components
+        self.component_limits = component_limits if not isinstance(component_limits, type(None)) else dict()
+        self.resolution = resolution
+        self.candidates = candidates
+
+    def solve(self, *, deadline: float | None = None) -> tuple[list[int] | None, bool]:
+        """Find the rotor with the highest efficiency.
+
+        Args:
+            deadline (float | None, optional): The `time.perf_counter` value past which the search is cut short. Defaults to None.
+
+        Returns:
+            tuple[list[int] | None, bool]: The component ID of each position, or None if no rotor was found, and whether the search was exhaustive.
+        """
+        ids = [i for i, component in enumerate(self.components) if isinstance(component, (RotorBlade, RotorStator))]
+        limited = [self.components.id_of_full_name(full_name) for full_name in self.component_limits]
+        minima = [min_ if isinstance(min_, int) else 0 for min_, _ in self.component_limits.values()]
+        maxima = [max_ for _, max_ in self.component_limits.values()]
+        ideals = [self.optimal_expansion ** ((i + 0.5) / self.length) for i in range(self.length)]
+
+        # State: (expansion bucket, number of blades, counts of the limited components).
+        # Value: (sum of blade efficiencies, cumulative expansion, previous state, component ID).
+        layers: list[dict[tuple, tuple[float, float, tuple | None, int | None]]] = [{(0, 0, (0,) * len(limited)): (0.0, 1.0, None, None)}]
+        exhaustive = True
+        for position in range(self.length):
+            remaining = self.length - position - 1
+            layer: dict[tuple, tuple[float, float, tuple | None, int | None]] = dict()
+            states = layers[-1].items()
+            if not exhaustive:
+                states = heapq.nlargest(self.candidates, states, key=lambda item: item[1][0])
+            for state, (score, expansion, _, _) in states:
+                if exhaustive and not isinstance(deadline, type(None)) and len(layer) > 0 and time.perf_counter() > deadline:
+                    exhaustive = False
+                    break
+                _, n_blades, counts = state
+                for component_id in ids:
+                    component = self.components[component_id]
+                    counts_ = tuple(count + (limited_id == component_id) for limited_id, count in zip(limited, counts))
+                    if any(not isinstance(max_, type(None)) and count > max_ for count, max_ in zip(counts_, maxima)):
+                        continue
+                    if sum(max(min_ - count, 0) for count, min_ in zip(counts_, minima)) > remaining:
+                        continue
+                    score_ = score
+                    n_blades_ = n_blades
+                    if isinstance(component, RotorBlade):
+                        level = expansion * component.expansion ** (1 / 2)
+                        score_ += component.efficiency * min(ideals[position] / level, level / ideals[position])
+                        n_blades_ += 1
+                    expansion_ = expansion * component.expansion
+                    state_ = (round(math.log(expansion_) / self.resolution), n_blades_, counts_)
+                    if state_ not in layer or layer[state_][0] < score_:
+                        layer[state_] = (score_, expansion_, state, component_id)
+            layers.append(layer)
+
+        finals = [(score / state[1], state) for state, (score, _, _, _) in layers[-1].items() if state[1] > 0]
+        if len(finals) == 0:
+            return None, exhaustive
+        best: tuple[float, list[int]] | None = None
+        efficiency = calculations.TurbineRotorEfficiency(self.optimal_expansion)
+        for _, state in heapq.nlargest(self.candidates, finals, key=lambda final: final[0]):
+            values = []
+            for layer in reversed(layers[1:]):
+                _, _, state_, component_id = layer[state]
+                values.append(component_id)
+                state = state_
+            values.reverse()
+            seq = core.utils.multi_sequence.MultiSequence(seq=[self.components[value] for value in values], shape=(self.length,))
+            score = efficiency(seq)
+            if isinstance(best, type(None)) or score > best[0]:
+                best = (score, values)
+        return best[1], exhaustive
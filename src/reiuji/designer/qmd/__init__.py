@@ -4,3 +4,4 @@ from . import linear
 from . import synchrotron
 from . import decelerator
 from . import nucleosynthesis
+from . import sweep
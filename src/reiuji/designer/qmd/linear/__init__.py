@@ -1,5 +1,7 @@
 """Functionality pertaining to linear accelerators in QMD."""
 
+from . import catalog
 from . import calculations
+from . import dp
 from . import constraints
 from .designer import LinearAcceleratorDesigner
@@ -3,15 +3,17 @@
 from .... import core
 from ....components.types import *
 from ... import base
-
-import uuid
+from .catalog import SliceCatalog, lookup
 
 from ortools.sat.python import cp_model
 
 
 class TotalHeatingRate(base.calculations.Calculation):
     """Calculates the total heating rate of a linear accelerator configuration."""
-    def __call__(self, seq: core.multi_sequence.MultiSequence[Component]) -> float:
+    def __init__(self, catalog: SliceCatalog | None = None) -> None:
+        self.catalog = catalog
+
+    def __call__(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> float:
         total_heating_rate = 0
         for x in range(seq.shape[0]):
             if isinstance(seq[x, 1, 2], (RFCavity, AcceleratorMagnet)):
@@ -21,29 +23,23 @@ class TotalHeatingRate(base.calculations.Calculation):
     def to_model(
             self,
             model: cp_model.CpModel,
-            seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-            components: list[Component]
+            seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+            components: base.component_index.ComponentIndex
     ) -> cp_model.IntVar:
-        type_to_id = dict()
-        for i, component in enumerate(components):
-            if component.type not in type_to_id:
-                type_to_id[component.type] = [i]
-            else:
-                type_to_id[component.type].append(i)
-        heating_rates = [component.heat if isinstance(component, (RFCavity, AcceleratorMagnet)) else 0 for component in components]
-
-        heat_contrib = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[0])]
+        heating_rates = components.vector("heat", (RFCavity, AcceleratorMagnet))
+
+        heat_contrib = []
         for x in range(seq.shape[0]):
-            model.AddElement(seq[x, 1, 2], heating_rates, heat_contrib[x])
+            heat_contrib.append(lookup(model, seq, x, (1, 2), heating_rates, self.catalog))
         
-        total_heating_rate = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        total_heating_rate = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.Add(total_heating_rate == sum(heat_contrib))
         return total_heating_rate
 
 
 class TotalCoolingRate(base.calculations.Calculation):
     """Calculates the total cooling rate of a linear accelerator configuration."""
-    def __call__(self, seq: core.multi_sequence.MultiSequence[Component]) -> float:
+    def __call__(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> float:
         total_cooling_rate = 0
         for i, component in enumerate(seq):
             if isinstance(component, AcceleratorCooler):
@@ -53,22 +49,16 @@ class TotalCoolingRate(base.calculations.Calculation):
     def to_model(
             self,
             model: cp_model.CpModel,
-            seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-            components: list[Component]
+            seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+            components: base.component_index.ComponentIndex
     ) -> cp_model.IntVar:
-        type_to_id = dict()
-        for i, component in enumerate(components):
-            if component.type not in type_to_id:
-                type_to_id[component.type] = [i]
-            else:
-                type_to_id[component.type].append(i)
-        cooling_rates = [component.cooling if isinstance(component, AcceleratorCooler) else 0 for component in components]
-
-        cool_contrib = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in seq]
+        cooling_rates = components.vector("cooling", AcceleratorCooler)
+
+        cool_contrib = []
         for i, component in enumerate(seq):
-            model.AddElement(seq[i], cooling_rates, cool_contrib[i])
+            cool_contrib.append(core.utils.cp_utils.element(model, seq[i], cooling_rates))
 
-        total_cooling_rate = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        total_cooling_rate = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.Add(total_cooling_rate == sum(cool_contrib))
 
         return total_cooling_rate
@@ -76,7 +66,10 @@ class TotalCoolingRate(base.calculations.Calculation):
 
 class TotalVoltage(base.calculations.Calculation):
     """Calculates the total voltage of a linear accelerator configuration."""
-    def __call__(self, seq: core.multi_sequence.MultiSequence[Component]) -> float:
+    def __init__(self, catalog: SliceCatalog | None = None) -> None:
+        self.catalog = catalog
+
+    def __call__(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> float:
         total_voltage = 0
         for x in range(seq.shape[0]):
             if isinstance(seq[x, 1, 2], RFCavity):
@@ -86,34 +79,29 @@ class TotalVoltage(base.calculations.Calculation):
     def to_model(
             self,
             model: cp_model.CpModel,
-            seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-            components: list[Component]
+            seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+            components: base.component_index.ComponentIndex
     ) -> cp_model.IntVar:
-        type_to_id = dict()
-        for i, component in enumerate(components):
-            if component.type not in type_to_id:
-                type_to_id[component.type] = [i]
-            else:
-                type_to_id[component.type].append(i)
-        voltages = [component.voltage if isinstance(component, RFCavity) else 0 for component in components]
-
-        voltage_contrib = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[0])]
+        voltages = components.vector("voltage", RFCavity)
+
+        voltage_contrib = []
         for x in range(seq.shape[0]):
-            model.AddElement(seq[x, 1, 2], voltages, voltage_contrib[x])
+            voltage_contrib.append(lookup(model, seq, x, (1, 2), voltages, self.catalog))
         
-        total_voltage = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        total_voltage = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.Add(total_voltage == sum(voltage_contrib))
         return total_voltage
 
 
 class BeamFocus(base.calculations.Calculation):
-    def __init__(self, charge: float, beam_strength: int, scaling_factor: int = 10000, initial_focus: float = 0.0) -> None:
+    def __init__(self, charge: float, beam_strength: int, scaling_factor: int = 10000, initial_focus: float = 0.0, catalog: SliceCatalog | None = None) -> None:
         self.charge = charge
         self.beam_strength = beam_strength
         self.scaling_factor = scaling_factor
         self.initial_focus = initial_focus
+        self.catalog = catalog
     
-    def __call__(self, seq: core.multi_sequence.MultiSequence[Component]) -> float:
+    def __call__(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> float:
         focus_loss = 0.0
         focus_gain = 0.0
         for x in range(seq.shape[0]):
@@ -126,44 +114,39 @@ class BeamFocus(base.calculations.Calculation):
     def to_model(
             self,
             model: cp_model.CpModel,
-            seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-            components: list[Component]
+            seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+            components: base.component_index.ComponentIndex
     ) -> cp_model.IntVar:
-        type_to_id = dict()
-        for i, component in enumerate(components):
-            if component.type not in type_to_id:
-                type_to_id[component.type] = [i]
-            else:
-                type_to_id[component.type].append(i)
-        strengths = [round(component.strength * base.scaled_calculations.SCALE_FACTOR) if isinstance(component, AcceleratorMagnet) else 0 for component in components]
-        attenuations = [round(component.attenuation * base.scaled_calculations.SCALE_FACTOR) if isinstance(component, BeamPipe) else 0 for component in components]
+        strengths = components.vector("strength", AcceleratorMagnet, scale=base.scaled_calculations.SCALE_FACTOR)
+        attenuations = components.vector("attenuation", BeamPipe, scale=base.scaled_calculations.SCALE_FACTOR)
         charge = round(abs(self.charge) * base.scaled_calculations.SCALE_FACTOR)
         loss_factor = round((1 + abs(self.charge) * (self.beam_strength / self.scaling_factor) ** (1 / 2)) * base.scaled_calculations.SCALE_FACTOR)
 
-        focus_gain_contrib = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[0])]
-        focus_loss_contrib = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[0])]
+        focus_gain_contrib = [model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model)) for _ in range(seq.shape[0])]
+        focus_loss_contrib = [model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model)) for _ in range(seq.shape[0])]
         for x in range(seq.shape[0]):
-            strength_i = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
-            model.AddElement(seq[x, 1, 2], strengths, strength_i)
+            strength_i = lookup(model, seq, x, (1, 2), strengths, self.catalog)
             base.scaled_calculations.multiply(model, focus_gain_contrib[x], charge, strength_i)
 
-            attenuation_i = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
-            model.AddElement(seq[x, 2, 2], attenuations, attenuation_i)
+            attenuation_i = lookup(model, seq, x, (2, 2), attenuations, self.catalog)
             base.scaled_calculations.multiply(model, focus_loss_contrib[x], attenuation_i, loss_factor)
         
-        focus_gain = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
-        focus_loss = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        focus_gain = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
+        focus_loss = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.Add(focus_gain == sum(focus_gain_contrib))
         model.Add(focus_loss == sum(focus_loss_contrib))
 
         initial_focus = round(self.initial_focus * base.scaled_calculations.SCALE_FACTOR)   
-        final_focus = model.NewIntVar(cp_model.INT32_MIN, cp_model.INT32_MAX, str(uuid.uuid4()))
+        final_focus = model.NewIntVar(cp_model.INT32_MIN, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.Add(final_focus == initial_focus + focus_gain - focus_loss)
         return final_focus
 
 
 class PowerRequirement(base.calculations.Calculation):
-    def __call__(self, seq: core.multi_sequence.MultiSequence[Component]) -> float:
+    def __init__(self, catalog: SliceCatalog | None = None) -> None:
+        self.catalog = catalog
+
+    def __call__(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> float:
         efficiency = 0.0
         parts = 0
         raw_power = 0
@@ -177,41 +160,35 @@ class PowerRequirement(base.calculations.Calculation):
     def to_model(
             self,
             model: cp_model.CpModel,
-            seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-            components: list[Component]
+            seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+            components: base.component_index.ComponentIndex
     ) -> cp_model.IntVar:
-        type_to_id = dict()
-        for i, component in enumerate(components):
-            if component.type not in type_to_id:
-                type_to_id[component.type] = [i]
-            else:
-                type_to_id[component.type].append(i)
-        powers = [component.power if isinstance(component, (RFCavity, AcceleratorMagnet)) else 0 for component in components]
-        efficiencies = [round(component.efficiency * base.scaled_calculations.SCALE_FACTOR) if isinstance(component, (RFCavity, AcceleratorMagnet)) else 0 for component in components]
-        is_part = [1 if isinstance(component, (RFCavity, AcceleratorMagnet)) else 0 for component in components]
-
-        raw_power_contrib = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[0])]
-        efficiency_contrib = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[0])]
-        is_part_ = [model.NewBoolVar(str(uuid.uuid4())) for _ in range(seq.shape[0])]
+        powers = components.vector("power", (RFCavity, AcceleratorMagnet))
+        efficiencies = components.vector("efficiency", (RFCavity, AcceleratorMagnet), scale=base.scaled_calculations.SCALE_FACTOR)
+        is_part = components.mask((RFCavity, AcceleratorMagnet))
+
+        raw_power_contrib = []
+        efficiency_contrib = []
+        is_part_ = []
         for x in range(seq.shape[0]):
-            model.AddElement(seq[x, 1, 2], powers, raw_power_contrib[x])
-            model.AddElement(seq[x, 1, 2], efficiencies, efficiency_contrib[x])
-            model.AddElement(seq[x, 1, 2], is_part, is_part_[x])
+            raw_power_contrib.append(lookup(model, seq, x, (1, 2), powers, self.catalog))
+            efficiency_contrib.append(lookup(model, seq, x, (1, 2), efficiencies, self.catalog))
+            is_part_.append(lookup(model, seq, x, (1, 2), is_part, self.catalog))
         
-        raw_power = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
-        efficiency = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
-        parts = model.NewIntVar(1, cp_model.INT32_MAX, str(uuid.uuid4()))
+        raw_power = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
+        efficiency = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
+        parts = model.NewIntVar(1, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.Add(raw_power == sum(raw_power_contrib))
         model.Add(efficiency == sum(efficiency_contrib))
         model.Add(parts == sum(is_part_))
 
-        reduced_efficiency = model.NewIntVar(1, cp_model.INT32_MAX, str(uuid.uuid4()))
+        reduced_efficiency = model.NewIntVar(1, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.AddDivisionEquality(reduced_efficiency, efficiency, parts)
 
-        raw_power_ = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        raw_power_ = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.AddMultiplicationEquality(raw_power_, raw_power, base.scaled_calculations.SCALE_FACTOR)
 
-        power_requirement = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        power_requirement = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.AddDivisionEquality(power_requirement, raw_power_, reduced_efficiency)
 
         return power_requirement
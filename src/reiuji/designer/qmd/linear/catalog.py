@@ -0,0 +1,227 @@
+"""Catalog of the valid cross-sections of QMD linear accelerators."""
+
+from .... import core
+from ....components.types import *
+from ... import base
+
+import typing
+import weakref
+
+import pydantic
+
+from ortools.sat.python import cp_model
+
+
+INTERIOR: tuple[tuple[int, int], ...] = tuple((y, z) for y in range(1, 4) for z in range(1, 4))
+"""The (y, z) positions inside the casing of a cross-section, in the order of `SlicePattern.cells`."""
+RING: tuple[tuple[int, int], ...] = tuple(position for position in INTERIOR if position != (2, 2))
+"""The positions around the beam, which hold either a single cavity or nothing of the kind."""
+CROSS: tuple[tuple[int, int], ...] = ((1, 2), (2, 1), (2, 3), (3, 2))
+"""The positions of the ring that hold the magnet of a magnet cross-section."""
+
+
+class SlicePattern(pydantic.BaseModel):
+    """A valid cross-section of a linear accelerator.
+
+    A pattern fixes what determines the beam: the cavity or magnet around the beam, if any, and the beam pipe. The other
+    cells of the ring are left to the coolers, and only restricted to the components that their in-slice neighbors allow.
+
+    Attributes:
+        kind (typing.Literal["cavity", "magnet", "empty"]): What surrounds the beam.
+        cells (tuple[tuple[int, ...], ...]): The IDs of the components each interior position can hold, in the order of `INTERIOR`.
+    """
+    kind: typing.Literal["cavity", "magnet", "empty"]
+    cells: tuple[tuple[int, ...], ...]
+
+    def at(self, position: tuple[int, int]) -> tuple[int, ...]:
+        """Get the IDs of the components a position can hold.
+
+        Args:
+            position (tuple[int, int]): The (y, z) position, inside the casing.
+
+        Returns:
+            tuple[int, ...]: The IDs of the components.
+        """
+        return self.cells[INTERIOR.index(position)]
+
+
+class SliceCatalog(typing.Sequence[SlicePattern]):
+    """The valid cross-sections of a linear accelerator, enumerated once per component list and layout.
+
+    Each x-slice of a model built with a catalog gets a single choice variable over the patterns. The interior cells of
+    the slice are linked to it, and the beam calculations look their coefficients up by pattern instead of by cell.
+    Designers enumerate their catalog once, see `LinearAcceleratorDesigner.slice_catalog`.
+    """
+    _choices: "weakref.WeakKeyDictionary[cp_model.CpModel, dict[tuple[int, ...], list[cp_model.IntVar | None]]]" = weakref.WeakKeyDictionary()
+
+    def __init__(self, components: base.component_index.ComponentIndex, domains: core.utils.multi_sequence.MultiSequence[set[int]]) -> None:
+        """
+        Args:
+            components (base.component_index.ComponentIndex): The index of the multiblock components.
+            domains (core.utils.multi_sequence.MultiSequence[set[int]]): The domain of each cell under the layout constraints.
+        """
+        if domains.shape[1] != 5 or domains.shape[2] != 5:
+            raise ValueError("SliceCatalog requires a Nx5x5 sequence.")
+        self.components = components
+        # Every interior slice has the same domains, and the slices at both ends are casing.
+        inner = {(y, z): set(domains[1, y, z]) for y in range(5) for z in range(5)}
+        ends = {(y, z): set(domains[0, y, z]) | set(domains[domains.shape[0] - 1, y, z]) for y in range(5) for z in range(5)}
+        cavity_ids = set(components.ids_of_type("cavity"))
+        magnet_ids = set(components.ids_of_type("magnet"))
+
+        candidates: list[tuple[str, dict[tuple[int, int], set[int]]]] = []
+        for beam_id in sorted(inner[2, 2]):
+            for cavity_id in sorted(cavity_ids):
+                if all(cavity_id in inner[position] for position in RING):
+                    candidates.append(("cavity", {position: {cavity_id} for position in RING} | {(2, 2): {beam_id}}))
+            for magnet_id in sorted(magnet_ids):
+                if all(magnet_id in inner[position] for position in CROSS):
+                    cells = {position: {magnet_id} if position in CROSS else inner[position] - cavity_ids - magnet_ids for position in RING}
+                    candidates.append(("magnet", cells | {(2, 2): {beam_id}}))
+            cells = {position: inner[position] - cavity_ids - magnet_ids for position in RING}
+            candidates.append(("empty", cells | {(2, 2): {beam_id}}))
+
+        # Remove the components whose placement rule cannot hold, given their neighbors in the slice and what the
+        # neighboring slices can hold at the same position, until nothing changes.
+        tables: dict[str, base.placement_rules.RuleTable] = dict()
+        changed = True
+        while changed:
+            changed = False
+            candidates = [(kind, cells) for kind, cells in candidates if all(len(cells[position]) > 0 for position in INTERIOR)]
+            outer = {position: ends[position].union(*(cells[position] for _, cells in candidates)) for position in INTERIOR}
+            for _, cells in candidates:
+                for y, z in INTERIOR:
+                    for component_id in sorted(cells[y, z]):
+                        rule = components[component_id].placement_rule
+                        if rule not in tables:
+                            tables[rule] = base.placement_rules.RuleTable(base.placement_rules.parse_rule_string(rule), components)
+                        table = tables[rule]
+                        neighbors = [
+                            outer[y, z],
+                            outer[y, z],
+                            cells.get((y - 1, z), inner[y - 1, z]),
+                            cells.get((y + 1, z), inner[y + 1, z]),
+                            cells.get((y, z - 1), inner[y, z - 1]),
+                            cells.get((y, z + 1), inner[y, z + 1])
+                        ]
+                        if len(table.rows(tuple(tuple(sorted(set(table.classes[i] for i in ids))) for ids in neighbors))) == 0:
+                            cells[y, z].discard(component_id)
+                            changed = True
+        self.patterns = [SlicePattern(kind=kind, cells=tuple(tuple(sorted(cells[position])) for position in INTERIOR)) for kind, cells in candidates]
+        self._vectors: dict[tuple, tuple[int, ...]] = dict()
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    @typing.overload
+    def __getitem__(self, i: int) -> SlicePattern: ...
+
+    @typing.overload
+    def __getitem__(self, i: slice) -> list[SlicePattern]: ...
+
+    def __getitem__(self, i: int | slice) -> SlicePattern | list[SlicePattern]:
+        return self.patterns[i]
+
+    def project(self, position: tuple[int, int], values: typing.Sequence[int]) -> tuple[int, ...]:
+        """Turn a per-component vector into a per-pattern vector, for a position that determines it.
+
+        Args:
+            position (tuple[int, int]): The (y, z) position the vector is read at.
+            values (typing.Sequence[int]): The value of each component ID, e.g. from `ComponentIndex.vector`.
+
+        Returns:
+            tuple[int, ...]: The value of each pattern.
+
+        Raises:
+            ValueError: If the components a pattern allows at the position do not all have the same value.
+        """
+        key = (position, tuple(values))
+        if key not in self._vectors:
+            projected = []
+            for i, pattern in enumerate(self.patterns):
+                reachable = set(values[component_id] for component_id in pattern.at(position))
+                if len(reachable) != 1:
+                    raise ValueError(f"Pattern {i} does not determine the value at {position}.")
+                projected.append(reachable.pop())
+            self._vectors[key] = tuple(projected)
+        return self._vectors[key]
+
+    def match(self, ids: typing.Sequence[int]) -> int | None:
+        """Find the pattern of an x-slice.
+
+        Args:
+            ids (typing.Sequence[int]): The component ID at each interior position of the slice, in the order of `INTERIOR`.
+
+        Returns:
+            int | None: The index of the first pattern that allows every component of the slice, or None if there is none.
+        """
+        for i, pattern in enumerate(self.patterns):
+            if all(component_id in cell for component_id, cell in zip(ids, pattern.cells)):
+                return i
+        return None
+
+    def mask(self, kind: typing.Literal["cavity", "magnet", "empty"]) -> tuple[int, ...]:
+        """Get a 0/1 vector of whether each pattern is of the given kind.
+
+        Args:
+            kind (typing.Literal["cavity", "magnet", "empty"]): The kind of cross-section.
+
+        Returns:
+            tuple[int, ...]: 1 for each pattern of the kind, 0 otherwise.
+        """
+        return tuple(1 if pattern.kind == kind else 0 for pattern in self.patterns)
+
+    def choices(self, model: cp_model.CpModel, seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar]) -> list[cp_model.IntVar | None]:
+        """Get the pattern of each x-slice of a model, creating and linking the choice variables if needed.
+
+        Args:
+            model (cp_model.CpModel): The constraint programming model.
+            seq (core.utils.multi_sequence.MultiSequence[cp_model.IntVar]): The sequence of components.
+
+        Returns:
+            list[cp_model.IntVar | None]: The index of the pattern of each slice, or None for the casing at both ends.
+        """
+        if len(self.patterns) == 0:
+            raise ValueError("No cross-section is valid for these components.")
+        cache = self._choices.setdefault(model, dict())
+        key = tuple(var.Index() for var in seq)
+        if key not in cache:
+            choices: list[cp_model.IntVar | None] = [None]
+            for x in range(1, seq.shape[0] - 1):
+                choice = model.NewIntVar(0, len(self.patterns) - 1, core.utils.cp_utils.var_name(model, "pattern"))
+                for position in INTERIOR:
+                    model.AddAllowedAssignments(
+                        [choice, seq[(x,) + position]],
+                        [(i, component_id) for i, pattern in enumerate(self.patterns) for component_id in pattern.at(position)]
+                    )
+                choices.append(choice)
+            choices.append(None)
+            cache[key] = choices
+        return cache[key]
+
+
+def lookup(
+        model: cp_model.CpModel,
+        seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+        x: int,
+        position: tuple[int, int],
+        values: typing.Sequence[int],
+        catalog: SliceCatalog | None = None
+) -> cp_model.IntVar:
+    """Get a variable equal to the value of the component at a cell, by pattern if a catalog is given.
+
+    Args:
+        model (cp_model.CpModel): The constraint programming model.
+        seq (core.utils.multi_sequence.MultiSequence[cp_model.IntVar]): The sequence of components.
+        x (int): The x-slice of the cell.
+        position (tuple[int, int]): The (y, z) position of the cell.
+        values (typing.Sequence[int]): The value of each component ID.
+        catalog (SliceCatalog | None, optional): The catalog of cross-sections. Defaults to None.
+
+    Returns:
+        cp_model.IntVar: The value of the cell.
+    """
+    choice = catalog.choices(model, seq)[x] if not isinstance(catalog, type(None)) else None
+    if isinstance(choice, type(None)):
+        return core.utils.cp_utils.element(model, seq[(x,) + position], values)
+    return core.utils.cp_utils.element(model, choice, catalog.project(position, values))
@@ -4,16 +4,16 @@ from .... import core
 from ....components.types import *
 from ... import base
 from . import calculations
+from .catalog import SliceCatalog, INTERIOR
 
-import uuid
 import itertools
 
 from ortools.sat.python import cp_model
 
 
-class BeamConstraint(base.constraints.Constraint):
+class BeamConstraint(base.constraints.LayoutConstraint):
     """Ensures that the beam is at the center of the sequence. Note that the accelerator goes in the +x direction."""
-    def is_satisfied(self, seq: core.multi_sequence.MultiSequence[Component]) -> bool:
+    def is_satisfied(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> bool:
         if seq.shape[1] != 5 or seq.shape[2] != 5:
             raise ValueError("BeamConstraint requires a Nx5x5 sequence.")
         for x in range(1, seq.shape[0] - 1):
@@ -25,51 +25,34 @@ class BeamConstraint(base.constraints.Constraint):
                         return False
         return True
     
-    def to_model(
-        self,
-        model: cp_model.CpModel,
-        seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-        components: list[Component]
-    ) -> None:
-        if seq.shape[1] != 5 or seq.shape[2] != 5:
+    def restrict_domains(self, domains: core.utils.multi_sequence.MultiSequence[set[int]], components: base.component_index.ComponentIndex) -> None:
+        if domains.shape[1] != 5 or domains.shape[2] != 5:
             raise ValueError("BeamConstraint requires a Nx5x5 sequence.")
-        type_to_id = dict()
-        for i, component in enumerate(components):
-            if component.type not in type_to_id:
-                type_to_id[component.type] = [i]
-            else:
-                type_to_id[component.type].append(i)
-        beam_ids = type_to_id["beam"]
-        for x in range(1, seq.shape[0] - 1):
-            for y in range(seq.shape[1]):
-                for z in range(seq.shape[2]):
+        beam_ids = components.ids_of_type("beam")
+        for x in range(1, domains.shape[0] - 1):
+            for y in range(domains.shape[1]):
+                for z in range(domains.shape[2]):
                     if y == z == 2:
-                        model.AddAllowedAssignments([seq[x, y, z]], [(beam_id,) for beam_id in beam_ids])
+                        domains[x, y, z].intersection_update(beam_ids)
                     else:
-                        model.AddForbiddenAssignments([seq[x, y, z]], [(beam_id,) for beam_id in beam_ids])
+                        domains[x, y, z].difference_update(beam_ids)
 
 
 class CavityConstraint(base.constraints.Constraint):
     """Ensures that cavities are correctly placed."""
-    def is_satisfied(self, seq: core.multi_sequence.MultiSequence[Component]) -> bool:
+    def is_satisfied(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> bool:
         raise NotImplementedError("CavityConstraint.is_satisfied is not implemented.")
     
     def to_model(
         self,
         model: cp_model.CpModel,
-        seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-        components: list[Component]
+        seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+        components: base.component_index.ComponentIndex
     ) -> None:
         if seq.shape[1] != 5 or seq.shape[2] != 5:
             raise ValueError("CavityConstraint requires a Nx5x5 sequence.")
-        type_to_id = dict()
-        for i, component in enumerate(components):
-            if component.type not in type_to_id:
-                type_to_id[component.type] = [i]
-            else:
-                type_to_id[component.type].append(i)
-        cavity_ids = type_to_id["cavity"]
-        has_cavity = [model.NewBoolVar(str(uuid.uuid4())) for _ in range(seq.shape[0])]
+        cavity_ids = components.ids_of_type("cavity")
+        has_cavity = [model.NewBoolVar(core.utils.cp_utils.var_name(model)) for _ in range(seq.shape[0])]
         for x in range(1, seq.shape[0] - 1):
             cavity_positions = [
                 seq[x, 1, 1],
@@ -92,25 +75,19 @@ class CavityConstraint(base.constraints.Constraint):
 
 class MagnetConstraint(base.constraints.Constraint):
     """Ensures that magnets are correctly placed."""
-    def is_satisfied(self, seq: core.multi_sequence.MultiSequence[Component]) -> bool:
+    def is_satisfied(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> bool:
         raise NotImplementedError("CavityConstraint.is_satisfied is not implemented.")
     
     def to_model(
         self,
         model: cp_model.CpModel,
-        seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-        components: list[Component]
+        seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+        components: base.component_index.ComponentIndex
     ) -> None:
         if seq.shape[1] != 5 or seq.shape[2] != 5:
             raise ValueError("MagnetConstraint requires a Nx5x5 sequence.")
-        type_to_id = dict()
-        for i, component in enumerate(components):
-            if component.type not in type_to_id:
-                type_to_id[component.type] = [i]
-            else:
-                type_to_id[component.type].append(i)
-        magnet_ids = type_to_id["magnet"]
-        has_magnet = [model.NewBoolVar(str(uuid.uuid4())) for _ in range(seq.shape[0])]
+        magnet_ids = components.ids_of_type("magnet")
+        has_magnet = [model.NewBoolVar(core.utils.cp_utils.var_name(model)) for _ in range(seq.shape[0])]
         for x in range(1, seq.shape[0] - 1):
             magnet_positions = [
                 seq[x, 1, 2],
@@ -133,69 +110,101 @@ class MagnetConstraint(base.constraints.Constraint):
                 model.AddForbiddenAssignments([pos], [(magnet_id,) for magnet_id in magnet_ids])
 
 
+class SlicePatternConstraint(base.constraints.Constraint):
+    """Ensures that every x-slice is a cross-section of the catalog, and that cavities are not placed in adjacent slices.
+
+    Replaces `CavityConstraint` and `MagnetConstraint`, with a single choice variable per slice.
+    """
+    def __init__(self, catalog: SliceCatalog) -> None:
+        self.catalog = catalog
+
+    def is_satisfied(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> bool:
+        matches = [
+            self.catalog.match([self.catalog.components.index(seq[(x,) + position]) for position in INTERIOR])
+            for x in range(1, seq.shape[0] - 1)
+        ]
+        if any(isinstance(match, type(None)) for match in matches):
+            return False
+        return not any(self.catalog[a].kind == self.catalog[b].kind == "cavity" for a, b in itertools.pairwise(matches))
+
+    def to_model(
+        self,
+        model: cp_model.CpModel,
+        seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+        components: base.component_index.ComponentIndex
+    ) -> None:
+        choices = self.catalog.choices(model, seq)
+        is_cavity = self.catalog.mask("cavity")
+        for a, b in itertools.pairwise(choices[1:-1]):
+            model.Add(core.utils.cp_utils.element(model, a, is_cavity) + core.utils.cp_utils.element(model, b, is_cavity) <= 1)
+
+
 class HeatNeutralConstraint(base.constraints.Constraint):
     """Ensures that the cooling rate is equal to or greater than the heating rate."""
-    def __init__(self, external_heating: int) -> None:
+    def __init__(self, external_heating: int, catalog: SliceCatalog | None = None) -> None:
         self.external_heating = external_heating
+        self.catalog = catalog
     
-    def is_satisfied(self, seq: core.multi_sequence.MultiSequence[Component]) -> bool:
+    def is_satisfied(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> bool:
         raise NotImplementedError("HeatNeutralConstraint.is_satisfied is not implemented.")
     
     def to_model(
         self,
         model: cp_model.CpModel,
-        seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-        components: list[Component]
+        seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+        components: base.component_index.ComponentIndex
     ) -> None:
-        heating_rate = calculations.TotalHeatingRate().to_model(model, seq, components)
+        heating_rate = calculations.TotalHeatingRate(self.catalog).to_model(model, seq, components)
         cooling_rate = calculations.TotalCoolingRate().to_model(model, seq, components)
         model.Add(heating_rate + self.external_heating <= cooling_rate)
 
 
 class BeamFocusConstraint(base.constraints.Constraint):
     """Ensures that the beam exits with a focus greater than a desired value."""
-    def __init__(self, target_focus: float, charge: float, beam_strength: int, scaling_factor: int = 10000, initial_focus: float = 0.0) -> None:
+    def __init__(self, target_focus: float, charge: float, beam_strength: int, scaling_factor: int = 10000, initial_focus: float = 0.0, catalog: SliceCatalog | None = None) -> None:
         self.target_focus = target_focus
         self.charge = charge
         self.beam_strength = beam_strength
         self.scaling_factor = scaling_factor
         self.initial_focus = initial_focus
+        self.catalog = catalog
     
-    def is_satisfied(self, seq: core.multi_sequence.MultiSequence[Component]) -> bool:
+    def is_satisfied(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> bool:
         raise NotImplementedError("BeamFocusConstraint.is_satisfied is not implemented.")
     
     def to_model(
         self,
         model: cp_model.CpModel,
-        seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-        components: list[Component]
+        seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+        components: base.component_index.ComponentIndex
     ) -> None:
         target_focus = round(self.target_focus * base.scaled_calculations.SCALE_FACTOR)
-        focus = calculations.BeamFocus(self.charge, self.beam_strength, self.scaling_factor, self.initial_focus).to_model(model, seq, components)
+        focus = calculations.BeamFocus(self.charge, self.beam_strength, self.scaling_factor, self.initial_focus, self.catalog).to_model(model, seq, components)
         model.Add(focus >= target_focus)
 
 
 class EnergyConstraint(base.constraints.Constraint):
     """Ensures that the beam exists with an energy greater than a desired value."""
-    def __init__(self, minimum_energy: int, maximum_energy: int, charge: float) -> None:
+    def __init__(self, minimum_energy: int, maximum_energy: int, charge: float, catalog: SliceCatalog | None = None) -> None:
         self.minimum_energy = minimum_energy
         self.maximum_energy = maximum_energy
         self.charge = charge
+        self.catalog = catalog
     
-    def is_satisfied(self, seq: core.multi_sequence.MultiSequence[Component]) -> bool:
+    def is_satisfied(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> bool:
         raise NotImplementedError("EnergyConstraint.is_satisfied is not implemented.")
     
     def to_model(
         self,
         model: cp_model.CpModel,
-        seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-        components: list[Component]
+        seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+        components: base.component_index.ComponentIndex
     ) -> None:
         charge = round(self.charge * 3)
-        voltage = calculations.TotalVoltage().to_model(model, seq, components)
-        energy_ = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        voltage = calculations.TotalVoltage(self.catalog).to_model(model, seq, components)
+        energy_ = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.AddMultiplicationEquality(energy_, [voltage, charge])
-        energy = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        energy = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.AddDivisionEquality(energy, energy_, 3)
         model.Add(energy >= self.minimum_energy)
         model.Add(energy <= self.maximum_energy)
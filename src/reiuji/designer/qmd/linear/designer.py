@@ -5,6 +5,11 @@ from ....components.types import *
 from ....components.defaults import QMD_LINEAR_ACCELERATOR_COMPONENTS
 from ... import base
 from . import constraints, calculations
+from .catalog import SliceCatalog
+from .dp import LinearAcceleratorDP
+
+import time
+import typing
 
 from ortools.sat.python import cp_model
 
@@ -26,6 +31,9 @@ class LinearAcceleratorDesigner(base.designer.Designer):
             heat_neutral: bool = True,
             y_symmetry: bool = False,
             z_symmetry: bool = False,
+            catalog: bool = False,
+            engine: typing.Literal["dp", "cp"] = "cp",
+            candidates: int = 32,
             components: list[Component] | None = None,
             component_limits: dict[str, tuple[int | None, int | None]] | None = None
     ) -> None:
@@ -43,27 +51,108 @@ class LinearAcceleratorDesigner(base.designer.Designer):
         self.heat_neutral = heat_neutral
         self.y_symmetry = y_symmetry
         self.z_symmetry = z_symmetry
+        self.catalog = catalog
+        self.engine = engine
+        self.candidates = candidates
         self.component_limits = component_limits if not isinstance(component_limits, type(None)) else dict()
+        self._slice_catalog: SliceCatalog | None = None
     
     @property
     def seq_shape(self) -> tuple[int, ...]:
         return (self.length + 2, 5, 5)
     
-    def build_model(self, model: cp_model.CpModel, seq: core.multi_sequence.MultiSequence[cp_model.IntVar]) -> None:
-        base.constraints.CasingConstraint().to_model(model, seq, self.components)
-        base.constraints.PlacementRuleConstraint().to_model(model, seq, self.components)
-        constraints.BeamConstraint().to_model(model, seq, self.components)
-        constraints.CavityConstraint().to_model(model, seq, self.components)
-        constraints.MagnetConstraint().to_model(model, seq, self.components)
-        if self.heat_neutral:
-            sa = (seq.shape[0] * 5) * 4 + 50
-            constraints.HeatNeutralConstraint(round(self.kappa * sa * self.env_temperature)).to_model(model, seq, self.components)
+    def layout(self) -> list[base.constraints.LayoutConstraint]:
+        return [
+            base.constraints.CasingConstraint(),
+            constraints.BeamConstraint()
+        ]
+    
+    def aliases(self) -> list[base.constraints.AliasConstraint]:
+        aliases = []
         if self.y_symmetry:
-            base.constraints.SymmetryConstraint(1).to_model(model, seq, self.components)
+            aliases.append(base.constraints.SymmetryConstraint(1))
         if self.z_symmetry:
-            base.constraints.SymmetryConstraint(2).to_model(model, seq, self.components)
+            aliases.append(base.constraints.SymmetryConstraint(2))
+        return aliases
+    
+    def slice_catalog(self) -> SliceCatalog:
+        """Get the catalog of cross-sections of the designer, enumerating it on first use.
+
+        Returns:
+            SliceCatalog: The catalog.
+        """
+        if isinstance(self._slice_catalog, type(None)):
+            self._slice_catalog = SliceCatalog(self.component_index, self.cell_domains())
+        return self._slice_catalog
+
+    def build_model(self, model: cp_model.CpModel, seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar]) -> None:
+        catalog = self.slice_catalog() if self.catalog or self.engine == "dp" else None
+        base.constraints.PlacementRuleConstraint().to_model(model, seq, self.component_index)
+        if not isinstance(catalog, type(None)):
+            constraints.SlicePatternConstraint(catalog).to_model(model, seq, self.component_index)
+        else:
+            constraints.CavityConstraint().to_model(model, seq, self.component_index)
+            constraints.MagnetConstraint().to_model(model, seq, self.component_index)
+        if self.heat_neutral:
+            sa = (seq.shape[0] * 5) * 4 + 50
+            constraints.HeatNeutralConstraint(round(self.kappa * sa * self.env_temperature), catalog).to_model(model, seq, self.component_index)
         for component, (min_, max_) in self.component_limits.items():
-            base.constraints.QuantityConstraint(component, max_, min_).to_model(model, seq, self.components)
-        constraints.BeamFocusConstraint(self.target_focus, self.charge, self.beam_strength, self.scaling_factor, self.initial_focus).to_model(model, seq, self.components)
-        constraints.EnergyConstraint(self.minimum_energy, self.maximum_energy, self.charge).to_model(model, seq, self.components)
-        model.Minimize(calculations.PowerRequirement().to_model(model, seq, self.components))
+            base.constraints.QuantityConstraint(component, max_, min_).to_model(model, seq, self.component_index)
+        constraints.BeamFocusConstraint(self.target_focus, self.charge, self.beam_strength, self.scaling_factor, self.initial_focus, catalog).to_model(model, seq, self.component_index)
+        constraints.EnergyConstraint(self.minimum_energy, self.maximum_energy, self.charge, catalog).to_model(model, seq, self.component_index)
+        model.Minimize(calculations.PowerRequirement(catalog).to_model(model, seq, self.component_index))
+
+    def solve(self, *, timeout: float | None = None, config: base.solver.SolverConfig | None = None, hint: core.utils.multi_sequence.MultiSequence[Component | None] | None = None, cache: base.cache.ModelCache | None = None) -> base.solver.DesignResult:
+        if self.engine == "cp":
+            return super().solve(timeout=timeout, config=config, hint=hint, cache=cache)
+        start = time.perf_counter()
+        catalog = self.slice_catalog()
+        finals = LinearAcceleratorDP(self, catalog).solve()
+        if len(finals) == 0:
+            # The search only relaxes the requirements, so no accelerator satisfies them.
+            return base.solver.DesignResult(cp_model.INFEASIBLE, None, wall_time=time.perf_counter() - start)
+        # The search keeps the least raw power of each state, so its best design bounds the power requirement.
+        bound = finals[0][0]
+
+        # The search relaxes the cooling and the component limits, so the designs are checked from the least power
+        # requirement, letting CP-SAT arrange the patterns and place the coolers.
+        model, seq = self.create_model(hint=hint, cache=cache)
+        choices = catalog.choices(model, seq)[1:-1]
+        config = config if not isinstance(config, type(None)) else base.solver.SolverConfig()
+        checked: set[tuple[int, ...]] = set()
+        for objective, patterns in finals:
+            counts = tuple(patterns.count(i) for i in range(len(catalog)))
+            if counts in checked:
+                continue
+            if len(checked) == self.candidates:
+                break
+            checked.add(counts)
+            remaining = None if isinstance(timeout, type(None)) else timeout - (time.perf_counter() - start)
+            if not isinstance(remaining, type(None)) and remaining <= 0:
+                return base.solver.DesignResult(cp_model.UNKNOWN, None, bound=bound, wall_time=time.perf_counter() - start)
+            enforce = model.NewBoolVar(core.utils.cp_utils.var_name(model, "counts"))
+            for i, count in enumerate(counts):
+                model.Add(sum(core.utils.cp_utils.in_values(model, choice, [i]) for choice in choices) == count).OnlyEnforceIf(enforce)
+            model.ClearAssumptions()
+            model.AddAssumption(enforce)
+            solver = cp_model.CpSolver()
+            # Each check gets half of the remaining time, leaving the rest to the fallback.
+            config.apply(solver, timeout=remaining / 2 if not isinstance(remaining, type(None)) else None)
+            status = solver.Solve(model)
+            if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
+                return base.solver.DesignResult(
+                    cp_model.OPTIMAL if solver.ObjectiveValue() <= bound else cp_model.FEASIBLE,
+                    self.decode([solver.Value(comp) for comp in seq]),
+                    objective=solver.ObjectiveValue(),
+                    bound=bound,
+                    wall_time=time.perf_counter() - start
+                )
+            if status != cp_model.INFEASIBLE:
+                break
+
+        # A check timed out, or the checks failed. The search keeps a single design per state, so this does not prove
+        # that no design exists: fall back to CP-SAT on the whole model.
+        remaining = None if isinstance(timeout, type(None)) else max(timeout - (time.perf_counter() - start), 0.0)
+        result = super().solve(timeout=remaining, config=config, hint=hint, cache=cache)
+        result.wall_time = time.perf_counter() - start
+        return result
@@ -0,0 +1,145 @@
+"""Dynamic programming solver for QMD linear accelerators."""
+
+from .... import core
+from ....components.types import *
+from ... import base
+from .catalog import SliceCatalog, RING
+
+import typing
+
+if typing.TYPE_CHECKING:
+    from .designer import LinearAcceleratorDesigner
+
+
+class LinearAcceleratorDP:
+    """Designs the beam of linear accelerators by dynamic programming over the x-slices of the accelerator.
+
+    Everything but the cooling of an accelerator is a sum over its cross-sections (see `SliceCatalog`), and the only
+    coupling between slices is that cavities cannot be adjacent. The search keeps the partial accelerator of least raw power for each
+    state (previous slice is a cavity, voltage, number of parts, sum of efficiencies, focus bucket, heat balance bucket),
+    where the heat balance counts every cooler cell at the best cooler it can hold. The accelerators of least power
+    requirement are then handed to CP-SAT, with the patterns fixed, to place the coolers and check what the search relaxed.
+    """
+    def __init__(
+            self,
+            designer: "LinearAcceleratorDesigner",
+            catalog: SliceCatalog,
+            *,
+            focus_resolution: int = 1,
+            heat_resolution: int = 1
+    ) -> None:
+        """
+        Args:
+            designer (LinearAcceleratorDesigner): The designer whose accelerators to search.
+            catalog (SliceCatalog): The catalog of cross-sections of the designer.
+            focus_resolution (int, optional): The width of the focus buckets, in scaled units. Defaults to 1, which keeps every focus apart.
+            heat_resolution (int, optional): The width of the heat balance buckets. Defaults to 1, which keeps every heat balance apart.
+        """
+        self.designer = designer
+        self.catalog = catalog
+        self.focus_resolution = focus_resolution
+        self.heat_resolution = heat_resolution
+
+        components = designer.component_index
+        scale = base.scaled_calculations.SCALE_FACTOR
+        charge = round(abs(designer.charge) * scale)
+        loss_factor = round((1 + abs(designer.charge) * (designer.beam_strength / designer.scaling_factor) ** (1 / 2)) * scale)
+        cooling = components.vector("cooling", AcceleratorCooler)
+        strengths = catalog.project((1, 2), components.vector("strength", AcceleratorMagnet, scale=scale))
+        attenuations = catalog.project((2, 2), components.vector("attenuation", BeamPipe, scale=scale))
+        self.voltages = catalog.project((1, 2), components.vector("voltage", RFCavity))
+        self.powers = catalog.project((1, 2), components.vector("power", (RFCavity, AcceleratorMagnet)))
+        self.efficiencies = catalog.project((1, 2), components.vector("efficiency", (RFCavity, AcceleratorMagnet), scale=scale))
+        self.parts = catalog.project((1, 2), components.mask((RFCavity, AcceleratorMagnet)))
+        self.focus = tuple(charge * strength // scale - attenuation * loss_factor // scale for strength, attenuation in zip(strengths, attenuations))
+        heats = catalog.project((1, 2), components.vector("heat", (RFCavity, AcceleratorMagnet)))
+        self.balances = tuple(
+            sum(max(cooling[component_id] for component_id in pattern.at(position)) for position in RING) - heat
+            for pattern, heat in zip(catalog, heats)
+        )
+        self.is_cavity = catalog.mask("cavity")
+
+    def objective(self, raw_power: int, efficiency: int, parts: int) -> int | None:
+        """Compute the scaled power requirement of an accelerator, as `PowerRequirement.to_model` does.
+
+        Args:
+            raw_power (int): The sum of the power of the parts.
+            efficiency (int): The sum of the scaled efficiency of the parts.
+            parts (int): The number of parts.
+
+        Returns:
+            int | None: The power requirement, or None if it is undefined.
+        """
+        if parts == 0 or efficiency // parts == 0:
+            return None
+        return raw_power * base.scaled_calculations.SCALE_FACTOR // (efficiency // parts)
+
+    def solve(self) -> list[tuple[int, list[int]]]:
+        """Find the beam designs that satisfy the focus, energy and heat balance requirements.
+
+        Returns:
+            list[tuple[int, list[int]]]: The power requirement and the pattern of each x-slice of the designs, from the least power requirement.
+        """
+        designer = self.designer
+        length = designer.length
+        scale = base.scaled_calculations.SCALE_FACTOR
+        charge = round(designer.charge * 3)
+        target_focus = round(designer.target_focus * scale) - round(designer.initial_focus * scale)
+        external_heating = 0
+        if designer.heat_neutral:
+            sa = ((length + 2) * 5) * 4 + 50
+            external_heating = round(designer.kappa * sa * designer.env_temperature)
+        best_focus = max(self.focus)
+        best_balance = max(self.balances)
+
+        # State: (previous slice is a cavity, voltage, parts, sum of efficiencies, focus bucket, heat balance bucket).
+        # Value: (raw power, focus, heat balance, previous state, pattern).
+        layers: list[dict[tuple, tuple[int, int, int, tuple | None, int | None]]] = [{(False, 0, 0, 0, 0, 0): (0, 0, 0, None, None)}]
+        for x in range(length):
+            remaining = length - x - 1
+            layer: dict[tuple, tuple[int, int, int, tuple | None, int | None]] = dict()
+            for state, (raw_power, focus, balance, _, _) in layers[-1].items():
+                previous_cavity, voltage, parts, efficiency, _, _ = state
+                for i in range(len(self.catalog)):
+                    if previous_cavity and self.is_cavity[i]:
+                        continue
+                    voltage_ = voltage + self.voltages[i]
+                    if charge > 0 and voltage_ * charge // 3 > designer.maximum_energy:
+                        continue
+                    focus_ = focus + self.focus[i]
+                    if focus_ + remaining * best_focus < target_focus:
+                        continue
+                    balance_ = balance + self.balances[i]
+                    if balance_ + remaining * best_balance < external_heating:
+                        continue
+                    raw_power_ = raw_power + self.powers[i]
+                    state_ = (
+                        bool(self.is_cavity[i]),
+                        voltage_,
+                        parts + self.parts[i],
+                        efficiency + self.efficiencies[i],
+                        focus_ // self.focus_resolution,
+                        balance_ // self.heat_resolution
+                    )
+                    if state_ not in layer or (raw_power_, -focus_, -balance_) < (layer[state_][0], -layer[state_][1], -layer[state_][2]):
+                        layer[state_] = (raw_power_, focus_, balance_, state, i)
+            layers.append(layer)
+
+        finals = []
+        for state, (raw_power, focus, balance, _, _) in layers[-1].items():
+            _, voltage, parts, efficiency, _, _ = state
+            objective = self.objective(raw_power, efficiency, parts)
+            energy = voltage * charge
+            if isinstance(objective, type(None)) or energy < 0 or not designer.minimum_energy <= energy // 3 <= designer.maximum_energy:
+                continue
+            if focus < target_focus or balance < external_heating:
+                continue
+            patterns = []
+            for layer in reversed(layers[1:]):
+                _, _, _, state_, i = layer[state]
+                patterns.append(i)
+                state = state_
+            patterns.reverse()
+            finals.append((objective, patterns))
+        finals.sort()
+        return finals
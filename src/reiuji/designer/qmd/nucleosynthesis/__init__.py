@@ -1,4 +1,5 @@
 """Functionality pertaining to nucleosynthesis chambers in QMD."""
 
 from . import constraints
+from . import table
 from .designer import NucleosynthesisDesigner
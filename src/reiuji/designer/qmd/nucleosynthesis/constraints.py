@@ -4,35 +4,23 @@ from .... import core
 from ....components.types import *
 from ... import base
 
-import uuid
 import itertools
 
 from ortools.sat.python import cp_model
 
 
-class StructureConstraint(base.constraints.Constraint):
+class StructureConstraint(base.constraints.LayoutConstraint):
     """Ensures that the internal structure of the chamber is correct."""
-    def is_satisfied(self, seq: core.multi_sequence.MultiSequence[Component]) -> bool:
+    def is_satisfied(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> bool:
         raise NotImplementedError("StructureConstraint.is_satisfied is not implemented.")
 
-    def to_model(
-        self,
-        model: cp_model.CpModel,
-        seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-        components: list[Component]
-    ) -> None:
-        if seq.shape != (5, 11, 7):
+    def restrict_domains(self, domains: core.utils.multi_sequence.MultiSequence[set[int]], components: base.component_index.ComponentIndex) -> None:
+        if domains.shape != (5, 11, 7):
             raise ValueError("StructureConstraint requires a 5x11x7 sequence.")
-        type_to_id = dict()
-        for i, component in enumerate(components):
-            if component.type not in type_to_id:
-                type_to_id[component.type] = [i]
-            else:
-                type_to_id[component.type].append(i)
-        beam_ids = type_to_id["beam"]
-        glass_ids = type_to_id["glass"]
-        nozzle_ids = type_to_id["nozzle"]
-        air_ids = type_to_id["air"]
+        beam_ids = components.ids_of_type("beam")
+        glass_ids = components.ids_of_type("glass")
+        nozzle_ids = components.ids_of_type("nozzle")
+        air_ids = components.ids_of_type("air")
 
         beam_pos = [
             (2, 1, 2),
@@ -84,19 +72,19 @@ class StructureConstraint(base.constraints.Constraint):
             (2, 6, 2),
             (2, 7, 2)
         ]
-        for i, component in enumerate(seq):
-            idx = seq.index_int_to_tuple(i)
+        for i, domain in enumerate(domains):
+            idx = domains.index_int_to_tuple(i)
             if idx in beam_pos:
-                model.AddAllowedAssignments([component], [(beam_id,) for beam_id in beam_ids])
+                domain.intersection_update(beam_ids)
             else:
-                model.AddForbiddenAssignments([component], [(beam_id,) for beam_id in beam_ids])
+                domain.difference_update(beam_ids)
             if idx in glass_pos:
-                model.AddAllowedAssignments([component], [(glass_id,) for glass_id in glass_ids])
+                domain.intersection_update(glass_ids)
             else:
-                model.AddForbiddenAssignments([component], [(glass_id,) for glass_id in glass_ids])
+                domain.difference_update(glass_ids)
             if idx in nozzle_pos:
-                model.AddAllowedAssignments([component], [(nozzle_id,) for nozzle_id in nozzle_ids])
+                domain.intersection_update(nozzle_ids)
             else:
-                model.AddForbiddenAssignments([component], [(nozzle_id,) for nozzle_id in nozzle_ids])
+                domain.difference_update(nozzle_ids)
             if idx in air_pos:
-                model.AddAllowedAssignments([component], [(air_id,) for air_id in air_ids])
+                domain.intersection_update(air_ids)
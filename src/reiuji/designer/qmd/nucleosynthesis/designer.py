@@ -5,6 +5,9 @@ from ....components.types import *
 from ....components.defaults import QMD_NUCLEOSYNTHESIS_COMPONENTS
 from ... import base
 from . import constraints, calculations
+from .table import NucleosynthesisTable
+
+import time
 
 from ortools.sat.python import cp_model
 
@@ -16,6 +19,7 @@ class NucleosynthesisDesigner(base.designer.Designer):
             recipe_heat: int,
             x_symmetry: bool = False,
             z_symmetry: bool = False,
+            table: NucleosynthesisTable | None = None,
             components: list[Component] | None = None,
             component_limits: dict[str, tuple[int | None, int | None]] | None = None
     ) -> None:
@@ -23,23 +27,48 @@ class NucleosynthesisDesigner(base.designer.Designer):
         self.recipe_heat = recipe_heat
         self.x_symmetry = x_symmetry
         self.z_symmetry = z_symmetry
+        # Private, so that a table does not change the model cache key of an identical model.
+        self._table = table
         self.component_limits = component_limits if not isinstance(component_limits, type(None)) else dict()
     
     @property
     def seq_shape(self) -> tuple[int, ...]:
         return (5, 11, 7)
     
-    def build_model(self, model: cp_model.CpModel, seq: core.multi_sequence.MultiSequence[cp_model.IntVar]) -> None:
-        base.constraints.CasingConstraint().to_model(model, seq, self.components)
-        base.constraints.PlacementRuleConstraint().to_model(model, seq, self.components)
-        constraints.StructureConstraint().to_model(model, seq, self.components)
-        heating = calculations.TotalHeatingRate().to_model(model, seq, self.components)
-        cooling = calculations.TotalCoolingRate().to_model(model, seq, self.components)
+    def layout(self) -> list[base.constraints.LayoutConstraint]:
+        return [
+            base.constraints.CasingConstraint(),
+            constraints.StructureConstraint()
+        ]
+    
+    def aliases(self) -> list[base.constraints.AliasConstraint]:
+        aliases = []
         if self.x_symmetry:
-            base.constraints.SymmetryConstraint(0).to_model(model, seq, self.components)
+            aliases.append(base.constraints.SymmetryConstraint(0))
         if self.z_symmetry:
-            base.constraints.SymmetryConstraint(1).to_model(model, seq, self.components)
+            aliases.append(base.constraints.SymmetryConstraint(1))
+        return aliases
+    
+    def build_model(self, model: cp_model.CpModel, seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar]) -> None:
+        base.constraints.PlacementRuleConstraint().to_model(model, seq, self.component_index)
+        heating = calculations.TotalHeatingRate().to_model(model, seq, self.component_index)
+        cooling = calculations.TotalCoolingRate().to_model(model, seq, self.component_index)
         for component, (min_, max_) in self.component_limits.items():
-            base.constraints.QuantityConstraint(component, max_, min_).to_model(model, seq, self.components)
+            base.constraints.QuantityConstraint(component, max_, min_).to_model(model, seq, self.component_index)
         model.Add(self.recipe_heat <= cooling)
         model.Minimize(cooling - self.recipe_heat)
+
+    def solve(self, *, timeout: float | None = None, config: base.solver.SolverConfig | None = None, hint: core.utils.multi_sequence.MultiSequence[Component | None] | None = None, cache: base.cache.ModelCache | None = None) -> base.solver.DesignResult:
+        column = self._table.column(self) if not isinstance(self._table, type(None)) else None
+        if isinstance(column, type(None)):
+            return super().solve(timeout=timeout, config=config, hint=hint, cache=cache)
+        start = time.perf_counter()
+        i = column.lookup(self.recipe_heat)
+        if not isinstance(i, type(None)):
+            objective = column.totals[i] - self.recipe_heat
+            seq = self.decode(column.values(i, self.cell_groups()))
+            return base.solver.DesignResult(cp_model.OPTIMAL, seq, objective=objective, bound=objective, wall_time=time.perf_counter() - start)
+        if column.complete:
+            return base.solver.DesignResult(cp_model.INFEASIBLE, None, wall_time=time.perf_counter() - start)
+        # The recipe is past the totals the column was built for.
+        return super().solve(timeout=timeout, config=config, hint=hint, cache=cache)
@@ -0,0 +1,238 @@
+"""Precomputed answer table for QMD nucleosynthesis chambers."""
+
+from .... import core
+from ....components.types import *
+from ....components.defaults import QMD_NUCLEOSYNTHESIS_COMPONENTS
+from ... import base
+
+import os
+import json
+import math
+import time
+import bisect
+import hashlib
+import pathlib
+import typing
+
+import pydantic
+
+from ortools.sat.python import cp_model
+
+if typing.TYPE_CHECKING:
+    from .designer import NucleosynthesisDesigner
+
+
+SYMMETRIES: tuple[tuple[bool, bool], ...] = ((False, False), (True, False), (False, True), (True, True))
+"""Every (x_symmetry, z_symmetry) option of `NucleosynthesisDesigner`."""
+
+
+class TableColumn(pydantic.BaseModel):
+    """The achievable cooling totals of a nucleosynthesis chamber under one symmetry option, each with a design.
+
+    Attributes:
+        x_symmetry (bool): Whether the designs are symmetric along the x axis.
+        z_symmetry (bool): Whether the designs are symmetric along the z axis.
+        totals (list[int]): The achievable cooling totals, in increasing order.
+        template (list[int]): The component ID of each cell of the first design, which holds for every cell not in `cells`.
+        cells (list[int]): The cells whose component varies between designs, one per group of aliased cells.
+        designs (list[list[int]]): The component ID of each of `cells` in the design of each total.
+        complete (bool): Whether `totals` holds every achievable total. Otherwise it holds every achievable total up to its last one.
+    """
+    x_symmetry: bool
+    z_symmetry: bool
+    totals: list[int]
+    template: list[int]
+    cells: list[int]
+    designs: list[list[int]]
+    complete: bool
+
+    def lookup(self, recipe_heat: int) -> int | None:
+        """Find the design of least excess cooling for a recipe.
+
+        Args:
+            recipe_heat (int): The heat of the recipe.
+
+        Returns:
+            int | None: The index of the design, or None if no total of the column covers the recipe.
+        """
+        i = bisect.bisect_left(self.totals, recipe_heat)
+        return i if i < len(self.totals) else None
+
+    def values(self, i: int, groups: core.utils.multi_sequence.MultiSequence[int]) -> list[int]:
+        """Get the component ID of each cell of a design.
+
+        Args:
+            i (int): The index of the design.
+            groups (core.utils.multi_sequence.MultiSequence[int]): The representative cell of each cell, from `Designer.cell_groups`.
+
+        Returns:
+            list[int]: The component ID of each cell.
+        """
+        values = dict(zip(self.cells, self.designs[i]))
+        return [values.get(group, self.template[j]) for j, group in enumerate(groups)]
+
+
+class NucleosynthesisTable(pydantic.BaseModel):
+    """The achievable cooling totals of a nucleosynthesis chamber, computed once per component list and limits.
+
+    The shape of the chamber is fixed, and the recipe heat only enters the model through `cooling >= recipe_heat`. The
+    best design for any recipe is therefore the design of the least achievable total that covers it, which a table of
+    every achievable total answers by binary search, without invoking CP-SAT.
+
+    Attributes:
+        key (str): The hash of the components and component limits the table was built for.
+        columns (list[TableColumn]): The totals of each symmetry option the table was built for.
+    """
+    key: str
+    columns: list[TableColumn]
+
+    @staticmethod
+    def key_of(components: list[Component], component_limits: dict[str, tuple[int | None, int | None]]) -> str:
+        """Compute the key of a table.
+
+        Args:
+            components (list[Component]): The chamber components.
+            component_limits (dict[str, tuple[int | None, int | None]]): The minimum and maximum quantity of components, by full name.
+
+        Returns:
+            str: The key.
+        """
+        spec = json.dumps({
+            "components": [component.model_dump(mode="json") for component in components],
+            "component_limits": {name: list(limits) for name, limits in component_limits.items()}
+        }, sort_keys=True)
+        return hashlib.sha256(spec.encode()).hexdigest()
+
+    @classmethod
+    def build(
+            cls,
+            *,
+            components: list[Component] | None = None,
+            component_limits: dict[str, tuple[int | None, int | None]] | None = None,
+            symmetries: typing.Iterable[tuple[bool, bool]] = SYMMETRIES,
+            max_heat: int | None = None,
+            timeout: float | None = None,
+            config: base.solver.SolverConfig | None = None
+    ) -> typing.Self:
+        """Compute the table of a component list and limits.
+
+        Each symmetry option reuses a single model. Starting from a total of 0, each pass minimizes the cooling above
+        the next candidate total, hinted with the previous design. Every design found along the way is kept, so that
+        candidate totals already reached are skipped, and candidates step by the GCD of the cooling of the heaters.
+
+        The build therefore costs up to one CP-SAT solve per multiple of that GCD, per symmetry option: 10 to 20 solves
+        per option for a `max_heat` of 100 with the default components, but thousands without `max_heat`. `timeout`
+        bounds the whole build; columns cut short by it are left incomplete, and recipes past them fall back to CP-SAT.
+
+        Args:
+            components (list[Component] | None, optional): The chamber components. Defaults to None.
+            component_limits (dict[str, tuple[int | None, int | None]] | None, optional): The minimum and maximum quantity of components, by full name. Defaults to None.
+            symmetries (typing.Iterable[tuple[bool, bool]], optional): The (x_symmetry, z_symmetry) options to build. Defaults to all four.
+            max_heat (int | None, optional): Stop each column once it covers this recipe heat. Defaults to None, which enumerates every achievable total.
+            timeout (float | None, optional): The time limit of the whole build, shared by its passes. A pass that times out ends its column. Defaults to None.
+            config (base.solver.SolverConfig | None, optional): The solver configuration. Defaults to None.
+
+        Returns:
+            NucleosynthesisTable: The table.
+        """
+        from .designer import NucleosynthesisDesigner
+
+        components = components if not isinstance(components, type(None)) else QMD_NUCLEOSYNTHESIS_COMPONENTS
+        component_limits = component_limits if not isinstance(component_limits, type(None)) else dict()
+        config = config if not isinstance(config, type(None)) else base.solver.SolverConfig()
+        start = time.perf_counter()
+        step = math.gcd(*(component.cooling for component in components if isinstance(component, NucleosynthesisHeater))) or 1
+
+        columns = []
+        for x_symmetry, z_symmetry in symmetries:
+            designer = NucleosynthesisDesigner(recipe_heat=0, x_symmetry=x_symmetry, z_symmetry=z_symmetry, components=components, component_limits=component_limits)
+            model, seq = designer.create_model()
+            # With a recipe heat of 0, the objective of the model is the total cooling.
+            cooling, _ = base.solver.objective_expr(model)
+            bound = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model, "bound"))
+            model.Add(cooling >= bound)
+            domains = designer.cell_domains()
+            groups = designer.cell_groups()
+            cells = [i for i, group in enumerate(groups) if group == i and len(domains[i]) > 1]
+
+            found: dict[int, list[int]] = dict()
+
+            def collect(values: list[int], objective: float) -> None:
+                found.setdefault(round(objective), values)
+
+            totals: list[int] = []
+            complete = False
+            candidate = 0
+            while isinstance(max_heat, type(None)) or len(totals) == 0 or totals[-1] < max_heat:
+                if candidate not in found:
+                    remaining = None if isinstance(timeout, type(None)) else timeout - (time.perf_counter() - start)
+                    if not isinstance(remaining, type(None)) and remaining <= 0:
+                        break
+                    bound.Proto().domain[:] = [candidate, candidate]
+                    solver = cp_model.CpSolver()
+                    config.apply(solver, timeout=remaining)
+                    status = solver.Solve(model, base.solver.SolutionCallback(seq, lambda values: values, lambda result: collect(result.seq, result.objective)))
+                    if status == cp_model.INFEASIBLE:
+                        complete = True
+                        break
+                    if status != cp_model.OPTIMAL:
+                        break
+                    values = [solver.Value(comp) for comp in seq]
+                    candidate = round(solver.ObjectiveValue())
+                    found[candidate] = values
+                    model.ClearHints()
+                    for var, value in {var.Index(): (var, value) for var, value in zip(seq, values)}.values():
+                        model.AddHint(var, value)
+                totals.append(candidate)
+                candidate += step
+
+            template = found[totals[0]] if len(totals) > 0 else [next(iter(domain)) if len(domain) > 0 else 0 for domain in domains]
+            columns.append(TableColumn(
+                x_symmetry=x_symmetry,
+                z_symmetry=z_symmetry,
+                totals=totals,
+                template=template,
+                cells=cells,
+                designs=[[found[total][i] for i in cells] for total in totals],
+                complete=complete
+            ))
+        return cls(key=cls.key_of(components, component_limits), columns=columns)
+
+    def column(self, designer: "NucleosynthesisDesigner") -> TableColumn | None:
+        """Get the column of a designer.
+
+        Args:
+            designer (NucleosynthesisDesigner): The designer.
+
+        Returns:
+            TableColumn | None: The column of the symmetry option of the designer, or None if it was not built.
+
+        Raises:
+            ValueError: If the table was built for other components or component limits.
+        """
+        if self.key != self.key_of(designer.components, designer.component_limits):
+            raise ValueError("The table was built for other components or component limits.")
+        for column in self.columns:
+            if column.x_symmetry == designer.x_symmetry and column.z_symmetry == designer.z_symmetry:
+                return column
+        return None
+
+    def save(self, path: str | os.PathLike) -> None:
+        """Write the table to a file.
+
+        Args:
+            path (str | os.PathLike): The path of the file.
+        """
+        pathlib.Path(path).write_text(self.model_dump_json())
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> typing.Self:
+        """Read a table from a file.
+
+        Args:
+            path (str | os.PathLike): The path of the file.
+
+        Returns:
+            NucleosynthesisTable: The table.
+        """
+        return cls.model_validate_json(pathlib.Path(path).read_text())
@@ -0,0 +1,197 @@
+"""Parameter sweeps over QMD accelerator designers."""
+
+from ... import core
+from ...components.types import *
+from .. import base
+
+import typing
+import inspect
+import itertools
+
+from ortools.sat.python import cp_model
+from ortools.sat import cp_model_pb2
+
+
+HARDER_WHEN_LARGER = ("minimum_energy", "target_focus", "beam_strength")
+"""Parameters for which a larger value can only make an accelerator harder to design."""
+
+
+class SweepPoint:
+    """A single point of a parameter sweep.
+
+    Attributes:
+        params (dict[str, typing.Any]): The swept parameters of the point.
+        status (cp_model_pb2.CpSolverStatus): The status of the solver.
+        seq (core.utils.multi_sequence.MultiSequence[Component] | None): The designed accelerator, or None if none was found.
+        objective (float | None): The objective value of the design.
+        pruned (bool): Whether the point was skipped because a dominating point was proven infeasible.
+    """
+    def __init__(
+            self,
+            params: dict[str, typing.Any],
+            status: cp_model_pb2.CpSolverStatus,
+            seq: core.utils.multi_sequence.MultiSequence[Component] | None,
+            *,
+            objective: float | None = None,
+            pruned: bool = False
+    ) -> None:
+        self.params = params
+        self.status = status
+        self.seq = seq
+        self.objective = objective
+        self.pruned = pruned
+
+    @property
+    def feasible(self) -> bool:
+        return self.status == cp_model.OPTIMAL or self.status == cp_model.FEASIBLE
+
+    def to_dict(self) -> dict[str, typing.Any]:
+        return {
+            **self.params,
+            "status": cp_model_pb2.CpSolverStatus.Name(self.status),
+            "objective": self.objective,
+            "pruned": self.pruned
+        }
+
+
+class SweepResults:
+    """The results of a parameter sweep, one row per grid point."""
+    def __init__(self, rows: list[SweepPoint]) -> None:
+        self.rows = rows
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> typing.Iterator[SweepPoint]:
+        return iter(self.rows)
+
+    def where(self, **params: typing.Any) -> typing.Self:
+        """Select the points whose parameters match the given values.
+
+        Args:
+            **params (typing.Any): The parameter values to match.
+
+        Returns:
+            SweepResults: The matching points.
+        """
+        return type(self)([row for row in self.rows if all(row.params.get(name) == value for name, value in params.items())])
+
+    def feasible(self) -> typing.Self:
+        """Select the points for which a design was found.
+
+        Returns:
+            SweepResults: The feasible points.
+        """
+        return type(self)([row for row in self.rows if row.feasible])
+
+    def best(self) -> SweepPoint | None:
+        """Find the point with the lowest objective value (the power requirement for accelerators).
+
+        Returns:
+            SweepPoint | None: The best point, or None if no design was found.
+        """
+        feasible = [row for row in self.rows if row.feasible and not isinstance(row.objective, type(None))]
+        if len(feasible) == 0:
+            return None
+        return min(feasible, key=lambda row: row.objective)
+
+    def to_records(self) -> list[dict[str, typing.Any]]:
+        """Convert the results into a list of records, e.g. for `pandas.DataFrame.from_records`.
+
+        Returns:
+            list[dict[str, typing.Any]]: One record per point.
+        """
+        return [row.to_dict() for row in self.rows]
+
+
+class Sweep:
+    """A parameter sweep over a QMD accelerator designer.
+
+    Grid points are solved from easiest to hardest. Each point is hinted with the design of the nearest solved point, and
+    points dominated by a point proven infeasible (same size, and no easier in `minimum_energy`, `target_focus` and
+    `beam_strength`) are pruned without solving.
+    """
+    def __init__(self, designer: type[base.designer.Designer], ranges: dict[str, typing.Sequence[typing.Any]], **params: typing.Any) -> None:
+        """
+        Args:
+            designer (type[base.designer.Designer]): The designer class, e.g. `LinearAcceleratorDesigner`, `SynchrotronDesigner` or `DeceleratorDesigner`.
+            ranges (dict[str, typing.Sequence[typing.Any]]): The values of each swept parameter, e.g. `length`/`side_length`, `minimum_energy`, `target_focus` and `beam_strength`.
+            **params (typing.Any): The fixed parameters passed to every designer.
+        """
+        signature = inspect.signature(designer)
+        for name in itertools.chain(ranges, params):
+            if name not in signature.parameters:
+                raise ValueError(f"{designer.__name__} has no parameter {name!r}.")
+        self.designer = designer
+        self.ranges = {name: list(values) for name, values in ranges.items()}
+        self.params = params
+
+    def grid(self) -> list[dict[str, typing.Any]]:
+        """The grid points of the sweep, ordered from easiest to hardest within each size.
+
+        Returns:
+            list[dict[str, typing.Any]]: The swept parameters of each point.
+        """
+        names = list(self.ranges)
+        points = [dict(zip(names, values)) for values in itertools.product(*(sorted(self.ranges[name]) for name in names))]
+        key_names = [name for name in names if name not in HARDER_WHEN_LARGER] + [name for name in names if name in HARDER_WHEN_LARGER]
+        return sorted(points, key=lambda point: tuple(point[name] for name in key_names))
+
+    def dominates(self, infeasible: dict[str, typing.Any], point: dict[str, typing.Any]) -> bool:
+        """Check whether an infeasible point implies that another point is infeasible.
+
+        Args:
+            infeasible (dict[str, typing.Any]): The swept parameters of a point proven infeasible.
+            point (dict[str, typing.Any]): The swept parameters of another point.
+
+        Returns:
+            bool: Whether the other point is at least as hard as the infeasible one.
+        """
+        for name, value in point.items():
+            if name in HARDER_WHEN_LARGER:
+                if value < infeasible[name]:
+                    return False
+            elif value != infeasible[name]:
+                return False
+        return True
+
+    def distance(self, a: dict[str, typing.Any], b: dict[str, typing.Any]) -> int:
+        """The distance between two grid points, in grid steps.
+
+        Args:
+            a (dict[str, typing.Any]): The swept parameters of a point.
+            b (dict[str, typing.Any]): The swept parameters of another point.
+
+        Returns:
+            int: The number of grid steps between the points.
+        """
+        return sum(abs(sorted(values).index(a[name]) - sorted(values).index(b[name])) for name, values in self.ranges.items())
+
+    def run(
+            self,
+            *,
+            timeout: float | None = None,
+            config: base.solver.SolverConfig | None = None,
+            cache: base.cache.ModelCache | None = None
+    ) -> SweepResults:
+        """Run the sweep.
+
+        Args:
+            timeout (float | None, optional): The time limit of each search. Defaults to None.
+            config (base.solver.SolverConfig | None, optional): The solver configuration of each search. Defaults to None.
+            cache (base.cache.ModelCache | None, optional): The cache to load built models from, or to store them in. Defaults to None.
+
+        Returns:
+            SweepResults: The results of the sweep.
+        """
+        rows: list[SweepPoint] = []
+        for point in self.grid():
+            if any(row.status == cp_model.INFEASIBLE and not row.pruned and self.dominates(row.params, point) for row in rows):
+                rows.append(SweepPoint(point, cp_model.INFEASIBLE, None, pruned=True))
+                continue
+            solved = [row for row in rows if row.feasible]
+            hint = min(solved, key=lambda row: self.distance(row.params, point)).seq if len(solved) > 0 else None
+            designer = self.designer(**point, **self.params)
+            result = designer.solve(timeout=timeout, config=config, hint=hint, cache=cache)
+            rows.append(SweepPoint(point, result.status, result.seq, objective=result.objective))
+        return SweepResults(rows)
@@ -4,14 +4,14 @@ from .... import core
 from ....components.types import *
 from ... import base
 
-import uuid
+import math
 
 from ortools.sat.python import cp_model
 
 
 class TotalHeatingRate(base.calculations.Calculation):
     """Calculates the total heating rate of a linear accelerator configuration."""
-    def __call__(self, seq: core.multi_sequence.MultiSequence[Component]) -> float:
+    def __call__(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> float:
         total_heating_rate = 0
         # North side
         for z in range(2, seq.shape[1] - 2):
@@ -34,47 +34,41 @@ class TotalHeatingRate(base.calculations.Calculation):
     def to_model(
             self,
             model: cp_model.CpModel,
-            seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-            components: list[Component]
+            seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+            components: base.component_index.ComponentIndex
     ) -> cp_model.IntVar:
-        type_to_id = dict()
-        for i, component in enumerate(components):
-            if component.type not in type_to_id:
-                type_to_id[component.type] = [i]
-            else:
-                type_to_id[component.type].append(i)
-        heating_rates = [component.heat if isinstance(component, (RFCavity, AcceleratorMagnet)) else 0 for component in components]
+        heating_rates = components.vector("heat", (RFCavity, AcceleratorMagnet))
 
         # North side
-        heat_contrib_N = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[1] - 4)]
+        heat_contrib_N = []
         for z in range(2, seq.shape[1] - 2):
-            model.AddElement(seq[2, z, 3], heating_rates, heat_contrib_N[z - 2])
+            heat_contrib_N.append(core.utils.cp_utils.element(model, seq[2, z, 3], heating_rates))
         
         # South side
-        heat_contrib_S = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[1] - 4)]
+        heat_contrib_S = []
         for z in range(2, seq.shape[1] - 2):
-            model.AddElement(seq[seq.shape[0] - 3, z, 3], heating_rates, heat_contrib_S[z - 2])
+            heat_contrib_S.append(core.utils.cp_utils.element(model, seq[seq.shape[0] - 3, z, 3], heating_rates))
         
         # West side
-        heat_contrib_W = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[0] - 8)]
+        heat_contrib_W = []
         for x in range(4, seq.shape[0] - 4):
-            model.AddElement(seq[x, 2, 3], heating_rates, heat_contrib_W[x - 4])
+            heat_contrib_W.append(core.utils.cp_utils.element(model, seq[x, 2, 3], heating_rates))
         
         # East side
-        heat_contrib_E = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[0] - 8)]
+        heat_contrib_E = []
         for x in range(4, seq.shape[0] - 4):
-            model.AddElement(seq[x, seq.shape[1] - 3, 3], heating_rates, heat_contrib_E[x - 4])
+            heat_contrib_E.append(core.utils.cp_utils.element(model, seq[x, seq.shape[1] - 3, 3], heating_rates))
         
-        total_heating_rate_N = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        total_heating_rate_N = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.Add(sum(heat_contrib_N) == total_heating_rate_N)
-        total_heating_rate_S = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        total_heating_rate_S = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.Add(sum(heat_contrib_S) == total_heating_rate_S)
-        total_heating_rate_W = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        total_heating_rate_W = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.Add(sum(heat_contrib_W) == total_heating_rate_W)
-        total_heating_rate_E = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        total_heating_rate_E = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.Add(sum(heat_contrib_E) == total_heating_rate_E)
 
-        total_heating_rate = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        total_heating_rate = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.Add(sum([total_heating_rate_N, total_heating_rate_S, total_heating_rate_W, total_heating_rate_E]) == total_heating_rate)
 
         return total_heating_rate
@@ -82,7 +76,7 @@ class TotalHeatingRate(base.calculations.Calculation):
 
 class TotalCoolingRate(base.calculations.Calculation):
     """Calculates the total cooling rate of a linear accelerator configuration."""
-    def __call__(self, seq: core.multi_sequence.MultiSequence[Component]) -> float:
+    def __call__(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> float:
         total_cooling_rate = 0
         for i, component in enumerate(seq):
             if isinstance(component, AcceleratorCooler):
@@ -92,22 +86,16 @@ class TotalCoolingRate(base.calculations.Calculation):
     def to_model(
             self,
             model: cp_model.CpModel,
-            seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-            components: list[Component]
+            seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+            components: base.component_index.ComponentIndex
     ) -> cp_model.IntVar:
-        type_to_id = dict()
-        for i, component in enumerate(components):
-            if component.type not in type_to_id:
-                type_to_id[component.type] = [i]
-            else:
-                type_to_id[component.type].append(i)
-        cooling_rates = [component.cooling if isinstance(component, AcceleratorCooler) else 0 for component in components]
-
-        cool_contrib = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in seq]
+        cooling_rates = components.vector("cooling", AcceleratorCooler)
+
+        cool_contrib = []
         for i, component in enumerate(seq):
-            model.AddElement(seq[i], cooling_rates, cool_contrib[i])
+            cool_contrib.append(core.utils.cp_utils.element(model, seq[i], cooling_rates))
 
-        total_cooling_rate = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        total_cooling_rate = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.Add(total_cooling_rate == sum(cool_contrib))
 
         return total_cooling_rate
@@ -119,7 +107,7 @@ class MaxDipoleEnergy(base.calculations.Calculation):
         self.radius = radius
         self.mass = mass
     
-    def __call__(self, seq: core.multi_sequence.MultiSequence[Component]) -> float:
+    def __call__(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> float:
         dipole_strength = 0.0
         # North side
         for z in range(2, seq.shape[1] - 2):
@@ -142,88 +130,78 @@ class MaxDipoleEnergy(base.calculations.Calculation):
     def to_model(
             self,
             model: cp_model.CpModel,
-            seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-            components: list[Component]
+            seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+            components: base.component_index.ComponentIndex
     ) -> cp_model.IntVar:
-        type_to_id = dict()
-        for i, component in enumerate(components):
-            if component.type not in type_to_id:
-                type_to_id[component.type] = [i]
-            else:
-                type_to_id[component.type].append(i)
-        yoke_ids = type_to_id["yoke"]
-        strengths = [round(component.strength * 10) if isinstance(component, AcceleratorMagnet) else 0 for component in components]
+        one_hot = base.one_hot.OneHot.of(model, components)
+        strengths = components.vector("strength", AcceleratorMagnet, scale=10)
 
         # North side
-        strength_contrib_N = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[1] - 4)]
-        is_dipole_N = [model.NewBoolVar(str(uuid.uuid4())) for _ in range(seq.shape[1] - 4)]
+        strength_contrib_N = []
+        is_dipole_N = []
         for z in range(2, seq.shape[1] - 2):
-            model.AddAllowedAssignments([seq[1, z, 3]], [(yoke_id,) for yoke_id in yoke_ids]).OnlyEnforceIf(is_dipole_N[z - 2])
-            model.AddForbiddenAssignments([seq[1, z, 3]], [(yoke_id,) for yoke_id in yoke_ids]).OnlyEnforceIf(is_dipole_N[z - 2].Not())
-            model.AddElement(seq[2, z, 3], strengths, strength_contrib_N[z - 2])
+            is_dipole_N.append(one_hot.of_type(seq[1, z, 3], "yoke"))
+            strength_contrib_N.append(core.utils.cp_utils.element(model, seq[2, z, 3], strengths))
         
-        strength_contrib_N_ = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[1] - 4)]
+        strength_contrib_N_ = [model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model)) for _ in range(seq.shape[1] - 4)]
         for i in range(seq.shape[1] - 4):
             model.AddMultiplicationEquality(strength_contrib_N_[i], is_dipole_N[i], strength_contrib_N[i])
         
-        total_strength_N = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        total_strength_N = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.Add(sum(strength_contrib_N_) == total_strength_N)
         
         # South side
-        strength_contrib_S = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[1] - 4)]
-        is_dipole_S = [model.NewBoolVar(str(uuid.uuid4())) for _ in range(seq.shape[1] - 4)]
+        strength_contrib_S = []
+        is_dipole_S = []
         for z in range(2, seq.shape[1] - 2):
-            model.AddAllowedAssignments([seq[seq.shape[0] - 2, z, 3]], [(yoke_id,) for yoke_id in yoke_ids]).OnlyEnforceIf(is_dipole_S[z - 2])
-            model.AddForbiddenAssignments([seq[seq.shape[0] - 2, z, 3]], [(yoke_id,) for yoke_id in yoke_ids]).OnlyEnforceIf(is_dipole_S[z - 2].Not())
-            model.AddElement(seq[seq.shape[0] - 3, z, 3], strengths, strength_contrib_S[z - 2])
+            is_dipole_S.append(one_hot.of_type(seq[seq.shape[0] - 2, z, 3], "yoke"))
+            strength_contrib_S.append(core.utils.cp_utils.element(model, seq[seq.shape[0] - 3, z, 3], strengths))
         
-        strength_contrib_S_ = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[1] - 4)]
+        strength_contrib_S_ = [model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model)) for _ in range(seq.shape[1] - 4)]
         for i in range(seq.shape[1] - 4):
             model.AddMultiplicationEquality(strength_contrib_S_[i], is_dipole_S[i], strength_contrib_S[i])
         
-        total_strength_S = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        total_strength_S = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.Add(sum(strength_contrib_S_) == total_strength_S)
         
         # West side
-        strength_contrib_W = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[0] - 8)]
-        is_dipole_W = [model.NewBoolVar(str(uuid.uuid4())) for _ in range(seq.shape[0] - 8)]
+        strength_contrib_W = []
+        is_dipole_W = []
         for x in range(4, seq.shape[0] - 4):
-            model.AddAllowedAssignments([seq[x, 1, 3]], [(yoke_id,) for yoke_id in yoke_ids]).OnlyEnforceIf(is_dipole_W[x - 4])
-            model.AddForbiddenAssignments([seq[x, 1, 3]], [(yoke_id,) for yoke_id in yoke_ids]).OnlyEnforceIf(is_dipole_W[x - 4].Not())
-            model.AddElement(seq[x, 2, 3], strengths, strength_contrib_W[x - 4])
+            is_dipole_W.append(one_hot.of_type(seq[x, 1, 3], "yoke"))
+            strength_contrib_W.append(core.utils.cp_utils.element(model, seq[x, 2, 3], strengths))
         
-        strength_contrib_W_ = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[0] - 8)]
+        strength_contrib_W_ = [model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model)) for _ in range(seq.shape[0] - 8)]
         for i in range(seq.shape[0] - 8):
             model.AddMultiplicationEquality(strength_contrib_W_[i], is_dipole_W[i], strength_contrib_W[i])
         
-        total_strength_W = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        total_strength_W = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.Add(sum(strength_contrib_W_) == total_strength_W)
         
         # East side
-        strength_contrib_E = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[0] - 8)]
-        is_dipole_E = [model.NewBoolVar(str(uuid.uuid4())) for _ in range(seq.shape[0] - 8)]
+        strength_contrib_E = []
+        is_dipole_E = []
         for x in range(4, seq.shape[0] - 4):
-            model.AddAllowedAssignments([seq[x, seq.shape[1] - 2, 3]], [(yoke_id,) for yoke_id in yoke_ids]).OnlyEnforceIf(is_dipole_E[x - 4])
-            model.AddForbiddenAssignments([seq[x, seq.shape[1] - 2, 3]], [(yoke_id,) for yoke_id in yoke_ids]).OnlyEnforceIf(is_dipole_E[x - 4].Not())
-            model.AddElement(seq[x, seq.shape[1] - 3, 3], strengths, strength_contrib_E[x - 4])
+            is_dipole_E.append(one_hot.of_type(seq[x, seq.shape[1] - 2, 3], "yoke"))
+            strength_contrib_E.append(core.utils.cp_utils.element(model, seq[x, seq.shape[1] - 3, 3], strengths))
         
-        strength_contrib_E_ = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[0] - 8)]
+        strength_contrib_E_ = [model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model)) for _ in range(seq.shape[0] - 8)]
         for i in range(seq.shape[0] - 8):
             model.AddMultiplicationEquality(strength_contrib_E_[i], is_dipole_E[i], strength_contrib_E[i])
         
-        total_strength_E = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        total_strength_E = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.Add(sum(strength_contrib_E_) == total_strength_E)
 
-        total_strength = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        total_strength = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.Add(total_strength == sum([total_strength_N, total_strength_S, total_strength_W, total_strength_E]))
 
-        total_strength_sq = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        total_strength_sq = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         base.scaled_calculations.multiply(model, total_strength_sq, total_strength, total_strength, scale_factor=10)
 
         multiplier = (self.charge * self.radius) ** 2 / (2 * self.mass)
         multiplier = round(multiplier * base.scaled_calculations.SCALE_FACTOR)
 
-        dipole_energy = model.NewIntVar(0, 2 ** 48 - 1, str(uuid.uuid4()))
+        dipole_energy = model.NewIntVar(0, 2 ** 48 - 1, core.utils.cp_utils.var_name(model))
         base.scaled_calculations.multiply(model, dipole_energy, total_strength_sq, multiplier, max_value=2 ** 48 - 1, scale_factor=10)
 
         return dipole_energy
@@ -235,7 +213,7 @@ class MaxRadiationLoss(base.calculations.Calculation):
         self.radius = radius
         self.mass = mass
     
-    def __call__(self, seq: core.multi_sequence.MultiSequence[Component]) -> float:
+    def __call__(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> float:
         total_voltage = 0
         # North side
         for z in range(2, seq.shape[1] - 2):
@@ -259,65 +237,69 @@ class MaxRadiationLoss(base.calculations.Calculation):
     def to_model(
             self,
             model: cp_model.CpModel,
-            seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-            components: list[Component]
+            seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+            components: base.component_index.ComponentIndex
     ) -> cp_model.IntVar:
-        type_to_id = dict()
-        for i, component in enumerate(components):
-            if component.type not in type_to_id:
-                type_to_id[component.type] = [i]
-            else:
-                type_to_id[component.type].append(i)
-        voltages = [component.voltage if isinstance(component, RFCavity) else 0 for component in components]
+        voltages = components.vector("voltage", RFCavity)
 
         # North side
-        voltage_contrib_N = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[1] - 4)]
+        voltage_contrib_N = []
         for z in range(2, seq.shape[1] - 2):
-            model.AddElement(seq[2, z, 3], voltages, voltage_contrib_N[z - 2])
+            voltage_contrib_N.append(core.utils.cp_utils.element(model, seq[2, z, 3], voltages))
 
-        total_voltage_N = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        total_voltage_N = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.Add(sum(voltage_contrib_N) == total_voltage_N)
         
         # South side
-        voltage_contrib_S = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[1] - 4)]
+        voltage_contrib_S = []
         for z in range(2, seq.shape[1] - 2):
-            model.AddElement(seq[seq.shape[0] - 3, z, 3], voltages, voltage_contrib_S[z - 2])
+            voltage_contrib_S.append(core.utils.cp_utils.element(model, seq[seq.shape[0] - 3, z, 3], voltages))
         
-        total_voltage_S = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        total_voltage_S = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.Add(sum(voltage_contrib_S) == total_voltage_S)
         
         # West side
-        voltage_contrib_W = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[0] - 8)]
+        voltage_contrib_W = []
         for x in range(4, seq.shape[0] - 4):
-            model.AddElement(seq[x, 2, 3], voltages, voltage_contrib_W[x - 4])
+            voltage_contrib_W.append(core.utils.cp_utils.element(model, seq[x, 2, 3], voltages))
         
-        total_voltage_W = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        total_voltage_W = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.Add(sum(voltage_contrib_W) == total_voltage_W)
         
         # East side
-        voltage_contrib_E = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[0] - 8)]
+        voltage_contrib_E = []
         for x in range(4, seq.shape[0] - 4):
-            model.AddElement(seq[x, seq.shape[1] - 3, 3], voltages, voltage_contrib_E[x - 4])
+            voltage_contrib_E.append(core.utils.cp_utils.element(model, seq[x, seq.shape[1] - 3, 3], voltages))
         
-        total_voltage_E = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        total_voltage_E = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.Add(sum(voltage_contrib_E) == total_voltage_E)
 
-        total_voltage = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        multiplier = self.mass * (3 * self.radius / abs(self.charge)) ** (1 / 4)
+        multiplier = round(multiplier * base.scaled_calculations.SCALE_FACTOR)
+
+        radiation_energy = model.NewIntVar(0, 2 ** 48 - 1, core.utils.cp_utils.var_name(model))
+
+        # The cavities can only produce a limited set of total voltages, so the fourth root is usually a single table.
+        voltage_domain = core.utils.cp_utils.sum_domain(voltage_contrib_N + voltage_contrib_S + voltage_contrib_W + voltage_contrib_E)
+        total_voltage = model.NewIntVarFromDomain(
+            voltage_domain if not isinstance(voltage_domain, type(None)) else cp_model.Domain(0, cp_model.INT32_MAX),
+            core.utils.cp_utils.var_name(model)
+        )
         model.Add(sum([total_voltage_N, total_voltage_S, total_voltage_W, total_voltage_E]) == total_voltage)
+        if not isinstance(voltage_domain, type(None)):
+            scale_factor = base.scaled_calculations.SCALE_FACTOR
+            core.utils.cp_utils.s_table(model, radiation_energy, total_voltage, lambda v: math.isqrt(math.isqrt(v * scale_factor ** 4)) * multiplier // scale_factor)
+            return radiation_energy
 
-        total_voltage_sqrt = model.NewIntVar(1, cp_model.INT32_MAX, str(uuid.uuid4()))
+        total_voltage_sqrt = model.NewIntVar(1, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         base.scaled_calculations.sqrt(model, total_voltage_sqrt, total_voltage, scale_factor=1)
 
-        total_voltage_sqrt_ =  model.NewIntVar(1, cp_model.INT32_MAX, str(uuid.uuid4()))
+        total_voltage_sqrt_ =  model.NewIntVar(1, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.AddMultiplicationEquality(total_voltage_sqrt_, total_voltage_sqrt, base.scaled_calculations.SCALE_FACTOR)
 
-        total_voltage_4rt = model.NewIntVar(1, cp_model.INT32_MAX, str(uuid.uuid4()))
+        total_voltage_4rt = model.NewIntVar(1, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         base.scaled_calculations.sqrt(model, total_voltage_4rt, total_voltage_sqrt_)
 
-        multiplier = self.mass * (3 * self.radius / abs(self.charge)) ** (1 / 4)
-        multiplier = round(multiplier * base.scaled_calculations.SCALE_FACTOR)
-
-        radiation_energy = model.NewIntVar(0, 2 ** 48 - 1, str(uuid.uuid4()))
         base.scaled_calculations.multiply(model, radiation_energy, total_voltage_4rt, multiplier, max_value=2 ** 48 - 1)
 
         return radiation_energy
@@ -330,7 +312,7 @@ class BeamFocus(base.calculations.Calculation):
         self.scaling_factor = scaling_factor
         self.initial_focus = initial_focus
     
-    def __call__(self, seq: core.multi_sequence.MultiSequence[Component]) -> float:
+    def __call__(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> float:
         quadrupole_strength = 0.0
         # North side
         for z in range(2, seq.shape[1] - 2):
@@ -356,98 +338,92 @@ class BeamFocus(base.calculations.Calculation):
     def to_model(
             self,
             model: cp_model.CpModel,
-            seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-            components: list[Component]
+            seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+            components: base.component_index.ComponentIndex
     ) -> cp_model.IntVar:
-        type_to_id = dict()
-        for i, component in enumerate(components):
-            if component.type not in type_to_id:
-                type_to_id[component.type] = [i]
-            else:
-                type_to_id[component.type].append(i)
-        yoke_ids = type_to_id["yoke"]
-        strengths = [round(component.strength * base.scaled_calculations.SCALE_FACTOR) if isinstance(component, AcceleratorMagnet) else 0 for component in components]
+        yoke_ids = components.ids_of_type("yoke")
+        strengths = components.vector("strength", AcceleratorMagnet, scale=base.scaled_calculations.SCALE_FACTOR)
 
         # North side
-        strength_contrib_N = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[1] - 4)]
-        is_dipole_N = [model.NewBoolVar(str(uuid.uuid4())) for _ in range(seq.shape[1] - 4)]
+        strength_contrib_N = []
+        is_dipole_N = [model.NewBoolVar(core.utils.cp_utils.var_name(model)) for _ in range(seq.shape[1] - 4)]
         for z in range(2, seq.shape[1] - 2):
             model.AddAllowedAssignments([seq[1, z, 3]], [(yoke_id,) for yoke_id in yoke_ids]).OnlyEnforceIf(is_dipole_N[z - 2])
             model.AddForbiddenAssignments([seq[1, z, 3]], [(yoke_id,) for yoke_id in yoke_ids]).OnlyEnforceIf(is_dipole_N[z - 2].Not())
-            model.AddElement(seq[2, z, 3], strengths, strength_contrib_N[z - 2])
+            strength_contrib_N.append(core.utils.cp_utils.element(model, seq[2, z, 3], strengths))
         
-        strength_contrib_N_ = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[1] - 4)]
+        strength_contrib_N_ = [model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model)) for _ in range(seq.shape[1] - 4)]
         for i in range(seq.shape[1] - 4):
             model.AddMultiplicationEquality(strength_contrib_N_[i], is_dipole_N[i].Not(), strength_contrib_N[i])
         
-        total_strength_N = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        total_strength_N = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.Add(sum(strength_contrib_N_) == total_strength_N)
         
         # South side
-        strength_contrib_S = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[1] - 4)]
-        is_dipole_S = [model.NewBoolVar(str(uuid.uuid4())) for _ in range(seq.shape[1] - 4)]
+        strength_contrib_S = []
+        is_dipole_S = [model.NewBoolVar(core.utils.cp_utils.var_name(model)) for _ in range(seq.shape[1] - 4)]
         for z in range(2, seq.shape[1] - 2):
             model.AddAllowedAssignments([seq[seq.shape[0] - 2, z, 3]], [(yoke_id,) for yoke_id in yoke_ids]).OnlyEnforceIf(is_dipole_S[z - 2])
             model.AddForbiddenAssignments([seq[seq.shape[0] - 2, z, 3]], [(yoke_id,) for yoke_id in yoke_ids]).OnlyEnforceIf(is_dipole_S[z - 2].Not())
-            model.AddElement(seq[seq.shape[0] - 3, z, 3], strengths, strength_contrib_S[z - 2])
+            strength_contrib_S.append(core.utils.cp_utils.element(model, seq[seq.shape[0] - 3, z, 3], strengths))
         
-        strength_contrib_S_ = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[1] - 4)]
+        strength_contrib_S_ = [model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model)) for _ in range(seq.shape[1] - 4)]
         for i in range(seq.shape[1] - 4):
             model.AddMultiplicationEquality(strength_contrib_S_[i], is_dipole_S[i].Not(), strength_contrib_S[i])
         
-        total_strength_S = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        total_strength_S = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.Add(sum(strength_contrib_S_) == total_strength_S)
         
         # West side
-        strength_contrib_W = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[0] - 8)]
-        is_dipole_W = [model.NewBoolVar(str(uuid.uuid4())) for _ in range(seq.shape[0] - 8)]
+        strength_contrib_W = []
+        is_dipole_W = [model.NewBoolVar(core.utils.cp_utils.var_name(model)) for _ in range(seq.shape[0] - 8)]
         for x in range(4, seq.shape[0] - 4):
             model.AddAllowedAssignments([seq[x, 1, 3]], [(yoke_id,) for yoke_id in yoke_ids]).OnlyEnforceIf(is_dipole_W[x - 4])
             model.AddForbiddenAssignments([seq[x, 1, 3]], [(yoke_id,) for yoke_id in yoke_ids]).OnlyEnforceIf(is_dipole_W[x - 4].Not())
-            model.AddElement(seq[x, 2, 3], strengths, strength_contrib_W[x - 4])
+            strength_contrib_W.append(core.utils.cp_utils.element(model, seq[x, 2, 3], strengths))
         
-        strength_contrib_W_ = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[0] - 8)]
+        strength_contrib_W_ = [model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model)) for _ in range(seq.shape[0] - 8)]
         for i in range(seq.shape[0] - 8):
             model.AddMultiplicationEquality(strength_contrib_W_[i], is_dipole_W[i].Not(), strength_contrib_W[i])
         
-        total_strength_W = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        total_strength_W = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.Add(sum(strength_contrib_W_) == total_strength_W)
         
         # East side
-        strength_contrib_E = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[0] - 8)]
-        is_dipole_E = [model.NewBoolVar(str(uuid.uuid4())) for _ in range(seq.shape[0] - 8)]
+        strength_contrib_E = []
+        is_dipole_E = [model.NewBoolVar(core.utils.cp_utils.var_name(model)) for _ in range(seq.shape[0] - 8)]
         for x in range(4, seq.shape[0] - 4):
             model.AddAllowedAssignments([seq[x, seq.shape[1] - 2, 3]], [(yoke_id,) for yoke_id in yoke_ids]).OnlyEnforceIf(is_dipole_E[x - 4])
             model.AddForbiddenAssignments([seq[x, seq.shape[1] - 2, 3]], [(yoke_id,) for yoke_id in yoke_ids]).OnlyEnforceIf(is_dipole_E[x - 4].Not())
-            model.AddElement(seq[x, seq.shape[1] - 3, 3], strengths, strength_contrib_E[x - 4])
+            strength_contrib_E.append(core.utils.cp_utils.element(model, seq[x, seq.shape[1] - 3, 3], strengths))
         
-        strength_contrib_E_ = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[0] - 8)]
+        strength_contrib_E_ = [model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model)) for _ in range(seq.shape[0] - 8)]
         for i in range(seq.shape[0] - 8):
             model.AddMultiplicationEquality(strength_contrib_E_[i], is_dipole_E[i].Not(), strength_contrib_E[i])
         
-        total_strength_E = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        total_strength_E = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.Add(sum(strength_contrib_E_) == total_strength_E)
 
-        total_strength = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        total_strength = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.Add(total_strength == sum([total_strength_N, total_strength_S, total_strength_W, total_strength_E]))
 
         beams = (seq.shape[0] - 4) * 4 - 4
         focus_loss = round(0.02 * (1 + abs(self.charge) * (self.beam_strength / self.scaling_factor) ** (1 / 2)) * base.scaled_calculations.SCALE_FACTOR) * beams
 
-        focus_gain = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        focus_gain = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         base.scaled_calculations.multiply(model, focus_gain, total_strength, round(abs(self.charge) * base.scaled_calculations.SCALE_FACTOR))
 
-        focus_delta = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        focus_delta = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.Add(focus_delta == focus_gain - focus_loss)
 
-        focus = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        focus = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.Add(focus == focus_delta + round(self.initial_focus * base.scaled_calculations.SCALE_FACTOR))
 
         return focus
     
 
 class PowerRequirement(base.calculations.Calculation):
-    def __call__(self, seq: core.multi_sequence.MultiSequence[Component]) -> float:
+    def __call__(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> float:
         efficiency = 0.0
         parts = 0
         raw_power = 0
@@ -480,97 +456,91 @@ class PowerRequirement(base.calculations.Calculation):
     def to_model(
             self,
             model: cp_model.CpModel,
-            seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-            components: list[Component]
+            seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+            components: base.component_index.ComponentIndex
     ) -> cp_model.IntVar:
-        type_to_id = dict()
-        for i, component in enumerate(components):
-            if component.type not in type_to_id:
-                type_to_id[component.type] = [i]
-            else:
-                type_to_id[component.type].append(i)
-        powers = [component.power if isinstance(component, (RFCavity, AcceleratorMagnet)) else 0 for component in components]
-        efficiencies = [round(component.efficiency * base.scaled_calculations.SCALE_FACTOR) if isinstance(component, (RFCavity, AcceleratorMagnet)) else 0 for component in components]
-        is_part = [1 if isinstance(component, (RFCavity, AcceleratorMagnet)) else 0 for component in components]
+        powers = components.vector("power", (RFCavity, AcceleratorMagnet))
+        efficiencies = components.vector("efficiency", (RFCavity, AcceleratorMagnet), scale=base.scaled_calculations.SCALE_FACTOR)
+        is_part = components.mask((RFCavity, AcceleratorMagnet))
 
         # North side
-        raw_power_contrib_N = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[1] - 4)]
-        efficiency_contrib_N = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[1] - 4)]
-        is_part_N = [model.NewBoolVar(str(uuid.uuid4())) for _ in range(seq.shape[1] - 4)]
+        raw_power_contrib_N = []
+        efficiency_contrib_N = []
+        is_part_N = []
         for z in range(2, seq.shape[1] - 2):
-            model.AddElement(seq[2, z, 3], powers, raw_power_contrib_N[z - 2])
-            model.AddElement(seq[2, z, 3], efficiencies, efficiency_contrib_N[z - 2])
-            model.AddElement(seq[2, z, 3], is_part, is_part_N[z - 2])
+            raw_power_contrib_N.append(core.utils.cp_utils.element(model, seq[2, z, 3], powers))
+            efficiency_contrib_N.append(core.utils.cp_utils.element(model, seq[2, z, 3], efficiencies))
+            is_part_N.append(core.utils.cp_utils.element(model, seq[2, z, 3], is_part))
         
-        raw_power_N = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
-        efficiency_N = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
-        parts_N = model.NewIntVar(1, cp_model.INT32_MAX, str(uuid.uuid4()))
+        raw_power_N = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
+        efficiency_N = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
+        parts_N = model.NewIntVar(1, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.Add(raw_power_N == sum(raw_power_contrib_N))
         model.Add(efficiency_N == sum(efficiency_contrib_N))
         model.Add(parts_N == sum(is_part_N))
 
         # South side
-        raw_power_contrib_S = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[1] - 4)]
-        efficiency_contrib_S = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[1] - 4)]
-        is_part_S = [model.NewBoolVar(str(uuid.uuid4())) for _ in range(seq.shape[1] - 4)]
+        raw_power_contrib_S = []
+        efficiency_contrib_S = []
+        is_part_S = []
         for z in range(2, seq.shape[1] - 2):
-            model.AddElement(seq[seq.shape[0] - 3, z, 3], powers, raw_power_contrib_S[z - 2])
-            model.AddElement(seq[seq.shape[0] - 3, z, 3], efficiencies, efficiency_contrib_S[z - 2])
-            model.AddElement(seq[seq.shape[0] - 3, z, 3], is_part, is_part_S[z - 2])
+            raw_power_contrib_S.append(core.utils.cp_utils.element(model, seq[seq.shape[0] - 3, z, 3], powers))
+            efficiency_contrib_S.append(core.utils.cp_utils.element(model, seq[seq.shape[0] - 3, z, 3], efficiencies))
+            is_part_S.append(core.utils.cp_utils.element(model, seq[seq.shape[0] - 3, z, 3], is_part))
         
-        raw_power_S = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
-        efficiency_S = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
-        parts_S = model.NewIntVar(1, cp_model.INT32_MAX, str(uuid.uuid4()))
+        raw_power_S = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
+        efficiency_S = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
+        parts_S = model.NewIntVar(1, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.Add(raw_power_S == sum(raw_power_contrib_S))
         model.Add(efficiency_S == sum(efficiency_contrib_S))
         model.Add(parts_S == sum(is_part_S))
 
         # West side
-        raw_power_contrib_W = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[0] - 8)]
-        efficiency_contrib_W = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[0] - 8)]
-        is_part_W = [model.NewBoolVar(str(uuid.uuid4())) for _ in range(seq.shape[0] - 8)]
+        raw_power_contrib_W = []
+        efficiency_contrib_W = []
+        is_part_W = []
         for x in range(4, seq.shape[0] - 4):
-            model.AddElement(seq[x, 2, 3], powers, raw_power_contrib_W[x - 4])
-            model.AddElement(seq[x, 2, 3], efficiencies, efficiency_contrib_W[x - 4])
-            model.AddElement(seq[x, 2, 3], is_part, is_part_W[x - 4])
+            raw_power_contrib_W.append(core.utils.cp_utils.element(model, seq[x, 2, 3], powers))
+            efficiency_contrib_W.append(core.utils.cp_utils.element(model, seq[x, 2, 3], efficiencies))
+            is_part_W.append(core.utils.cp_utils.element(model, seq[x, 2, 3], is_part))
         
-        raw_power_W = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
-        efficiency_W = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
-        parts_W = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        raw_power_W = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
+        efficiency_W = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
+        parts_W = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.Add(raw_power_W == sum(raw_power_contrib_W))
         model.Add(efficiency_W == sum(efficiency_contrib_W))
         model.Add(parts_W == sum(is_part_W))
 
         # East side
-        raw_power_contrib_E = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[0] - 8)]
-        efficiency_contrib_E = [model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4())) for _ in range(seq.shape[0] - 8)]
-        is_part_E = [model.NewBoolVar(str(uuid.uuid4())) for _ in range(seq.shape[0] - 8)]
+        raw_power_contrib_E = []
+        efficiency_contrib_E = []
+        is_part_E = []
         for x in range(4, seq.shape[0] - 4):
-            model.AddElement(seq[x, seq.shape[1] - 3, 3], powers, raw_power_contrib_E[x - 4])
-            model.AddElement(seq[x, seq.shape[1] - 3, 3], efficiencies, efficiency_contrib_E[x - 4])
-            model.AddElement(seq[x, seq.shape[1] - 3, 3], is_part, is_part_E[x - 4])
+            raw_power_contrib_E.append(core.utils.cp_utils.element(model, seq[x, seq.shape[1] - 3, 3], powers))
+            efficiency_contrib_E.append(core.utils.cp_utils.element(model, seq[x, seq.shape[1] - 3, 3], efficiencies))
+            is_part_E.append(core.utils.cp_utils.element(model, seq[x, seq.shape[1] - 3, 3], is_part))
         
-        raw_power_E = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
-        efficiency_E = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
-        parts_E = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        raw_power_E = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
+        efficiency_E = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
+        parts_E = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.Add(raw_power_E == sum(raw_power_contrib_E))
         model.Add(efficiency_E == sum(efficiency_contrib_E))
         model.Add(parts_E == sum(is_part_E))
         
-        raw_power = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
-        efficiency = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
-        parts = model.NewIntVar(1, cp_model.INT32_MAX, str(uuid.uuid4()))
+        raw_power = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
+        efficiency = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
+        parts = model.NewIntVar(1, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.Add(raw_power == sum([raw_power_N, raw_power_S, raw_power_W, raw_power_E]))
         model.Add(efficiency == sum([efficiency_N, efficiency_S, efficiency_W, efficiency_E]))
         model.Add(parts == sum([parts_N, parts_S, parts_W, parts_E]))
 
-        reduced_efficiency = model.NewIntVar(1, cp_model.INT32_MAX, str(uuid.uuid4()))
+        reduced_efficiency = model.NewIntVar(1, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.AddDivisionEquality(reduced_efficiency, efficiency, parts)
 
-        raw_power_ = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        raw_power_ = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.AddMultiplicationEquality(raw_power_, raw_power, base.scaled_calculations.SCALE_FACTOR)
 
-        power_requirement = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        power_requirement = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.AddDivisionEquality(power_requirement, raw_power_, reduced_efficiency)
 
         return power_requirement
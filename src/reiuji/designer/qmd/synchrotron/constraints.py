@@ -5,15 +5,15 @@ from ....components.types import *
 from ... import base
 from . import calculations
 
-import uuid
+import typing
 import itertools
 
 from ortools.sat.python import cp_model 
 
 
-class BeamConstraint(base.constraints.Constraint):
+class BeamConstraint(base.constraints.LayoutConstraint):
     """Ensures that the beam is placed in a ring formation. Note that the synchrotron goes in the +x and +z direction."""
-    def is_satisfied(self, seq: core.multi_sequence.MultiSequence[Component]) -> bool:
+    def is_satisfied(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> bool:
         if seq.shape[0] != seq.shape[1] or seq.shape[2] != 5:
             raise ValueError("BeamConstraint requires a NxNx5 sequence.")
         for x in range(seq.shape[0]):
@@ -34,38 +34,27 @@ class BeamConstraint(base.constraints.Constraint):
                                 return False
         return True
     
-    def to_model(
-        self,
-        model: cp_model.CpModel,
-        seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-        components: list[Component]
-    ) -> None:
-        if seq.shape[0] != seq.shape[1] or seq.shape[2] != 5:
+    def restrict_domains(self, domains: core.utils.multi_sequence.MultiSequence[set[int]], components: base.component_index.ComponentIndex) -> None:
+        if domains.shape[0] != domains.shape[1] or domains.shape[2] != 5:
             raise ValueError("BeamConstraint requires a NxNx5 sequence.")
-        type_to_id = dict()
-        for i, component in enumerate(components):
-            if component.type not in type_to_id:
-                type_to_id[component.type] = [i]
-            else:
-                type_to_id[component.type].append(i)
-        beam_ids = type_to_id["beam"]
-        for x in range(seq.shape[0]):
-            for z in range(seq.shape[1]):
-                for y in range(seq.shape[2]):
+        beam_ids = components.ids_of_type("beam")
+        for x in range(domains.shape[0]):
+            for z in range(domains.shape[1]):
+                for y in range(domains.shape[2]):
                     if y != 2:
-                        model.AddForbiddenAssignments([seq[x, z, y]], [(beam_id,) for beam_id in beam_ids])
+                        domains[x, z, y].difference_update(beam_ids)
                     else:
-                        if 3 <= x <= (seq.shape[0] - 4) and 3 <= z <= (seq.shape[1] - 4):
-                            model.AddForbiddenAssignments([seq[x, z, y]], [(beam_id,) for beam_id in beam_ids])
-                        elif 2 <= x <= (seq.shape[0] - 3) and 2 <= z <= (seq.shape[1] - 3):
-                            model.AddAllowedAssignments([seq[x, z, y]], [(beam_id,) for beam_id in beam_ids])
+                        if 3 <= x <= (domains.shape[0] - 4) and 3 <= z <= (domains.shape[1] - 4):
+                            domains[x, z, y].difference_update(beam_ids)
+                        elif 2 <= x <= (domains.shape[0] - 3) and 2 <= z <= (domains.shape[1] - 3):
+                            domains[x, z, y].intersection_update(beam_ids)
                         else:
-                            model.AddForbiddenAssignments([seq[x, z, y]], [(beam_id,) for beam_id in beam_ids])
+                            domains[x, z, y].difference_update(beam_ids)
 
 
-class CasingConstraint(base.constraints.Constraint):
+class CasingConstraint(base.constraints.LayoutConstraint):
     """Ensures that the casing is placed properly around the beam. Note that the synchrotron goes in the +x and +z direction."""
-    def is_satisfied(self, seq: core.multi_sequence.MultiSequence[Component]) -> bool:
+    def is_satisfied(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> bool:
         if seq.shape[0] != seq.shape[1] or seq.shape[2] != 5:
             raise ValueError("CasingConstraint requires a NxNx5 sequence.")
         for y in range(seq.shape[2]):
@@ -93,43 +82,32 @@ class CasingConstraint(base.constraints.Constraint):
                                 return False
         return True
     
-    def to_model(
-        self,
-        model: cp_model.CpModel,
-        seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-        components: list[Component]
-    ) -> None:
-        if seq.shape[0] != seq.shape[1] or seq.shape[2] != 5:
+    def restrict_domains(self, domains: core.utils.multi_sequence.MultiSequence[set[int]], components: base.component_index.ComponentIndex) -> None:
+        if domains.shape[0] != domains.shape[1] or domains.shape[2] != 5:
             raise ValueError("CasingConstraint requires a NxNx5 sequence.")
-        type_to_id = dict()
-        for i, component in enumerate(components):
-            if component.type not in type_to_id:
-                type_to_id[component.type] = [i]
-            else:
-                type_to_id[component.type].append(i)
-        casing_ids = type_to_id["casing"]
-        for y in range(seq.shape[2]):
-            for x in range(seq.shape[0]):
-                for z in range(seq.shape[1]):
+        casing_ids = components.ids_of_type("casing")
+        for y in range(domains.shape[2]):
+            for x in range(domains.shape[0]):
+                for z in range(domains.shape[1]):
                     if y == 0 or y == 4:
-                        if 5 <= x <= (seq.shape[0] - 6) and 5 <= z <= (seq.shape[1] - 6):
-                            model.AddForbiddenAssignments([seq[x, z, y]], [(casing_id,) for casing_id in casing_ids])
+                        if 5 <= x <= (domains.shape[0] - 6) and 5 <= z <= (domains.shape[1] - 6):
+                            domains[x, z, y].difference_update(casing_ids)
                         else:
-                            model.AddAllowedAssignments([seq[x, z, y]], [(casing_id,) for casing_id in casing_ids])
+                            domains[x, z, y].intersection_update(casing_ids)
                     else:
-                        if 5 <= x <= (seq.shape[0] - 6) and 5 <= z <= (seq.shape[1] - 6):
-                            model.AddForbiddenAssignments([seq[x, z, y]], [(casing_id,) for casing_id in casing_ids])
-                        elif 4 <= x <= (seq.shape[0] - 5) and 4 <= z <= (seq.shape[1] - 5):
-                            model.AddAllowedAssignments([seq[x, z, y]], [(casing_id,) for casing_id in casing_ids])
-                        elif 1 <= x <= (seq.shape[0] - 2) and 1 <= z <= (seq.shape[1] - 2):
-                            model.AddForbiddenAssignments([seq[x, z, y]], [(casing_id,) for casing_id in casing_ids])
+                        if 5 <= x <= (domains.shape[0] - 6) and 5 <= z <= (domains.shape[1] - 6):
+                            domains[x, z, y].difference_update(casing_ids)
+                        elif 4 <= x <= (domains.shape[0] - 5) and 4 <= z <= (domains.shape[1] - 5):
+                            domains[x, z, y].intersection_update(casing_ids)
+                        elif 1 <= x <= (domains.shape[0] - 2) and 1 <= z <= (domains.shape[1] - 2):
+                            domains[x, z, y].difference_update(casing_ids)
                         else:
-                            model.AddAllowedAssignments([seq[x, z, y]], [(casing_id,) for casing_id in casing_ids])
+                            domains[x, z, y].intersection_update(casing_ids)
 
 
-class AirConstraint(base.constraints.Constraint):
+class AirConstraint(base.constraints.LayoutConstraint):
     """Ensures that the central portion of the synchrotron is made of air blocks. Note that the synchrotron goes in the +x and +z direction."""
-    def is_satisfied(self, seq: core.multi_sequence.MultiSequence[Component]) -> bool:
+    def is_satisfied(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> bool:
         if seq.shape[0] != seq.shape[1] or seq.shape[2] != 5:
             raise ValueError("AirConstraint requires a NxNx5 sequence.")
         for y in range(seq.shape[2]):
@@ -140,51 +118,34 @@ class AirConstraint(base.constraints.Constraint):
                             return False
         return True
     
-    def to_model(
-        self,
-        model: cp_model.CpModel,
-        seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-        components: list[Component]
-    ) -> None:
-        if seq.shape[0] != seq.shape[1] or seq.shape[2] != 5:
+    def restrict_domains(self, domains: core.utils.multi_sequence.MultiSequence[set[int]], components: base.component_index.ComponentIndex) -> None:
+        if domains.shape[0] != domains.shape[1] or domains.shape[2] != 5:
             raise ValueError("AirConstraint requires a NxNx5 sequence.")
-        type_to_id = dict()
-        for i, component in enumerate(components):
-            if component.type not in type_to_id:
-                type_to_id[component.type] = [i]
-            else:
-                type_to_id[component.type].append(i)
-        air_ids = type_to_id["air"]
-        for y in range(seq.shape[2]):
-            for x in range(seq.shape[0]):
-                for z in range(seq.shape[1]):
-                    if 5 <= x <= (seq.shape[0] - 6) and 5 <= z <= (seq.shape[1] - 6):
-                        model.AddAllowedAssignments([seq[x, z, y]], [(air_id,) for air_id in air_ids])
+        air_ids = components.ids_of_type("air")
+        for y in range(domains.shape[2]):
+            for x in range(domains.shape[0]):
+                for z in range(domains.shape[1]):
+                    if 5 <= x <= (domains.shape[0] - 6) and 5 <= z <= (domains.shape[1] - 6):
+                        domains[x, z, y].intersection_update(air_ids)
 
 
 class CavityConstraint(base.constraints.Constraint):
     """Ensures that cavities are placed properly around the beam."""
-    def is_satisfied(self, seq: core.multi_sequence.MultiSequence[Component]) -> bool:
+    def is_satisfied(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> bool:
         raise NotImplementedError("CavityConstraint.is_satisfied is not implemented.")
     
     def to_model(
         self,
         model: cp_model.CpModel,
-        seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-        components: list[Component]
+        seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+        components: base.component_index.ComponentIndex
     ) -> None:
         if seq.shape[0] != seq.shape[1] or seq.shape[2] != 5:
             raise ValueError("CavityConstraint requires a NxNx5 sequence.")
-        type_to_id = dict()
-        for i, component in enumerate(components):
-            if component.type not in type_to_id:
-                type_to_id[component.type] = [i]
-            else:
-                type_to_id[component.type].append(i)
-        cavity_ids = type_to_id["cavity"]
+        cavity_ids = components.ids_of_type("cavity")
 
         # North cavities
-        has_cavity_N = [model.NewBoolVar(str(uuid.uuid4())) for _ in range(seq.shape[1])]
+        has_cavity_N = [model.NewBoolVar(core.utils.cp_utils.var_name(model)) for _ in range(seq.shape[1])]
         for z in range(4, seq.shape[1] - 4):
             cavity_positions = [
                 seq[1, z, 1],
@@ -205,7 +166,7 @@ class CavityConstraint(base.constraints.Constraint):
             model.AddImplication(has_cavity_N[z], has_cavity_N[z + 1].Not())
         
         # South cavities
-        has_cavity_S = [model.NewBoolVar(str(uuid.uuid4())) for _ in range(seq.shape[1])]
+        has_cavity_S = [model.NewBoolVar(core.utils.cp_utils.var_name(model)) for _ in range(seq.shape[1])]
         for z in range(4, seq.shape[1] - 4):
             cavity_positions = [
                 seq[seq.shape[0] - 2, z, 1],
@@ -226,7 +187,7 @@ class CavityConstraint(base.constraints.Constraint):
             model.AddImplication(has_cavity_S[z], has_cavity_S[z + 1].Not())
             
         # West cavities
-        has_cavity_W = [model.NewBoolVar(str(uuid.uuid4())) for _ in range(seq.shape[0])]
+        has_cavity_W = [model.NewBoolVar(core.utils.cp_utils.var_name(model)) for _ in range(seq.shape[0])]
         for x in range(4, seq.shape[0] - 4):
             cavity_positions = [
                 seq[x, 1, 1],
@@ -247,7 +208,7 @@ class CavityConstraint(base.constraints.Constraint):
             model.AddImplication(has_cavity_W[x], has_cavity_W[x + 1].Not())
         
         # East cavities
-        has_cavity_E = [model.NewBoolVar(str(uuid.uuid4())) for _ in range(seq.shape[0])]
+        has_cavity_E = [model.NewBoolVar(core.utils.cp_utils.var_name(model)) for _ in range(seq.shape[0])]
         for x in range(4, seq.shape[0] - 4):
             cavity_positions = [
                 seq[x, seq.shape[1] - 2, 1],
@@ -270,28 +231,22 @@ class CavityConstraint(base.constraints.Constraint):
 
 class MagnetConstraint(base.constraints.Constraint):
     """Ensures that dipoles and quadrupoles are placed properly around the beam."""
-    def is_satisfied(self, seq: core.multi_sequence.MultiSequence[Component]) -> bool:
+    def is_satisfied(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> bool:
         raise NotImplementedError("MagnetConstraint.is_satisfied is not implemented.")
     
     def to_model(
         self,
         model: cp_model.CpModel,
-        seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-        components: list[Component]
+        seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+        components: base.component_index.ComponentIndex
     ) -> None:
         if seq.shape[0] != seq.shape[1] or seq.shape[2] != 5:
             raise ValueError("MagnetConstraint requires a NxNx5 sequence.")
-        type_to_id = dict()
-        for i, component in enumerate(components):
-            if component.type not in type_to_id:
-                type_to_id[component.type] = [i]
-            else:
-                type_to_id[component.type].append(i)
-        magnet_ids = type_to_id["magnet"]
-        yoke_ids = type_to_id["yoke"]
+        magnet_ids = components.ids_of_type("magnet")
+        yoke_ids = components.ids_of_type("yoke")
         # North magnets
-        has_dipole_N = [model.NewBoolVar(str(uuid.uuid4())) for _ in range(seq.shape[1])]
-        has_quadrupole_N = [model.NewBoolVar(str(uuid.uuid4())) for _ in range(seq.shape[1])]
+        has_dipole_N = [model.NewBoolVar(core.utils.cp_utils.var_name(model)) for _ in range(seq.shape[1])]
+        has_quadrupole_N = [model.NewBoolVar(core.utils.cp_utils.var_name(model)) for _ in range(seq.shape[1])]
         model.Add(has_dipole_N[2] == 1)
         model.Add(has_dipole_N[3] == 0)
         model.Add(has_dipole_N[seq.shape[1] - 3] == 1)
@@ -311,7 +266,7 @@ class MagnetConstraint(base.constraints.Constraint):
                 seq[1, z, 3],
                 seq[3, z, 3]
             ]
-            has_magnet = model.NewBoolVar(str(uuid.uuid4()))
+            has_magnet = model.NewBoolVar(core.utils.cp_utils.var_name(model))
             model.AddBoolOr([has_dipole_N[z], has_quadrupole_N[z]]).OnlyEnforceIf(has_magnet)
             model.AddBoolAnd([has_dipole_N[z].Not(), has_quadrupole_N[z].Not()]).OnlyEnforceIf(has_magnet.Not())
             for pos in magnet_positions_center:
@@ -356,20 +311,20 @@ class MagnetConstraint(base.constraints.Constraint):
             ]
             for pos in yoke_positions_center:
                 model.AddAllowedAssignments([pos], [(yoke_id,) for yoke_id in yoke_ids]).OnlyEnforceIf(has_dipole_N[z])
-            dipole_on_sides = model.NewBoolVar(str(uuid.uuid4()))
+            dipole_on_sides = model.NewBoolVar(core.utils.cp_utils.var_name(model))
             model.AddBoolOr([has_dipole_N[z - 1], has_dipole_N[z + 1]]).OnlyEnforceIf(dipole_on_sides)
             model.AddBoolAnd([has_dipole_N[z - 1].Not(), has_dipole_N[z + 1].Not()]).OnlyEnforceIf(dipole_on_sides.Not())
             for pos in yoke_positions_side:
                 model.AddAllowedAssignments([pos], [(yoke_id,) for yoke_id in yoke_ids]).OnlyEnforceIf(dipole_on_sides)
-            dipole_in_range = model.NewBoolVar(str(uuid.uuid4()))
+            dipole_in_range = model.NewBoolVar(core.utils.cp_utils.var_name(model))
             model.AddBoolOr([has_dipole_N[z], dipole_on_sides]).OnlyEnforceIf(dipole_in_range)
             model.AddBoolAnd([has_dipole_N[z].Not(), dipole_on_sides.Not()]).OnlyEnforceIf(dipole_in_range.Not())
             for pos in yoke_positions_side:
                 model.AddForbiddenAssignments([pos], [(yoke_id,) for yoke_id in yoke_ids]).OnlyEnforceIf(dipole_in_range.Not())
 
         # South magnets
-        has_dipole_S = [model.NewBoolVar(str(uuid.uuid4())) for _ in range(seq.shape[1])]
-        has_quadrupole_S = [model.NewBoolVar(str(uuid.uuid4())) for _ in range(seq.shape[1])]
+        has_dipole_S = [model.NewBoolVar(core.utils.cp_utils.var_name(model)) for _ in range(seq.shape[1])]
+        has_quadrupole_S = [model.NewBoolVar(core.utils.cp_utils.var_name(model)) for _ in range(seq.shape[1])]
         model.Add(has_dipole_S[2] == 1)
         model.Add(has_dipole_S[3] == 0)
         model.Add(has_dipole_S[seq.shape[1] - 3] == 1)
@@ -389,7 +344,7 @@ class MagnetConstraint(base.constraints.Constraint):
                 seq[seq.shape[0] - 2, z, 3],
                 seq[seq.shape[0] - 4, z, 3]
             ]
-            has_magnet = model.NewBoolVar(str(uuid.uuid4()))
+            has_magnet = model.NewBoolVar(core.utils.cp_utils.var_name(model))
             model.AddBoolOr([has_dipole_S[z], has_quadrupole_S[z]]).OnlyEnforceIf(has_magnet)
             model.AddBoolAnd([has_dipole_S[z].Not(), has_quadrupole_S[z].Not()]).OnlyEnforceIf(has_magnet.Not())
             for pos in magnet_positions_center:
@@ -434,20 +389,20 @@ class MagnetConstraint(base.constraints.Constraint):
             ]
             for pos in yoke_positions_center:
                 model.AddAllowedAssignments([pos], [(yoke_id,) for yoke_id in yoke_ids]).OnlyEnforceIf(has_dipole_S[z])
-            dipole_on_sides = model.NewBoolVar(str(uuid.uuid4()))
+            dipole_on_sides = model.NewBoolVar(core.utils.cp_utils.var_name(model))
             model.AddBoolOr([has_dipole_S[z - 1], has_dipole_S[z + 1]]).OnlyEnforceIf(dipole_on_sides)
             model.AddBoolAnd([has_dipole_S[z - 1].Not(), has_dipole_S[z + 1].Not()]).OnlyEnforceIf(dipole_on_sides.Not())
             for pos in yoke_positions_side:
                 model.AddAllowedAssignments([pos], [(yoke_id,) for yoke_id in yoke_ids]).OnlyEnforceIf(dipole_on_sides)
-            dipole_in_range = model.NewBoolVar(str(uuid.uuid4()))
+            dipole_in_range = model.NewBoolVar(core.utils.cp_utils.var_name(model))
             model.AddBoolOr([has_dipole_S[z], dipole_on_sides]).OnlyEnforceIf(dipole_in_range)
             model.AddBoolAnd([has_dipole_S[z].Not(), dipole_on_sides.Not()]).OnlyEnforceIf(dipole_in_range.Not())
             for pos in yoke_positions_side:
                 model.AddForbiddenAssignments([pos], [(yoke_id,) for yoke_id in yoke_ids]).OnlyEnforceIf(dipole_in_range.Not())
         
         # West magnets
-        has_dipole_W = [model.NewBoolVar(str(uuid.uuid4())) for _ in range(seq.shape[0])]
-        has_quadrupole_W = [model.NewBoolVar(str(uuid.uuid4())) for _ in range(seq.shape[0])]
+        has_dipole_W = [model.NewBoolVar(core.utils.cp_utils.var_name(model)) for _ in range(seq.shape[0])]
+        has_quadrupole_W = [model.NewBoolVar(core.utils.cp_utils.var_name(model)) for _ in range(seq.shape[0])]
         model.Add(has_dipole_W[2] == 1)
         model.Add(has_dipole_W[3] == 0)
         model.Add(has_dipole_W[seq.shape[0] - 3] == 1)
@@ -467,7 +422,7 @@ class MagnetConstraint(base.constraints.Constraint):
                 seq[x, 1, 3],
                 seq[x, 3, 3]
             ]
-            has_magnet = model.NewBoolVar(str(uuid.uuid4()))
+            has_magnet = model.NewBoolVar(core.utils.cp_utils.var_name(model))
             model.AddBoolOr([has_dipole_W[x], has_quadrupole_W[x]]).OnlyEnforceIf(has_magnet)
             model.AddBoolAnd([has_dipole_W[x].Not(), has_quadrupole_W[x].Not()]).OnlyEnforceIf(has_magnet.Not())
             for pos in magnet_positions_center:
@@ -512,20 +467,20 @@ class MagnetConstraint(base.constraints.Constraint):
             ]
             for pos in yoke_positions_center:
                 model.AddAllowedAssignments([pos], [(yoke_id,) for yoke_id in yoke_ids]).OnlyEnforceIf(has_dipole_W[x])
-            dipole_on_sides = model.NewBoolVar(str(uuid.uuid4()))
+            dipole_on_sides = model.NewBoolVar(core.utils.cp_utils.var_name(model))
             model.AddBoolOr([has_dipole_W[x - 1], has_dipole_W[x + 1]]).OnlyEnforceIf(dipole_on_sides)
             model.AddBoolAnd([has_dipole_W[x - 1].Not(), has_dipole_W[x + 1].Not()]).OnlyEnforceIf(dipole_on_sides.Not())
             for pos in yoke_positions_side:
                 model.AddAllowedAssignments([pos], [(yoke_id,) for yoke_id in yoke_ids]).OnlyEnforceIf(dipole_on_sides)
-            dipole_in_range = model.NewBoolVar(str(uuid.uuid4()))
+            dipole_in_range = model.NewBoolVar(core.utils.cp_utils.var_name(model))
             model.AddBoolOr([has_dipole_W[x], dipole_on_sides]).OnlyEnforceIf(dipole_in_range)
             model.AddBoolAnd([has_dipole_W[x].Not(), dipole_on_sides.Not()]).OnlyEnforceIf(dipole_in_range.Not())
             for pos in yoke_positions_side:
                 model.AddForbiddenAssignments([pos], [(yoke_id,) for yoke_id in yoke_ids]).OnlyEnforceIf(dipole_in_range.Not())
         
         # East magnets
-        has_dipole_E = [model.NewBoolVar(str(uuid.uuid4())) for _ in range(seq.shape[0])]
-        has_quadrupole_E = [model.NewBoolVar(str(uuid.uuid4())) for _ in range(seq.shape[0])]
+        has_dipole_E = [model.NewBoolVar(core.utils.cp_utils.var_name(model)) for _ in range(seq.shape[0])]
+        has_quadrupole_E = [model.NewBoolVar(core.utils.cp_utils.var_name(model)) for _ in range(seq.shape[0])]
         model.Add(has_dipole_E[2] == 1)
         model.Add(has_dipole_E[3] == 0)
         model.Add(has_dipole_E[seq.shape[0] - 3] == 1)
@@ -545,7 +500,7 @@ class MagnetConstraint(base.constraints.Constraint):
                 seq[x, seq.shape[1] - 2, 3],
                 seq[x, seq.shape[1] - 4, 3]
             ]
-            has_magnet = model.NewBoolVar(str(uuid.uuid4()))
+            has_magnet = model.NewBoolVar(core.utils.cp_utils.var_name(model))
             model.AddBoolOr([has_dipole_E[x], has_quadrupole_E[x]]).OnlyEnforceIf(has_magnet)
             model.AddBoolAnd([has_dipole_E[x].Not(), has_quadrupole_E[x].Not()]).OnlyEnforceIf(has_magnet.Not())
             for pos in magnet_positions_center:
@@ -590,12 +545,12 @@ class MagnetConstraint(base.constraints.Constraint):
             ]
             for pos in yoke_positions_center:
                 model.AddAllowedAssignments([pos], [(yoke_id,) for yoke_id in yoke_ids]).OnlyEnforceIf(has_dipole_E[x])
-            dipole_on_sides = model.NewBoolVar(str(uuid.uuid4()))
+            dipole_on_sides = model.NewBoolVar(core.utils.cp_utils.var_name(model))
             model.AddBoolOr([has_dipole_E[x - 1], has_dipole_E[x + 1]]).OnlyEnforceIf(dipole_on_sides)
             model.AddBoolAnd([has_dipole_E[x - 1].Not(), has_dipole_E[x + 1].Not()]).OnlyEnforceIf(dipole_on_sides.Not())
             for pos in yoke_positions_side:
                 model.AddAllowedAssignments([pos], [(yoke_id,) for yoke_id in yoke_ids]).OnlyEnforceIf(dipole_on_sides)
-            dipole_in_range = model.NewBoolVar(str(uuid.uuid4()))
+            dipole_in_range = model.NewBoolVar(core.utils.cp_utils.var_name(model))
             model.AddBoolOr([has_dipole_E[x], dipole_on_sides]).OnlyEnforceIf(dipole_in_range)
             model.AddBoolAnd([has_dipole_E[x].Not(), dipole_on_sides.Not()]).OnlyEnforceIf(dipole_in_range.Not())
             for pos in yoke_positions_side:
@@ -646,52 +601,44 @@ class MagnetConstraint(base.constraints.Constraint):
             model.AddAllowedAssignments([seq[x, z, 2]], [(yoke_id,) for yoke_id in yoke_ids])
 
 
-class InnerSymmetryConstraint(base.constraints.Constraint):
+class InnerSymmetryConstraint(base.constraints.AliasConstraint):
     """Ensures that the cross-section of the synchrotron is symmetric."""
-    def is_satisfied(self, seq: core.multi_sequence.MultiSequence[Component]) -> bool:
-        raise NotImplementedError("InnerSymmetryConstraint.is_satisfied is not implemented.")
-    
-    def to_model(
-        self,
-        model: cp_model.CpModel,
-        seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-        components: list[Component]
-    ) -> None:
+    def pairs(self, shape: tuple[int, ...]) -> typing.Iterator[tuple[tuple[int, ...], tuple[int, ...]]]:
         # North side
-        for z in range(4, seq.shape[1] - 4):
+        for z in range(4, shape[1] - 4):
             for x in range(1, 4):
                 for y in range(1, 4):
                     x_mirr = 3 - (x - 1)
                     y_mirr = 3 - (y - 1)
-                    model.Add(seq[x, z, y] == seq[x_mirr, z, y])
-                    model.Add(seq[x, z, y] == seq[x, z, y_mirr])
+                    yield (x, z, y), (x_mirr, z, y)
+                    yield (x, z, y), (x, z, y_mirr)
         
         # South side
-        for z in range(4, seq.shape[1] - 4):
-            for x in range(seq.shape[0] - 4, seq.shape[0] - 1):
+        for z in range(4, shape[1] - 4):
+            for x in range(shape[0] - 4, shape[0] - 1):
                 for y in range(1, 4):
-                    x_mirr = seq.shape[0] - (3 - ((seq.shape[0] - x - 1) - 1)) - 1
+                    x_mirr = shape[0] - (3 - ((shape[0] - x - 1) - 1)) - 1
                     y_mirr = 3 - (y - 1)
-                    model.Add(seq[x, z, y] == seq[x_mirr, z, y])
-                    model.Add(seq[x, z, y] == seq[x, z, y_mirr])
+                    yield (x, z, y), (x_mirr, z, y)
+                    yield (x, z, y), (x, z, y_mirr)
         
         # West side
-        for x in range(4, seq.shape[0] - 4):
+        for x in range(4, shape[0] - 4):
             for z in range(1, 4):
                 for y in range(1, 4):
                     z_mirr = 3 - (z - 1)
                     y_mirr = 3 - (y - 1)
-                    model.Add(seq[x, z, y] == seq[x, z_mirr, y])
-                    model.Add(seq[x, z, y] == seq[x, z, y_mirr])
+                    yield (x, z, y), (x, z_mirr, y)
+                    yield (x, z, y), (x, z, y_mirr)
         
         # East side
-        for x in range(4, seq.shape[0] - 4):
-            for z in range(seq.shape[1] - 4, seq.shape[1] - 1):
+        for x in range(4, shape[0] - 4):
+            for z in range(shape[1] - 4, shape[1] - 1):
                 for y in range(1, 4):
-                    z_mirr = seq.shape[1] - (3 - ((seq.shape[1] - z - 1) - 1)) - 1
+                    z_mirr = shape[1] - (3 - ((shape[1] - z - 1) - 1)) - 1
                     y_mirr = 3 - (y - 1)
-                    model.Add(seq[x, z, y] == seq[x, z_mirr, y])
-                    model.Add(seq[x, z, y] == seq[x, z, y_mirr])
+                    yield (x, z, y), (x, z_mirr, y)
+                    yield (x, z, y), (x, z, y_mirr)
 
 
 class HeatNeutralConstraint(base.constraints.Constraint):
@@ -699,14 +646,14 @@ class HeatNeutralConstraint(base.constraints.Constraint):
     def __init__(self, external_heating: int) -> None:
         self.external_heating = external_heating
     
-    def is_satisfied(self, seq: core.multi_sequence.MultiSequence[Component]) -> bool:
+    def is_satisfied(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> bool:
         raise NotImplementedError("HeatNeutralConstraint.is_satisfied is not implemented.")
     
     def to_model(
         self,
         model: cp_model.CpModel,
-        seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-        components: list[Component]
+        seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+        components: base.component_index.ComponentIndex
     ) -> None:
         heating_rate = calculations.TotalHeatingRate().to_model(model, seq, components)
         cooling_rate = calculations.TotalCoolingRate().to_model(model, seq, components)
@@ -722,18 +669,18 @@ class EnergyConstraint(base.constraints.Constraint):
         self.radius = radius
         self.mass = mass
     
-    def is_satisfied(self, seq: core.multi_sequence.MultiSequence[Component]) -> bool:
+    def is_satisfied(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> bool:
         raise NotImplementedError("EnergyConstraint.is_satisfied is not implemented.")
 
     def to_model(
         self,
         model: cp_model.CpModel,
-        seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-        components: list[Component]
+        seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+        components: base.component_index.ComponentIndex
     ) -> None:
         dipole_energy = calculations.MaxDipoleEnergy(self.charge, self.radius, self.mass).to_model(model, seq, components)
         radiation_loss = calculations.MaxRadiationLoss(self.charge, self.radius, self.mass).to_model(model, seq, components)
-        energy = model.NewIntVar(0, cp_model.INT32_MAX, str(uuid.uuid4()))
+        energy = model.NewIntVar(0, cp_model.INT32_MAX, core.utils.cp_utils.var_name(model))
         model.AddMinEquality(energy, [dipole_energy, radiation_loss])
         model.Add(energy >= self.minimum_energy)
         model.Add(energy <= self.maximum_energy)
@@ -748,14 +695,14 @@ class BeamFocusConstraint(base.constraints.Constraint):
         self.scaling_factor = scaling_factor
         self.initial_focus = initial_focus
     
-    def is_satisfied(self, seq: core.multi_sequence.MultiSequence[Component]) -> bool:
+    def is_satisfied(self, seq: core.utils.multi_sequence.MultiSequence[Component]) -> bool:
         raise NotImplementedError("BeamFocusConstraint.is_satisfied is not implemented.")
     
     def to_model(
         self,
         model: cp_model.CpModel,
-        seq: core.multi_sequence.MultiSequence[cp_model.IntVar],
-        components: list[Component]
+        seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+        components: base.component_index.ComponentIndex
     ) -> None:
         target_focus = round(self.target_focus * base.scaled_calculations.SCALE_FACTOR)
         focus = calculations.BeamFocus(self.charge, self.beam_strength, self.scaling_factor, self.initial_focus).to_model(model, seq, components)
@@ -49,20 +49,27 @@ class SynchrotronDesigner(base.designer.Designer):
     def seq_shape(self) -> tuple[int, ...]:
         return (self.side_length + 4, self.side_length + 4, 5)
     
-    def build_model(self, model: cp_model.CpModel, seq: core.multi_sequence.MultiSequence[cp_model.IntVar]) -> None:
-        constraints.CasingConstraint().to_model(model, seq, self.components)
-        constraints.BeamConstraint().to_model(model, seq, self.components)
-        constraints.AirConstraint().to_model(model, seq, self.components)
-        constraints.CavityConstraint().to_model(model, seq, self.components)
-        constraints.MagnetConstraint().to_model(model, seq, self.components)
-        base.constraints.PlacementRuleConstraint().to_model(model, seq, self.components)
+    def layout(self) -> list[base.constraints.LayoutConstraint]:
+        return [
+            constraints.CasingConstraint(),
+            constraints.BeamConstraint(),
+            constraints.AirConstraint()
+        ]
+    
+    def aliases(self) -> list[base.constraints.AliasConstraint]:
+        if self.internal_symmetry:
+            return [constraints.InnerSymmetryConstraint()]
+        return []
+    
+    def build_model(self, model: cp_model.CpModel, seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar]) -> None:
+        constraints.CavityConstraint().to_model(model, seq, self.component_index)
+        constraints.MagnetConstraint().to_model(model, seq, self.component_index)
+        base.constraints.PlacementRuleConstraint().to_model(model, seq, self.component_index)
         if self.heat_neutral:
             sa = (seq.shape[0] * seq.shape[2]) * 4 + ((seq.shape[0] - 10) * seq.shape[2]) * 4 + (seq.shape[0] * seq.shape[1] * 2) - ((seq.shape[0] - 10) * (seq.shape[1] - 10) * 2)
-            constraints.HeatNeutralConstraint(round(self.kappa * sa * self.env_temperature)).to_model(model, seq, self.components)
-        if self.internal_symmetry:
-            constraints.InnerSymmetryConstraint().to_model(model, seq, self.components)
-        constraints.EnergyConstraint(self.minimum_energy, self.maximum_energy, self.charge, (seq.shape[0] - 4) / 2, self.mass).to_model(model, seq, self.components)
-        constraints.BeamFocusConstraint(self.target_focus, self.charge, self.beam_strength, self.scaling_factor, self.initial_focus).to_model(model, seq, self.components)
+            constraints.HeatNeutralConstraint(round(self.kappa * sa * self.env_temperature)).to_model(model, seq, self.component_index)
+        constraints.EnergyConstraint(self.minimum_energy, self.maximum_energy, self.charge, (seq.shape[0] - 4) / 2, self.mass).to_model(model, seq, self.component_index)
+        constraints.BeamFocusConstraint(self.target_focus, self.charge, self.beam_strength, self.scaling_factor, self.initial_focus).to_model(model, seq, self.component_index)
         for component, (min_, max_) in self.component_limits.items():
-            base.constraints.QuantityConstraint(component, max_, min_).to_model(model, seq, self.components)
-        model.Minimize(calculations.PowerRequirement().to_model(model, seq, self.components))
+            base.constraints.QuantityConstraint(component, max_, min_).to_model(model, seq, self.component_index)
+        model.Minimize(calculations.PowerRequirement().to_model(model, seq, self.component_index))
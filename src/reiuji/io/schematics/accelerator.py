@@ -8,14 +8,14 @@ from . import base
 class AcceleratorSchematicWriter(base.SchematicWriter):
     def __init__(
             self,
-            seq: core.multi_sequence.MultiSequence[components.types.Component],
+            seq: core.utils.multi_sequence.MultiSequence[components.types.Component],
             *,
             transparent: bool = True
     ) -> None:
         self.seq = seq
         self.transparent = transparent
     
-    def to_structure(self) -> core.multi_sequence.MultiSequence[components.base.MCBlock]:
+    def to_structure(self) -> core.utils.multi_sequence.MultiSequence[components.base.MCBlock]:
         z = self.seq.shape[0]
         x = self.seq.shape[1]
         y = self.seq.shape[2]
@@ -30,4 +30,4 @@ class AcceleratorSchematicWriter(base.SchematicWriter):
                         structure[idx] = comp.block.transparent if self.transparent and y_ != 0 else comp.block.opaque
                     else:
                         structure[idx] = comp.block
-        return core.multi_sequence.MultiSequence(structure, (y, z, x))
+        return core.utils.multi_sequence.MultiSequence(seq=structure, shape=(y, z, x))
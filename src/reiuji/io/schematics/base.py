@@ -10,10 +10,10 @@ from nbt import nbt
 
 
 class SchematicWriter:
-    def to_structure(self) -> core.multi_sequence.MultiSequence[components.base.MCBlock]:
+    def to_structure(self) -> core.utils.multi_sequence.MultiSequence[components.base.MCBlock]:
         raise NotImplementedError
 
-    def to_nbt(self, structure: core.multi_sequence.MultiSequence[components.base.MCBlock]) -> nbt.NBTFile:
+    def to_nbt(self, structure: core.utils.multi_sequence.MultiSequence[components.base.MCBlock]) -> nbt.NBTFile:
         y, z, x = structure.shape
         nbtfile = nbt.NBTFile()
         nbtfile.name = "Schematic"
@@ -10,7 +10,7 @@ import typing
 class NucleosynthesisSchematicWriter(base.SchematicWriter):
     def __init__(
             self,
-            seq: core.multi_sequence.MultiSequence[components.types.Component],
+            seq: core.utils.multi_sequence.MultiSequence[components.types.Component],
             *,
             facing: typing.Literal["x", "z"],
             transparent: bool = True
@@ -19,7 +19,7 @@ class NucleosynthesisSchematicWriter(base.SchematicWriter):
         self.facing = facing
         self.transparent = transparent
     
-    def to_structure(self) -> core.multi_sequence.MultiSequence[components.base.MCBlock]:
+    def to_structure(self) -> core.utils.multi_sequence.MultiSequence[components.base.MCBlock]:
         x = self.seq.shape[0]
         z = self.seq.shape[1]
         y = self.seq.shape[2]
@@ -39,4 +39,4 @@ class NucleosynthesisSchematicWriter(base.SchematicWriter):
                         structure[idx] = comp.block.x if self.facing == "x" else comp.block.z
                     else:
                         structure[idx] = comp.block
-        return core.multi_sequence.MultiSequence(structure, (y, z, x))
+        return core.utils.multi_sequence.MultiSequence(seq=structure, shape=(y, z, x))
@@ -10,8 +10,8 @@ import typing
 class TurbineSchematicWriter(base.SchematicWriter):
     def __init__(
             self,
-            dynamo_seq: core.multi_sequence.MultiSequence[components.types.Component],
-            rotor_seq: core.multi_sequence.MultiSequence[components.types.Component],
+            dynamo_seq: core.utils.multi_sequence.MultiSequence[components.types.Component],
+            rotor_seq: core.utils.multi_sequence.MultiSequence[components.types.Component],
             shaft_width: int,
             *,
             facing: typing.Literal["x", "z"],
@@ -34,7 +34,7 @@ class TurbineSchematicWriter(base.SchematicWriter):
         self.shaft_x = shaft_x if not isinstance(shaft_x, type(None)) else components.base.MCBlock(name="nuclearcraft:turbine_rotor_shaft", data=1)
         self.shaft_z = shaft_z if not isinstance(shaft_z, type(None)) else components.base.MCBlock(name="nuclearcraft:turbine_rotor_shaft", data=3)
     
-    def to_structure(self) -> core.multi_sequence.MultiSequence[components.base.MCBlock]:
+    def to_structure(self) -> core.utils.multi_sequence.MultiSequence[components.base.MCBlock]:
         z = self.rotor_seq.shape[0] + 2
         x = y = self.dynamo_seq.shape[0]
         if self.dynamo_seq.shape[0] % 2:
@@ -68,4 +68,4 @@ class TurbineSchematicWriter(base.SchematicWriter):
                             structure[idx] = self.rotor_seq[z_ - 1].block.x if self.facing == "z" else self.rotor_seq[z_ - 1].block.z
                         elif mid - r_left <= x_ <= mid + r_right:
                             structure[idx] = self.rotor_seq[z_ - 1].block.y
-        return core.multi_sequence.MultiSequence(structure, (y, z, x))
+        return core.utils.multi_sequence.MultiSequence(seq=structure, shape=(y, z, x))
@@ -13,8 +13,8 @@ class SerializableMultiSequence(pydantic.BaseModel):
     seq: list[components.types.Component]
 
     @classmethod
-    def from_multi_sequence(cls, seq: core.multi_sequence.MultiSequence[components.types.Component]) -> typing.Self:
+    def from_multi_sequence(cls, seq: core.utils.multi_sequence.MultiSequence[components.types.Component]) -> typing.Self:
         return cls(shape=seq.shape, seq=list(seq.seq))
     
-    def to_multi_sequence(self) -> core.multi_sequence.MultiSequence[components.types.Component]:
-        return core.multi_sequence.MultiSequence(shape=self.shape, seq=self.seq)
+    def to_multi_sequence(self) -> core.utils.multi_sequence.MultiSequence[components.types.Component]:
+        return core.utils.multi_sequence.MultiSequence(shape=self.shape, seq=self.seq)
@@ -1,5 +1,6 @@
 """Tests for the `reiuji.core.utils.cp_utils` module."""
 
+import pytest
 from ortools.sat.python import cp_model
 
 from reiuji.core.utils import cp_utils
@@ -61,3 +62,182 @@ def test_sqrt() -> None:
     status = solver.solve(model)
     assert status == cp_model.OPTIMAL
     assert solver.value(target) == 5 * cp_utils.SCALE_FACTOR
+
+
+def test_model_builder_naming() -> None:
+    model = cp_utils.ModelBuilder()
+    a = model.new_int_var(0, 10)
+    b = model.new_bool_var(cp_utils.var_name(model, "flag"))
+    assert (a.name, b.name) == ("v_0", "flag_1")
+
+    model = cp_utils.ModelBuilder("hierarchical")
+    with model.scope("outer"), model.scope("inner"):
+        c = model.new_int_var(0, 10)
+    assert c.name == "outer/inner/v_0"
+
+    model = cp_utils.ModelBuilder("none")
+    assert model.new_int_var(0, 10, "ignored").name == ""
+
+
+def test_model_builder_deterministic() -> None:
+    def build() -> bytes:
+        model = cp_utils.ModelBuilder()
+        a = model.new_int_var_from_domain(cp_utils.std_domain(), "a")
+        product = model.new_int_var_from_domain(cp_utils.std_domain())
+        cp_utils.s_multiply(model, product, a, 2 * cp_utils.SCALE_FACTOR)
+        return model.proto.SerializeToString()
+
+    assert build() == build()
+
+
+def test_element() -> None:
+    model = cp_utils.ModelBuilder()
+    index = model.new_int_var_from_domain(cp_model.Domain.from_values([1, 3]), "i")
+    values = [5, 10, 15, 20]
+    target = cp_utils.element(model, index, values)
+    assert cp_utils.element(model, index, values) is target
+    assert cp_utils.element(model, index, [0, 7, 0, 7]).proto.domain == [7, 7]
+    assert list(target.proto.domain) == [10, 10, 20, 20]
+    model.add(index == 3)
+    solver = cp_model.CpSolver()
+    assert solver.solve(model) == cp_model.OPTIMAL
+    assert solver.value(target) == 20
+
+
+def test_element_plain_model() -> None:
+    model = cp_model.CpModel()
+    index = model.new_int_var(0, 2, "i")
+    target = cp_utils.element(model, index, [4, 8, 12])
+    assert cp_utils.element(model, index, [4, 8, 12]) is not target
+    model.add(index == 1)
+    solver = cp_model.CpSolver()
+    assert solver.solve(model) == cp_model.OPTIMAL
+    assert solver.value(target) == 8
+
+
+def test_inferred_bounds() -> None:
+    model = cp_model.CpModel()
+    a = model.new_int_var(0, 4 * cp_utils.SCALE_FACTOR, "a")
+    b = model.new_int_var(-2 * cp_utils.SCALE_FACTOR, 3 * cp_utils.SCALE_FACTOR, "b")
+    product = model.new_int_var_from_domain(cp_utils.std_domain(), "product")
+    cp_utils.s_multiply(model, product, a, b)
+    assert list(product.proto.domain) == [
+        -8 * cp_utils.SCALE_FACTOR,
+        12 * cp_utils.SCALE_FACTOR,
+    ]
+    assert cp_utils.quotient_bounds((-10, 10), (0, 0)) is None
+    assert cp_utils.quotient_bounds((-10, 10), (-5, 2)) == (-10, 10)
+    assert cp_utils.quotient_bounds((7, 9), (2, 4)) == (1, 4)
+
+
+def test_expr_bounds() -> None:
+    model = cp_model.CpModel()
+    x = model.new_int_var(0, 5, "x")
+    y = model.new_int_var(-2, 3, "y")
+    assert cp_utils.expr_bounds(7) == (7, 7)
+    assert cp_utils.expr_bounds(x) == (0, 5)
+    assert cp_utils.expr_bounds(2 * x + 1) == (1, 11)
+    assert cp_utils.expr_bounds(-x) == (-5, 0)
+    assert cp_utils.expr_bounds(2 * x - 3 * y + 4) == (-5, 20)
+    assert cp_utils.expr_bounds(sum([x, y])) == (-2, 8)
+    assert cp_utils.expr_values(x + y + 1, max_size=4) is None
+    assert cp_utils.expr_values(3 * x - 1) == list(range(-1, 15))
+    assert cp_utils.sum_domain([x - 1, 2 * y]).flattened_intervals() == [-5, 10]
+
+
+def test_tighten_domains() -> None:
+    model = cp_model.CpModel()
+    x = model.new_int_var(0, 10, "x")
+    y = model.new_int_var(0, cp_model.INT32_MAX, "y")
+    z = model.new_int_var(cp_model.INT32_MIN, cp_model.INT32_MAX, "z")
+    model.add(y == 3 * x + 1)
+    model.add_multiplication_equality(z, [x, y])
+    assert cp_utils.tighten_domains(model) == 2
+    assert list(y.proto.domain) == [1, 31]
+    assert list(z.proto.domain) == [0, 310]
+
+
+def test_tighten_domains_element() -> None:
+    model = cp_model.CpModel()
+    i = model.new_int_var(0, 2, "i")
+    t = model.new_int_var(-1000, 1000, "t")
+    model.add_element(i, [3, 5, 7], t)
+    j = model.new_int_var(0, 1, "j")
+    u = model.new_int_var(-1000, 1000, "u")
+    model.add_element(2 * j + 1, [t, 2 * t, 3, t + 1], u - 1)
+    assert cp_utils.tighten_domains(model) == 2
+    assert list(t.proto.domain) == [3, 3, 5, 5, 7, 7]
+    assert list(u.proto.domain) == [4, 15]
+
+
+def test_tighten_domains_overflow() -> None:
+    model = cp_model.CpModel()
+    x = model.new_int_var(0, 2**40, "x")
+    z = model.new_int_var(0, 2**62, "z")
+    model.add_multiplication_equality(z, [x, x, x])
+    with pytest.raises(OverflowError):
+        cp_utils.tighten_domains(model)
+
+
+def test_tighten_domains_wide_variables() -> None:
+    model = cp_model.CpModel()
+    xs = [model.new_int_var(0, 2**47, f"x{i}") for i in range(2**16 + 1)]
+    for a, b in zip(xs[::2], xs[1::2]):
+        model.add(a + b <= 2**48)
+    cp_utils.tighten_domains(model)
+
+
+def test_sqrt_table() -> None:
+    model = cp_model.CpModel()
+    a = model.new_int_var(0, 10 * cp_utils.SCALE_FACTOR, "a")
+    target = model.new_int_var_from_domain(cp_utils.std_domain(), "target")
+    cp_utils.s_sqrt(model, target, a)
+    assert len(model.proto.constraints) == 1
+    assert list(target.proto.domain) == [0, 3162]
+    model.add(a == 2 * cp_utils.SCALE_FACTOR)
+    solver = cp_model.CpSolver()
+    assert solver.solve(model) == cp_model.OPTIMAL
+    assert solver.value(target) == 1414
+
+
+def test_sum_domain() -> None:
+    model = cp_model.CpModel()
+    index = model.new_int_var(0, 2, "i")
+    terms = [cp_utils.element(model, index, [0, 200, 500]) for _ in range(2)]
+    domain = cp_utils.sum_domain([*terms, 1])
+    assert domain.flattened_intervals() == [
+        1,
+        1,
+        201,
+        201,
+        401,
+        401,
+        501,
+        501,
+        701,
+        701,
+        1001,
+        1001,
+    ]
+    assert cp_utils.sum_domain(terms, max_size=4) is None
+    assert cp_utils.sum_domain([model.new_int_var(0, 10, "x")], max_size=4) is None
+
+
+def test_shared_literals() -> None:
+    model = cp_model.CpModel()
+    x = model.new_int_var(0, 5, "x")
+    active = model.new_bool_var("active")
+    match = cp_utils.in_values(model, x, [1, 2])
+    assert cp_utils.in_values(model, x, [2, 1]) is match
+    assert cp_utils.all_of(model, [match, active]) is cp_utils.all_of(
+        model, [active, match]
+    )
+    assert cp_utils.all_of(model, [match, model.new_constant(1)]) is match
+    assert list(cp_utils.in_values(model, x, range(6)).proto.domain) == [1, 1]
+    assert list(cp_utils.in_values(model, x, [7]).proto.domain) == [0, 0]
+    model.add(x == 2)
+    model.add(active == 1)
+    solver = cp_model.CpSolver()
+    assert solver.solve(model) == cp_model.OPTIMAL
+    assert solver.value(cp_utils.all_of(model, [match, active])) == 1
+    assert cp_utils.SharedLiterals.of(model).in_values(x, [1, 2]) is match
@@ -113,6 +113,10 @@ def test_getitem(multi_sequence: MultiSequence[int]) -> None:
     assert multi_sequence[23] == multi_sequence[1, 2, 3] == 23
 
 
+def test_iter(multi_sequence: MultiSequence[int]) -> None:
+    assert list(multi_sequence) == list(multi_sequence.iter()) == list(range(24))
+
+
 def test_neighbors(multi_sequence: MultiSequence[int]) -> None:
     assert multi_sequence.neighbors((0, 0, 0), 0) == (None, 12)
     assert multi_sequence.neighbors((0, 0, 0), 1) == (None, 4)
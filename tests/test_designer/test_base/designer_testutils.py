@@ -0,0 +1,65 @@
+"""Small designers for tests of the `reiuji.designer.base` package."""
+
+import random
+
+from ortools.sat.python import cp_model
+
+from reiuji import core
+from reiuji.components.types import Air, BeamPipe, DynamoBearing
+from reiuji.designer import base
+
+COMPONENTS = [Air(), DynamoBearing(), BeamPipe()]
+
+
+class SubsetSumDesigner(base.designer.Designer):
+    """Looks for a subset of large random weights with a sum no subset has, which CP-SAT cannot settle quickly."""
+
+    def __init__(self, length: int = 48) -> None:
+        super().__init__(components=COMPONENTS[:2])
+        self.length = length
+
+    @property
+    def seq_shape(self) -> tuple[int, ...]:
+        return (self.length,)
+
+    def build_model(
+        self,
+        model: cp_model.CpModel,
+        seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+    ) -> None:
+        rng = random.Random(0)
+        weights = [rng.randrange(2**30, 2**31) for _ in range(self.length)]
+        model.Add(sum(w * cell for w, cell in zip(weights, seq)) == sum(weights) // 2 + 1)
+
+
+COSTS = [0, 3, 5]
+VALUES = [0, 2, 5]
+
+
+class KnapsackDesigner(base.designer.Designer):
+    """Fills a grid with components of a given cost and value, minimizing the cost for a minimum total value."""
+
+    def __init__(self, shape: tuple[int, ...] = (2, 4), target: int = 11) -> None:
+        super().__init__(components=COMPONENTS)
+        self.shape = shape
+        self.target = target
+
+    @property
+    def seq_shape(self) -> tuple[int, ...]:
+        return self.shape
+
+    def build_model(
+        self,
+        model: cp_model.CpModel,
+        seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+    ) -> None:
+        model.Add(sum(core.utils.cp_utils.element(model, cell, VALUES) for cell in seq) >= self.target)
+        model.Minimize(sum(core.utils.cp_utils.element(model, cell, COSTS) for cell in seq))
+
+
+def cost(seq: core.utils.multi_sequence.MultiSequence) -> int:
+    return sum(COSTS[COMPONENTS.index(component)] for component in seq)
+
+
+def value(seq: core.utils.multi_sequence.MultiSequence) -> int:
+    return sum(VALUES[COMPONENTS.index(component)] for component in seq)
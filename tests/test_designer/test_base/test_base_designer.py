@@ -0,0 +1,147 @@
+"""Tests for the `reiuji.designer.base.designer` module."""
+
+import asyncio
+import itertools
+import math
+import threading
+import time
+
+import designer_testutils as dt
+import pytest
+from ortools.sat.python import cp_model
+
+from reiuji import core
+from reiuji.designer import base
+
+
+def test_design_async_cancel() -> None:
+    async def run() -> None:
+        task = asyncio.create_task(dt.SubsetSumDesigner().design_async(timeout=30))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    start = time.perf_counter()
+    asyncio.run(run())
+    assert time.perf_counter() - start < 5
+
+
+def test_design_async_cancel_before_search(monkeypatch: pytest.MonkeyPatch) -> None:
+    starting = threading.Event()
+    cancelled = threading.Event()
+    solve = cp_model.CpSolver.Solve
+
+    def delayed_solve(self: cp_model.CpSolver, *args, **kwargs) -> int:
+        starting.set()
+        cancelled.wait()
+        return solve(self, *args, **kwargs)
+
+    monkeypatch.setattr(cp_model.CpSolver, "Solve", delayed_solve)
+
+    async def run() -> None:
+        task = asyncio.create_task(dt.SubsetSumDesigner().design_async(timeout=30))
+        await asyncio.to_thread(starting.wait)
+        # The task is cancelled after the designer checks for cancellation, but before the search starts.
+        task.cancel()
+        await asyncio.sleep(0.2)
+        cancelled.set()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    start = time.perf_counter()
+    asyncio.run(run())
+    assert time.perf_counter() - start < 5
+
+
+def test_design_iter_improves() -> None:
+    designer = dt.KnapsackDesigner(shape=(4, 5), target=57)
+    results = list(designer.design_iter(config=base.solver.SolverConfig(num_workers=1)))
+    assert len(results) >= 2
+    objectives = [result.objective for result in results]
+    assert objectives == sorted(objectives, reverse=True)
+    for result in results:
+        assert dt.cost(result.seq) == result.objective
+        assert dt.value(result.seq) >= designer.target
+    assert results[-1].status == cp_model.OPTIMAL
+    assert results[-1].objective == designer.solve().objective
+
+
+def test_hint_cropped_and_padded() -> None:
+    designer = dt.KnapsackDesigner(shape=(2, 4))
+    a, b, c = dt.COMPONENTS
+    # The hint has an extra row, which is cropped, and misses the last two columns, which are left unhinted.
+    hint = core.utils.multi_sequence.MultiSequence(seq=[b, c, None, a, c, c], shape=(3, 2))
+    model, seq = designer.create_model(hint=hint)
+    hinted = dict(zip(model.Proto().solution_hint.vars, model.Proto().solution_hint.values))
+    assert hinted == {seq[0, 0].Index(): 1, seq[0, 1].Index(): 2, seq[1, 1].Index(): 0}
+    assert designer.solve(hint=hint).objective == designer.solve().objective
+
+    with pytest.raises(ValueError):
+        designer.create_model(hint=core.utils.multi_sequence.MultiSequence(seq=[a, b], shape=(2,)))
+
+
+def brute_force_costs(designer: dt.KnapsackDesigner) -> list[int]:
+    costs = []
+    for values in itertools.product(range(len(dt.COMPONENTS)), repeat=math.prod(designer.seq_shape)):
+        if sum(dt.VALUES[v] for v in values) >= designer.target:
+            costs.append(sum(dt.COSTS[v] for v in values))
+    return sorted(costs)
+
+
+def hamming(a, b) -> int:
+    return sum(x != y for x, y in zip(a, b))
+
+
+def test_design_pool_top_k() -> None:
+    designer = dt.KnapsackDesigner()
+    pool = designer.design_pool(6)
+    assert [result.objective for result in pool] == brute_force_costs(designer)[:6]
+    for i, a in enumerate(pool):
+        assert dt.value(a.seq) >= designer.target
+        assert all(hamming(a.seq, b.seq) >= 1 for b in pool[:i])
+
+
+def test_design_pool_distance() -> None:
+    designer = dt.KnapsackDesigner()
+    pool = designer.design_pool(4, min_distance=4)
+    assert len(pool) == 4
+    assert pool[0].objective == brute_force_costs(designer)[0]
+    for i, a in enumerate(pool):
+        assert all(hamming(a.seq, b.seq) >= 4 for b in pool[:i])
+
+
+def test_design_pool_tolerance() -> None:
+    designer = dt.KnapsackDesigner((1, 4))
+    costs = brute_force_costs(designer)
+    pool = designer.design_pool(None, tolerance=0.1)
+    assert sorted(result.objective for result in pool) == [c for c in costs if c <= costs[0] * 1.1]
+    with pytest.raises(ValueError):
+        designer.design_pool(None)
+
+
+def brute_force_front(designer: dt.KnapsackDesigner, secondary: base.calculations.ComponentCount) -> list[tuple[float, float]]:
+    points = set()
+    for values in itertools.product(dt.COMPONENTS, repeat=math.prod(designer.seq_shape)):
+        if sum(dt.VALUES[dt.COMPONENTS.index(c)] for c in values) >= designer.target:
+            points.add((float(sum(dt.COSTS[dt.COMPONENTS.index(c)] for c in values)), float(secondary(values))))
+    return sorted(p for p in points if not any(q != p and q[0] <= p[0] and q[1] <= p[1] for q in points))
+
+
+def test_design_pareto() -> None:
+    designer = dt.KnapsackDesigner()
+    secondary = base.calculations.ComponentCount(["beam"])
+    front = designer.design_pareto(secondary)
+    assert [point.objectives for point in front] == brute_force_front(designer, secondary)
+    for point in front:
+        assert point.objectives == (dt.cost(point.seq), secondary(point.seq))
+        assert dt.value(point.seq) >= designer.target
+    assert len(designer.design_pareto(secondary, max_points=2)) == 2
+
+
+def test_design_pareto_extremes() -> None:
+    designer = dt.KnapsackDesigner()
+    secondary = base.calculations.ComponentCount(["beam"])
+    expected = brute_force_front(designer, secondary)
+    front = designer.design_pareto(secondary, method="extremes")
+    assert [point.objectives for point in front] == [expected[0], expected[-1]]
@@ -0,0 +1,34 @@
+"""Tests for the `reiuji.designer.base.batch` module."""
+
+import time
+
+import designer_testutils as dt
+from ortools.sat.python import cp_model
+
+from reiuji.designer import base
+
+
+def test_design_many() -> None:
+    designers = [dt.KnapsackDesigner(target=target) for target in (5, 11, 20, 100)]
+    expected = [designer.solve().objective for designer in designers[:3]]
+
+    results = list(base.batch.design_many(designers, max_workers=2))
+    assert [i for i, _ in results] == [0, 1, 2, 3]
+    for (_, (status, seq)), designer, objective in zip(results, designers, expected):
+        assert status == cp_model.OPTIMAL
+        assert dt.cost(seq) == objective
+        assert dt.value(seq) >= designer.target
+    assert results[3][1] == (cp_model.INFEASIBLE, None)
+
+    unordered = list(base.batch.design_many(designers, max_workers=2, ordered=False))
+    assert sorted(i for i, _ in unordered) == [0, 1, 2, 3]
+
+
+def test_design_many_close() -> None:
+    designers = [dt.KnapsackDesigner(), *(dt.SubsetSumDesigner() for _ in range(4))]
+    results = base.batch.design_many(designers, max_workers=1, timeout=2.0)
+    i, (status, _) = next(results)
+    assert (i, status) == (0, cp_model.OPTIMAL)
+    start = time.perf_counter()
+    results.close()
+    assert time.perf_counter() - start < 1.0
@@ -0,0 +1,38 @@
+"""Tests for the `reiuji.designer.base.cache` module."""
+
+import pathlib
+
+import designer_testutils as dt
+from ortools.sat.python import cp_model
+
+from reiuji.designer import base
+
+
+def test_round_trip(tmp_path: pathlib.Path) -> None:
+    cache = base.cache.ModelCache(tmp_path)
+    designer = dt.KnapsackDesigner()
+    assert cache.load(designer) is None
+    built = designer.solve(cache=cache)
+    assert len(list(tmp_path.glob("*.model"))) == 1
+    model, seq = cache.load(designer)
+    assert seq.shape == designer.seq_shape
+    loaded = designer.solve(cache=cache)
+    assert built.status == loaded.status == cp_model.OPTIMAL
+    assert built.objective == loaded.objective
+    assert dt.cost(loaded.seq) == loaded.objective
+    assert dt.value(loaded.seq) >= designer.target
+
+
+def test_key() -> None:
+    key = base.cache.ModelCache.key(dt.KnapsackDesigner())
+    assert base.cache.ModelCache.key(dt.KnapsackDesigner()) == key
+    assert base.cache.ModelCache.key(dt.KnapsackDesigner(target=12)) != key
+    named = dt.KnapsackDesigner()
+    named.model_naming = "hierarchical"
+    assert base.cache.ModelCache.key(named) != key
+
+
+def test_key_format_version(monkeypatch) -> None:
+    key = base.cache.ModelCache.key(dt.KnapsackDesigner())
+    monkeypatch.setattr(base.cache, "FORMAT_VERSION", base.cache.FORMAT_VERSION + 1)
+    assert base.cache.ModelCache.key(dt.KnapsackDesigner()) != key
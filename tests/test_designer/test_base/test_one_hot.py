@@ -0,0 +1,23 @@
+"""Tests for the `reiuji.designer.base.one_hot` module."""
+
+import designer_testutils as dt
+import pytest
+from ortools.sat.python import cp_model
+
+from reiuji import core
+from reiuji.designer import base
+
+
+def test_shared_with_cp_utils() -> None:
+    model = cp_model.CpModel()
+    cell = model.NewIntVar(0, 2, "cell")
+    other = model.NewIntVar(0, 2, "other")
+    before = core.utils.cp_utils.in_values(model, cell, [1, 2])
+    components = base.component_index.ComponentIndex.of(dt.COMPONENTS)
+    one_hot = base.one_hot.OneHot.of(model, components)
+    assert one_hot.any_of(cell, [2, 1]) is before
+    assert base.one_hot.OneHot.of(model, components) is one_hot
+    assert core.utils.cp_utils.in_values(model, other, [0]) is one_hot.literal(other, 0)
+    assert one_hot.literal(cell, 0) is not one_hot.literal(other, 0)
+    with pytest.raises(ValueError):
+        base.one_hot.OneHot.of(model, base.component_index.ComponentIndex.of(dt.COMPONENTS[:2]))
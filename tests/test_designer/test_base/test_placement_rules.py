@@ -0,0 +1,45 @@
+"""Tests for the `reiuji.designer.base.placement_rules` module."""
+
+from ortools.sat.python import cp_model
+
+from reiuji.components.defaults import QMD_LINEAR_ACCELERATOR_COMPONENTS
+from reiuji.designer import base
+
+# Air and three magnets of different names.
+COMPONENTS = [QMD_LINEAR_ACCELERATOR_COMPONENTS[i] for i in (0, 8, 9, 10)]
+
+
+class Recorder(cp_model.CpSolverSolutionCallback):
+    def __init__(self, neighbors: list[cp_model.IntVar], satisfied: cp_model.IntVar | None = None) -> None:
+        super().__init__()
+        self.neighbors = neighbors
+        self.satisfied = satisfied
+        self.solutions: dict[tuple[int, ...], bool] = dict()
+
+    def on_solution_callback(self) -> None:
+        row = tuple(self.Value(neighbor) for neighbor in self.neighbors)
+        self.solutions[row] = True if isinstance(self.satisfied, type(None)) else bool(self.Value(self.satisfied))
+
+
+def enumerate_rule(rule: base.placement_rules.PlacementRule, table: bool) -> dict[tuple[int, ...], bool]:
+    components = base.component_index.ComponentIndex.of(COMPONENTS)
+    model = cp_model.CpModel()
+    neighbors = [model.NewIntVar(0, len(COMPONENTS) - 1, f"n{i}") for i in range(6)]
+    if table:
+        assert base.placement_rules.RuleTable(rule, components).to_model(model, neighbors)
+        recorder = Recorder(neighbors)
+    else:
+        recorder = Recorder(neighbors, rule.to_model(model, neighbors, components))
+    solver = cp_model.CpSolver()
+    solver.parameters.enumerate_all_solutions = True
+    assert solver.Solve(model, recorder) == cp_model.OPTIMAL
+    return recorder.solutions
+
+
+def test_different_rule_paths_agree() -> None:
+    rule = base.placement_rules.TypePlacementRule("magnet", 3, different=True)
+    fallback = enumerate_rule(rule, table=False)
+    assert len(fallback) == len(COMPONENTS) ** 6
+    expected = {row for row in fallback if rule.is_satisfied([COMPONENTS[i] for i in row])}
+    assert {row for row, satisfied in fallback.items() if satisfied} == expected
+    assert set(enumerate_rule(rule, table=True)) == expected
@@ -0,0 +1,25 @@
+"""Tests for the `reiuji.designer.base.solver` module."""
+
+import pytest
+from ortools.sat.python import cp_model
+
+from reiuji.designer import base
+
+
+def test_apply() -> None:
+    solver = cp_model.CpSolver()
+    base.solver.SolverConfig(num_workers=2, random_seed=3).apply(solver, timeout=1.5)
+    assert solver.parameters.num_workers == 2
+    assert solver.parameters.random_seed == 3
+    assert solver.parameters.max_time_in_seconds == 1.5
+    assert not solver.parameters.interleave_search
+
+    solver = cp_model.CpSolver()
+    base.solver.SolverConfig(deterministic=True).apply(solver, timeout=2)
+    assert solver.parameters.max_deterministic_time == 2
+    assert solver.parameters.interleave_search
+
+
+def test_apply_rejects_bool_timeout() -> None:
+    with pytest.raises(TypeError):
+        base.solver.SolverConfig().apply(cp_model.CpSolver(), timeout=True)
@@ -0,0 +1,50 @@
+"""Tests for the `reiuji.designer.overhauled.turbine_rotor` package."""
+
+import pytest
+from ortools.sat.python import cp_model
+
+from reiuji.designer import base
+from reiuji.designer.overhauled.turbine_rotor import TurbineRotorDesigner, calculations
+
+
+@pytest.mark.parametrize(
+    ("length", "optimal_expansion", "component_limits"),
+    [
+        (3, 1.5, None),
+        (4, 2.0, None),
+        (6, 4.0, None),
+        (6, 2.0, {"blade:steel": (2, None), "blade:sic_sic_cmc": (None, 1)}),
+    ],
+)
+def test_dp_matches_cp(length: int, optimal_expansion: float, component_limits: dict | None) -> None:
+    efficiency = calculations.TurbineRotorEfficiency(optimal_expansion)
+    results = {}
+    for engine in ("cp", "dp"):
+        designer = TurbineRotorDesigner(length, optimal_expansion, component_limits=component_limits, engine=engine)
+        status, seq = designer.design(timeout=60)
+        assert status == cp_model.OPTIMAL
+        for full_name, (min_, max_) in (component_limits or {}).items():
+            count = sum(1 for component in seq if component.full_name == full_name)
+            assert min_ is None or count >= min_
+            assert max_ is None or count <= max_
+        results[engine] = efficiency(seq)
+    # CP-SAT optimizes a scaled approximation of the efficiency, so its rotor can only be marginally worse.
+    assert results["dp"] >= results["cp"] - 1e-9
+    assert results["dp"] == pytest.approx(results["cp"], abs=1e-3)
+
+
+def test_dp_timeout() -> None:
+    designer = TurbineRotorDesigner(24, 4.0, engine="dp")
+    result = designer.solve(timeout=0.0)
+    assert result.status == cp_model.FEASIBLE
+    assert len(result.seq) == 24
+    assert result.bound is None
+    assert result.objective == pytest.approx(calculations.TurbineRotorEfficiency(4.0)(result.seq) * base.scaled_calculations.SCALE_FACTOR)
+
+
+def test_dp_ignored_arguments() -> None:
+    designer = TurbineRotorDesigner(3, 1.5, engine="dp")
+    with pytest.warns(UserWarning):
+        designer.solve(hint=designer.decode([0, 0, 0]))
+    with pytest.warns(UserWarning):
+        designer.solve(config=base.solver.SolverConfig(random_seed=1))
@@ -0,0 +1,74 @@
+"""Tests for the `reiuji.designer.qmd.linear` package."""
+
+import pytest
+from ortools.sat.python import cp_model
+
+from reiuji.designer import base
+from reiuji.designer.qmd.linear import LinearAcceleratorDesigner, calculations, constraints
+from reiuji.designer.qmd.linear.catalog import INTERIOR
+
+PARAMS = [
+    dict(length=3, minimum_energy=0, maximum_energy=1000, target_focus=0.0),
+    dict(length=4, minimum_energy=300, maximum_energy=100000, target_focus=0.5),
+]
+
+
+def designer(params: dict, **kwargs) -> LinearAcceleratorDesigner:
+    return LinearAcceleratorDesigner(**params, charge=1.0, beam_strength=100, **kwargs)
+
+
+def check(designer: LinearAcceleratorDesigner, seq) -> None:
+    assert base.constraints.PlacementRuleConstraint().is_satisfied(seq)
+    assert constraints.BeamConstraint().is_satisfied(seq)
+    assert calculations.TotalCoolingRate()(seq) >= calculations.TotalHeatingRate()(seq)
+    focus = calculations.BeamFocus(designer.charge, designer.beam_strength, designer.scaling_factor, designer.initial_focus)(seq)
+    assert focus >= designer.target_focus - 1e-3
+    energy = calculations.TotalVoltage()(seq) * designer.charge
+    assert designer.minimum_energy <= energy <= designer.maximum_energy
+    assert constraints.SlicePatternConstraint(designer.slice_catalog()).is_satisfied(seq)
+
+
+@pytest.mark.parametrize("params", PARAMS)
+def test_dp_matches_cp(params: dict) -> None:
+    cp_result = designer(params).solve(timeout=120)
+    dp_result = designer(params, engine="dp").solve(timeout=120)
+    assert cp_result.status == cp_model.OPTIMAL
+    assert dp_result.status == cp_model.OPTIMAL
+    assert dp_result.objective == cp_result.objective
+    assert dp_result.bound <= dp_result.objective
+    check(designer(params), dp_result.seq)
+
+
+@pytest.mark.parametrize("params", PARAMS)
+def test_catalog_matches_plain(params: dict) -> None:
+    plain = designer(params).solve(timeout=120)
+    cataloged = designer(params, catalog=True).solve(timeout=120)
+    assert plain.status == cp_model.OPTIMAL
+    assert cataloged.status == cp_model.OPTIMAL
+    assert cataloged.objective == plain.objective
+    check(designer(params), cataloged.seq)
+
+
+def test_dp_uses_cache(tmp_path) -> None:
+    cache = base.cache.ModelCache(tmp_path)
+    dp = designer(PARAMS[0], engine="dp")
+    first = dp.solve(cache=cache)
+    assert cache.path(cache.key(dp)).exists()
+    second = designer(PARAMS[0], engine="dp").solve(cache=cache)
+    assert second.status == cp_model.OPTIMAL
+    assert second.objective == first.objective
+    check(dp, second.seq)
+
+
+def test_slice_pattern_is_satisfied() -> None:
+    cp = designer(PARAMS[0])
+    catalog = cp.slice_catalog()
+    assert cp.slice_catalog() is catalog
+    seq = cp.solve(timeout=120).seq
+    assert constraints.SlicePatternConstraint(catalog).is_satisfied(seq)
+    cavities = [component for component in cp.components if component.type == "cavity"]
+    for y, z in INTERIOR:
+        if (y, z) != (2, 2):
+            seq[seq.index_tuple_to_int((1, y, z))] = cavities[0]
+            seq[seq.index_tuple_to_int((2, y, z))] = cavities[0]
+    assert not constraints.SlicePatternConstraint(catalog).is_satisfied(seq)
@@ -0,0 +1,79 @@
+"""Tests for the `reiuji.designer.qmd.nucleosynthesis` package."""
+
+import pytest
+from ortools.sat.python import cp_model
+
+from reiuji.components.defaults import QMD_NUCLEOSYNTHESIS_COMPONENTS
+from reiuji.components.types import NucleosynthesisHeater
+from reiuji.designer import base
+from reiuji.designer.qmd.nucleosynthesis import NucleosynthesisDesigner, table
+
+SYMMETRIES = [(True, True), (False, True)]
+MAX_HEAT = 100
+
+
+@pytest.fixture(scope="module")
+def nucleosynthesis_table() -> table.NucleosynthesisTable:
+    return table.NucleosynthesisTable.build(symmetries=SYMMETRIES, max_heat=MAX_HEAT)
+
+
+def designer(recipe_heat: int, symmetry: tuple[bool, bool], nucleosynthesis_table: table.NucleosynthesisTable | None = None) -> NucleosynthesisDesigner:
+    return NucleosynthesisDesigner(recipe_heat=recipe_heat, x_symmetry=symmetry[0], z_symmetry=symmetry[1], table=nucleosynthesis_table)
+
+
+def check(designer: NucleosynthesisDesigner, result: base.solver.DesignResult) -> None:
+    assert all(designer.component_index.index(component) in domain for component, domain in zip(result.seq, designer.cell_domains()))
+    assert base.constraints.PlacementRuleConstraint().is_satisfied(result.seq)
+    for alias in designer.aliases():
+        assert all(result.seq[a] == result.seq[b] for a, b in alias.pairs(designer.seq_shape))
+    cooling = sum(component.cooling for component in result.seq if isinstance(component, NucleosynthesisHeater))
+    assert cooling >= designer.recipe_heat
+    assert result.objective == pytest.approx(cooling - designer.recipe_heat)
+
+
+@pytest.mark.parametrize("symmetry", SYMMETRIES)
+def test_every_lookup_is_valid(nucleosynthesis_table: table.NucleosynthesisTable, symmetry: tuple[bool, bool]) -> None:
+    for recipe_heat in range(MAX_HEAT + 1):
+        lookup = designer(recipe_heat, symmetry, nucleosynthesis_table)
+        result = lookup.solve()
+        assert result.status == cp_model.OPTIMAL
+        check(lookup, result)
+
+
+@pytest.mark.parametrize("symmetry", SYMMETRIES)
+@pytest.mark.parametrize("recipe_heat", [0, 1, 37, 55, MAX_HEAT])
+def test_lookup_matches_cp(nucleosynthesis_table: table.NucleosynthesisTable, symmetry: tuple[bool, bool], recipe_heat: int) -> None:
+    cp_result = designer(recipe_heat, symmetry).solve(timeout=60)
+    lookup_result = designer(recipe_heat, symmetry, nucleosynthesis_table).solve()
+    assert cp_result.status == cp_model.OPTIMAL
+    assert lookup_result.objective == pytest.approx(cp_result.objective)
+
+
+def test_fallback(nucleosynthesis_table: table.NucleosynthesisTable) -> None:
+    column = nucleosynthesis_table.column(designer(0, SYMMETRIES[0]))
+    assert not column.complete
+    assert column.lookup(column.totals[-1] + 1) is None
+    fallback = designer(column.totals[-1] + 1, SYMMETRIES[0], nucleosynthesis_table)
+    result = fallback.solve(timeout=60)
+    assert result.status == cp_model.OPTIMAL
+    check(fallback, result)
+    assert nucleosynthesis_table.column(designer(0, (True, False))) is None
+    with pytest.raises(ValueError):
+        nucleosynthesis_table.column(NucleosynthesisDesigner(recipe_heat=0, components=QMD_NUCLEOSYNTHESIS_COMPONENTS[:-1]))
+
+
+def test_save_load(nucleosynthesis_table: table.NucleosynthesisTable, tmp_path) -> None:
+    path = tmp_path / "table.json"
+    nucleosynthesis_table.save(path)
+    assert table.NucleosynthesisTable.load(path) == nucleosynthesis_table
+
+
+def test_table_not_in_cache_key(nucleosynthesis_table: table.NucleosynthesisTable) -> None:
+    assert base.cache.ModelCache.key(designer(37, SYMMETRIES[0], nucleosynthesis_table)) == base.cache.ModelCache.key(designer(37, SYMMETRIES[0]))
+
+
+def test_build_timeout() -> None:
+    partial = table.NucleosynthesisTable.build(symmetries=SYMMETRIES, timeout=0.5)
+    assert not any(column.complete for column in partial.columns)
+    result = designer(37, SYMMETRIES[1], partial).solve(timeout=60)
+    assert result.status == cp_model.OPTIMAL
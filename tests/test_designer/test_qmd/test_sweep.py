@@ -0,0 +1,68 @@
+"""Tests for the `reiuji.designer.qmd.sweep` module."""
+
+import pytest
+from ortools.sat.python import cp_model
+
+from reiuji import core
+from reiuji.components.types import Air, DynamoBearing
+from reiuji.designer import base
+from reiuji.designer.qmd.sweep import Sweep
+
+
+class LineDesigner(base.designer.Designer):
+    """Places bearings on a line, each worth 3 units of energy, minimizing their number for a minimum energy."""
+
+    built: list[tuple[int, int]] = []
+
+    def __init__(self, length: int, minimum_energy: int) -> None:
+        super().__init__(components=[Air(), DynamoBearing()])
+        self.length = length
+        self.minimum_energy = minimum_energy
+
+    @property
+    def seq_shape(self) -> tuple[int, ...]:
+        return (self.length,)
+
+    def build_model(
+        self,
+        model: cp_model.CpModel,
+        seq: core.utils.multi_sequence.MultiSequence[cp_model.IntVar],
+    ) -> None:
+        type(self).built.append((self.length, self.minimum_energy))
+        model.Add(3 * sum(seq) >= self.minimum_energy)
+        model.Minimize(sum(seq))
+
+
+def test_grid() -> None:
+    sweep = Sweep(LineDesigner, {"minimum_energy": [9, 0, 6], "length": [3, 2]})
+    assert [(point["length"], point["minimum_energy"]) for point in sweep.grid()] == [
+        (2, 0),
+        (2, 6),
+        (2, 9),
+        (3, 0),
+        (3, 6),
+        (3, 9),
+    ]
+    with pytest.raises(ValueError):
+        Sweep(LineDesigner, {"target_focus": [0.0]})
+
+
+def test_run_prunes() -> None:
+    LineDesigner.built = []
+    results = Sweep(LineDesigner, {"length": [2, 3], "minimum_energy": [0, 6, 9, 12]}).run()
+    assert len(results) == 8
+    # At length 2, an energy of 9 is infeasible, so 12 is pruned without building a model.
+    assert (2, 12) not in LineDesigner.built
+    assert (3, 12) in LineDesigner.built
+    pruned = [(row.params["length"], row.params["minimum_energy"]) for row in results if row.pruned]
+    assert pruned == [(2, 12)]
+    for row in results:
+        length, energy = row.params["length"], row.params["minimum_energy"]
+        if 3 * length >= energy:
+            assert row.status == cp_model.OPTIMAL
+            assert row.objective == -(-energy // 3)
+            assert sum(isinstance(component, DynamoBearing) for component in row.seq) == row.objective
+        else:
+            assert row.status == cp_model.INFEASIBLE
+    assert len(results.where(length=3).feasible()) == 3
+    assert results.best().objective == 0